@@ -0,0 +1,89 @@
+"""
+Benchmark: Classifier.classify, baseline (one substring scan per keyword) vs the single-scan
+keyword matcher, on synthetic article texts with tier and exclusion keywords mixed in.
+Also times report-filter scoring (weighted score + exclusion check on title + summary):
+the baseline per-article loops vs one classify_batch call.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_classifier [--articles 2000] [--repeat 3]
+"""
+import argparse
+import random
+import time
+from benchmarks.legacy import legacy_classify, legacy_calculate_weighted_score, legacy_has_exclusion_keyword
+from benchmarks.synthetic import TitleGenerator, nepali_sentence
+from classifier.classifier import Classifier
+from classifier.keywords import (
+    tier1_election_keywords, tier2_political_keywords, tier3_context_keywords, exclude_keywords
+)
+from utils.article_filter import score_articles, exclusion_flags
+
+def classifier_texts(n=2000, seed=0):
+    """Title line plus body, English or Nepali, with keywords from every tier (and sometimes exclusions) inserted"""
+    gen = TitleGenerator(seed=seed)
+    rng = random.Random(seed)
+    keywords = tier1_election_keywords + tier2_political_keywords + tier3_context_keywords
+    texts = []
+    for _ in range(n):
+        nepali = rng.random() < 0.5
+        sentences = [nepali_sentence(rng) if nepali else gen.title() + "." for _ in range(rng.randint(10, 60))]
+        inserted = rng.sample(keywords, rng.randint(0, 6))
+        if rng.random() < 0.3:
+            inserted += rng.sample(exclude_keywords, rng.randint(1, 2))
+        for keyword in inserted:
+            keyword = keyword.upper() if rng.random() < 0.2 else keyword
+            i = rng.randrange(len(sentences))
+            sentences[i] = f"{sentences[i]} {keyword}"
+        title = sentences.pop(0)
+        texts.append(title + "\n" + " ".join(sentences))
+    return texts
+
+def report_articles(texts):
+    """Article dicts shaped like report rows: the text's first line as title, the next 600 chars as summary"""
+    articles = []
+    for text in texts:
+        title, _, body = text.partition("\n")
+        articles.append({"title_translated": title, "summary": body[:600]})
+    return articles
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = classifier_texts(args.articles)
+    print(f"Corpus: {len(texts)} texts, mean {sum(map(len, texts)) / len(texts):.0f} chars")
+
+    start = time.perf_counter()
+    classifier = Classifier()
+    print(f"Classifier init (matcher build): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    timings = {}
+    outputs = {}
+    for name, fn in [("baseline", lambda t: legacy_classify(classifier, t)), ("matcher", classifier.classify)]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            outputs[name] = [fn(t) for t in texts]
+        timings[name] = (time.perf_counter() - start) / (len(texts) * args.repeat) * 1e6
+        print(f"{name:9} {timings[name]:8.1f} us/article")
+    print(f"speedup   {timings['baseline'] / timings['matcher']:8.2f}x")
+
+    same = sum(1 for a, b in zip(outputs["baseline"], outputs["matcher"]) if a == b)
+    excluded = sum(1 for r in outputs["matcher"] if r["is_excluded"])
+    print(f"Identical results: {same}/{len(texts)} ({excluded} excluded)")
+
+    articles = report_articles(texts)
+    start = time.perf_counter()
+    old = [(legacy_calculate_weighted_score(a), legacy_has_exclusion_keyword(a)) for a in articles]
+    old_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    scores = score_articles(articles)
+    flags = exclusion_flags(scores, len(articles))
+    new_ms = (time.perf_counter() - start) * 1000
+    new = [(int(w), bool(f)) for w, f in zip(scores.weighted_scores, flags)]
+    print(f"Report filter scoring, {len(articles)} articles: baseline {old_ms:.1f} ms, "
+          f"classify_batch {new_ms:.1f} ms ({old_ms / new_ms:.2f}x), identical {sum(a == b for a, b in zip(old, new))}/{len(articles)}")
+
+if __name__ == "__main__":
+    main()
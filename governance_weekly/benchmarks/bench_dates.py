@@ -0,0 +1,90 @@
+"""
+Benchmark: published-date resolution, dateparser on every candidate (baseline) vs the tiered
+resolver (ISO / per-source formats / Bikram Sambat / dateparser last), over the corpus pages.
+
+  full     find_date_candidates of each page: meta, <time>, JSON-LD, then date-like classes
+  visible  pages without machine-readable dates: the date line each source prints (Bikram
+           Sambat on the Nepali sites), then the related-article stamps ("2 hours ago")
+
+Reported: time per page, the share of pages sent to dateparser, and how many pages got
+their actual publication day (from the page's ISO date).
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_dates [--per-source 20]
+"""
+import argparse
+import time
+from collections import Counter
+from benchmarks.corpus import load_corpus
+from benchmarks.legacy import legacy_resolve_date
+from extractor.article_extractor import find_date_candidates, parse_html
+from extractor.date_resolver import resolve_published_date
+from utils.nepali_calendar import ad_to_bs
+
+NEPALI_DIGITS = str.maketrans("0123456789", "०१२३४५६७८९")
+BS_NAMES = ("वैशाख", "जेठ", "असार", "साउन", "भदौ", "असोज", "कात्तिक", "मंसिर", "पुस", "माघ", "फागुन", "चैत")
+BS_ROMAN = ("Baisakh", "Jestha", "Ashadh", "Shrawan", "Bhadra", "Ashwin", "Kartik", "Mangsir", "Paush", "Magh", "Falgun", "Chaitra")
+NEPALI_WEEKDAYS = ("सोमबार", "मंगलबार", "बुधबार", "बिहीबार", "शुक्रबार", "शनिबार", "आइतबार")
+
+def _bs(published, layout):
+    year, month, day = ad_to_bs(published)
+    text = layout.format(y=year, m=BS_NAMES[month - 1], r=BS_ROMAN[month - 1], d=day,
+                         w=NEPALI_WEEKDAYS[published.weekday()], e=published.strftime("%A"), t=published.strftime("%H:%M"))
+    return text if "{r}" in layout else text.translate(NEPALI_DIGITS)
+
+# Visible date line per source
+SOURCE_SAMPLES = {
+    "ekantipur.com": lambda p: _bs(p, "{m} {d}, {y}"),
+    "kathmandupost.com": lambda p: p.strftime("%B %d, %Y"),
+    "myrepublica.nagariknetwork.com": lambda p: p.strftime("%B %d, %Y %I:%M %p"),
+    "setopati.com": lambda p: _bs(p, "{w}, {m} {d}, {y}"),
+    "nayapatrikadaily.com": lambda p: _bs(p, "{y} {m} {d} {w}"),
+    "annapurnapost.com": lambda p: _bs(p, "{m} {d}, {y}"),
+    "theannapurnaexpress.com": lambda p: p.strftime("%A, %B %d, %Y"),
+    "onlinekhabar.com": lambda p: _bs(p, "{y} {m} {d} गते {t}"),
+    "ratopati.com": lambda p: _bs(p, "{y} {r} {d} {e} {t}"),
+    "ukaalo.com": lambda p: _bs(p, "{m} {d}, {y}"),
+}
+
+def candidate_sets(per_source):
+    corpus, synthetic = load_corpus(per_source)
+    full, visible, days = [], [], []
+    for domain, html in corpus:
+        tree = parse_html(html)
+        url = f"https://{domain}/news/1"
+        candidates = find_date_candidates(tree)
+        published, _ = resolve_published_date(candidates, url)
+        full.append((url, candidates))
+        stamps = [e.text_content().strip() for e in tree.iter() if isinstance(e.tag, str) and e.get("class") == "post-date"]
+        visible.append((url, [SOURCE_SAMPLES[domain](published)] + stamps))
+        days.append(published.date())
+    return full, visible, days, synthetic
+
+def day(parsed):
+    return parsed.date() if parsed else None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--per-source", type=int, default=20)
+    args = parser.parse_args()
+
+    full, visible, days, synthetic = candidate_sets(args.per_source)
+    print(f"Corpus: {len(full)} pages ({'synthetic' if synthetic else 'saved'})")
+    for name, pages in (("full", full), ("visible", visible)):
+        start = time.perf_counter()
+        expected = [legacy_resolve_date(candidates) for _, candidates in pages]
+        baseline = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [resolve_published_date(candidates, url) for url, candidates in pages]
+        tiered = time.perf_counter() - start
+
+        tiers = Counter(tier for _, tier in results)
+        right_before = sum(day(a) == d for a, d in zip(expected, days))
+        right_after = sum(day(b) == d for (b, _), d in zip(results, days))
+        print(f"{name:8} baseline {baseline / len(pages) * 1000:7.2f} ms/page   tiered {tiered / len(pages) * 1000:6.3f} ms/page "
+              f"({baseline / tiered:6.1f}x)   dateparser on {tiers['dateparser'] / len(pages):.0%} of pages   "
+              f"right day {right_before} -> {right_after} of {len(pages)}   tiers {dict(tiers)}")
+
+if __name__ == "__main__":
+    main()
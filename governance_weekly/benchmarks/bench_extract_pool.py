@@ -0,0 +1,67 @@
+"""
+Benchmark: the extraction + classification stage in-process vs ExtractionPool worker
+processes, over the saved corpus (repeated to --pages pages).
+
+  inline     process_page in the calling thread, as the scrapers did before the pool
+  N workers  ExtractionPool(N): (url, html) pickled to a spawned worker, record back
+
+Pool start-up (spawning, importing, building the classifier) is paid once per run and is
+excluded: each pool is warmed up on a few pages first. Speedup is bounded by the cores the
+machine actually has (os.cpu_count() is printed); past that, workers only add pickling.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_extract_pool [--per-source 20] [--pages 400] [--workers 1 2 4]
+"""
+import argparse
+import os
+import pickle
+import time
+from benchmarks.corpus import load_corpus
+from extractor.process_pool import ExtractionPool, process_page
+
+def corpus_pages(per_source, n):
+    corpus, synthetic = load_corpus(per_source)
+    pages = [(f"https://{domain}/article/{i}", html) for i, (domain, html) in
+             enumerate(corpus[i % len(corpus)] for i in range(n))]
+    return pages, synthetic
+
+def run(workers, pages):
+    """Seconds to process `pages`, and the records by URL"""
+    if workers == 0:
+        start = time.perf_counter()
+        records = {url: process_page(url, html) for url, html in pages}
+        return time.perf_counter() - start, records
+    pool = ExtractionPool(workers)
+    try:
+        list(pool.process(pages[:2 * workers]))  # Warm-up: spawn and initialise every worker
+        start = time.perf_counter()
+        records = {url: record for url, _, record in pool.process(pages)}  # Completion order
+        return time.perf_counter() - start, records
+    finally:
+        pool.shutdown()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--per-source", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=None,
+                        help="pool sizes to time (default 1, 2, 4 ... up to the CPU count)")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    sizes = args.workers or [n for n in (1, 2, 4, 8, 16, 32) if n <= max(cores, 1)]
+    pages, synthetic = corpus_pages(args.per_source, args.pages)
+    print(f"Corpus: {len(pages)} pages ({'synthetic' if synthetic else 'saved'}), {cores} CPU(s)")
+
+    baseline, expected = run(0, pages)
+    sent = sum(len(pickle.dumps((process_page, url, html))) for url, html in pages) / len(pages)
+    returned = sum(len(pickle.dumps(r)) for r in expected.values()) / len(pages)
+    print(f"per page: {sent / 1024:.1f} KiB sent to a worker, {returned / 1024:.1f} KiB returned")
+    print(f"inline      {baseline:7.2f} s  {len(pages) / baseline:7.1f} pages/s")
+    for workers in sizes:
+        elapsed, records = run(workers, pages)
+        print(f"{workers:2} workers  {elapsed:7.2f} s  {len(pages) / elapsed:7.1f} pages/s  "
+              f"({baseline / elapsed:4.2f}x)  same records: {records == expected}")
+
+if __name__ == "__main__":
+    main()
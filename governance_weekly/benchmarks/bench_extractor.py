@@ -0,0 +1,53 @@
+"""
+Benchmark: per-page extract_article time, baseline (readability + two BeautifulSoup
+html.parser passes) vs the single lxml tree path, over the saved corpus.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_extractor [--per-source 20] [--repeat 3]
+"""
+import argparse
+import time
+from collections import defaultdict
+from benchmarks.corpus import load_corpus
+from benchmarks.legacy import legacy_extract_article
+from extractor.article_extractor import extract_article
+
+def time_per_page(fn, pages, repeat):
+    per_source = defaultdict(float)
+    outputs = []
+    for _ in range(repeat):
+        outputs = []
+        for domain, html in pages:
+            start = time.perf_counter()
+            outputs.append(fn(html, domain))
+            per_source[domain] += time.perf_counter() - start
+    counts = defaultdict(int)
+    for domain, _ in pages:
+        counts[domain] += repeat
+    return {d: per_source[d] / counts[d] * 1000 for d in per_source}, outputs
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--per-source", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages, synthetic = load_corpus(args.per_source)
+    print(f"Corpus: {len(pages)} pages ({'synthetic - run benchmarks.corpus --save for real pages' if synthetic else 'saved'})")
+
+    before, old_out = time_per_page(legacy_extract_article, pages, args.repeat)
+    after, new_out = time_per_page(extract_article, pages, args.repeat)
+
+    print(f"{'source':34} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for domain in sorted(before):
+        print(f"{domain:34} {before[domain]:10.2f} {after[domain]:10.2f} {before[domain] / after[domain]:7.2f}x")
+    total_before = sum(before.values()) / len(before)
+    total_after = sum(after.values()) / len(after)
+    print(f"{'mean':34} {total_before:10.2f} {total_after:10.2f} {total_before / total_after:7.2f}x")
+
+    same = lambda key: sum(1 for a, b in zip(old_out, new_out) if a and b and a[key] == b[key])
+    print(f"Identical output: title {same('title')}/{len(pages)}, published_at {same('published_at')}/{len(pages)}, "
+          f"full_text {same('full_text')}/{len(pages)}")
+
+if __name__ == "__main__":
+    main()
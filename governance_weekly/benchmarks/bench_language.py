@@ -0,0 +1,77 @@
+"""
+Benchmark: Nepali detection and the translation volume it saves.
+
+  detection  baseline has_nepali (char-by-char scan) vs contains_nepali (regex early exit,
+             then a per-paragraph script ratio counted on the UTF-8 bytes)
+  volume     a week's mix from Nepali-labelled sites: Nepali articles, English articles and
+             Nepali articles quoting English paragraphs; characters the baseline would send
+             for translation (every 'ne' article, whole) vs characters actually sent
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_language [--articles 300]
+"""
+import argparse
+import random
+import time
+from benchmarks.bench_translation import nepali_articles
+from benchmarks.legacy import legacy_has_nepali
+from translator.translator import Translator
+from utils.language import contains_nepali
+
+ENGLISH = ("The Election Commission said voter registration and polling station setup continues "
+           "across the country ahead of the vote.")
+
+def english_article(rng):
+    paragraphs = [" ".join([ENGLISH] * rng.randint(2, 6)) for _ in range(rng.randint(4, 10))]
+    return ENGLISH, "\n\n".join(paragraphs)
+
+def mixed_corpus(n, seed=0):
+    """(title, body): ~60% Nepali, ~25% English, ~15% Nepali with English paragraphs"""
+    rng = random.Random(seed)
+    corpus = []
+    for title, body in nepali_articles(n, seed):
+        kind = rng.random()
+        if kind < 0.25:
+            title, body = english_article(rng)
+        elif kind < 0.4:
+            paragraphs = body.split("\n\n")
+            for _ in range(rng.randint(1, 3)):
+                paragraphs.insert(rng.randint(0, len(paragraphs)), " ".join([ENGLISH] * 3))
+            body = "\n\n".join(paragraphs)
+        corpus.append((title, body))
+    return corpus
+
+def timed(fn, texts, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=300)
+    args = parser.parse_args()
+
+    corpus = mixed_corpus(args.articles)
+    texts = [text for article in corpus for text in article]
+    english = [body for _, body in corpus if not legacy_has_nepali(body)]
+    chars = sum(len(t) for t in texts)
+    print(f"{len(corpus)} articles ({len(english)} English), {chars / 1000:.0f}k chars")
+
+    for name, subset in (("all", texts), ("english", english)):
+        before = timed(legacy_has_nepali, subset)
+        after = timed(contains_nepali, subset)
+        print(f"detection {name:8} baseline {before * 1000:7.2f} ms  new {after * 1000:7.2f} ms  ({before / after:.1f}x)")
+
+    # Every article comes from a Nepali-labelled site, so the baseline translated all of it
+    baseline_chars = chars
+    segments = [Translator._segments(text, "ne", 4000) for text in texts]
+    sent = sum(len(chunk) for chunks in segments for chunk, _, translate in chunks if translate)
+    print(f"volume    baseline {baseline_chars / 1000:7.0f}k chars  new {sent / 1000:7.0f}k chars  "
+          f"({1 - sent / baseline_chars:.0%} not sent for translation)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: local MarianMT throughput on CPU (needs transformers + torch; downloads the model once).
+
+  baseline  the old marian path: one article body per generate() call, truncated to 512 tokens
+  engine    MarianEngine: sentence split, length-sorted padded batches, inference_mode
+
+Reports sentences/s and how many input tokens the baseline dropped to truncation.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_marian [--articles 5] [--threads 0] [--batch-size 16] [--quantize] [--onnx]
+"""
+import argparse
+import time
+from benchmarks.bench_translation import nepali_articles
+from translator.batching import sentence_chunks
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=0, help="torch threads (0 = torch default)")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--quantize", action="store_true", help="int8 dynamic quantization")
+    parser.add_argument("--onnx", action="store_true", help="ONNX Runtime export via optimum")
+    args = parser.parse_args()
+
+    try:
+        from translator.marian import MarianEngine
+        engine = MarianEngine(threads=args.threads, batch_size=args.batch_size,
+                              quantize=args.quantize, onnx=args.onnx)
+    except ImportError as e:
+        raise SystemExit(f"MarianMT benchmark needs transformers and torch: {e}")
+
+    bodies = [body for _, body in nepali_articles(args.articles)]
+    sentences = sum(len(sentence_chunks(body, engine.SENTENCE_CHARS, merge=False)) for body in bodies)
+    tokenizer, model = engine.tokenizer, engine.model
+    tokens = sum(len(ids) for ids in tokenizer(bodies)["input_ids"])
+    print(f"{len(bodies)} articles, {sentences} sentences, {tokens} tokens; "
+          f"{engine.runtime}, {engine.threads} threads, batch {engine.batch_size}")
+
+    start = time.perf_counter()
+    kept = 0
+    for body in bodies:
+        inputs = tokenizer([body], return_tensors="pt", padding=True, truncation=True, max_length=512)
+        kept += inputs["input_ids"].shape[1]
+        model.generate(**inputs)
+    elapsed = time.perf_counter() - start
+    print(f"baseline {elapsed:7.2f} s  {sentences / elapsed:6.1f} sentences/s  "
+          f"({tokens - kept} of {tokens} input tokens truncated)")
+
+    start = time.perf_counter()
+    engine.translate(bodies)
+    elapsed = time.perf_counter() - start
+    print(f"engine   {elapsed:7.2f} s  {sentences / elapsed:6.1f} sentences/s  "
+          f"({engine.batches} batches, nothing truncated)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: database size and report-query time with raw HTML inline vs in the raw_html table.
+
+  inline    raw_html stored in the articles row, report reads SELECT * (the old layout)
+  side      HTML compressed in the content-addressed raw_html table, slim report query
+
+Both databases hold the same synthetic articles (a unique article page each) and use the
+tuned connection and indexes, so only the HTML layout differs. fetched_at spans a year.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_raw_html [--articles 20000]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from benchmarks.bench_storage import LEGACY_COLUMNS, LEGACY_INSERT_SQL, create_schema, synthetic_rows
+from benchmarks.synthetic import SOURCES, TitleGenerator, article_page
+from database import html_store
+from database.db import DB
+
+REPORT_STATUS = "AND COALESCE(status, '') NOT IN ('pending_translation', 'translation_failed', 'excluded')"
+QUERIES = {
+    "inline": {
+        "weekly report": f"SELECT * FROM articles WHERE fetched_at >= ? {REPORT_STATUS}",
+        "title scan": "SELECT COUNT(*) FROM articles WHERE TRIM(COALESCE(title_original, '')) != ''",
+    },
+    "side": {
+        "weekly report": "SELECT url, title_translated, title_original, summary, source_domain, published_at, "
+                         f"categories, relevance_score FROM articles WHERE fetched_at >= ? {REPORT_STATUS}",
+        "title scan": "SELECT COUNT(*) FROM articles WHERE TRIM(COALESCE(title_original, '')) != ''",
+    },
+}
+
+def article_dicts(n, seed=0):
+    """synthetic_rows with a distinct, realistic article page per row"""
+    gen = TitleGenerator(seed=seed)
+    now = datetime.now(timezone.utc)
+    for i, article in enumerate(synthetic_rows(n, html_kb=1, seed=seed)):
+        domain, language = SOURCES[i % len(SOURCES)]
+        article["raw_html"] = article_page(gen, domain, language, now - timedelta(days=365 * (n - i) / n))
+        yield article
+
+def load(path, n, side):
+    conn = create_schema(path, tuned=True)
+    db = DB()
+    db.conn, db.cursor = conn, conn.cursor()
+    html_bytes = 0
+    batch = []
+    for article in article_dicts(n):
+        html_bytes += len(article["raw_html"].encode("utf-8"))
+        batch.append(article)
+        if len(batch) == 200:
+            insert(db, batch, side)
+            batch = []
+    insert(db, batch, side)
+    conn.commit()
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return conn, html_bytes
+
+def insert(db, batch, side):
+    if side:
+        db.insert_articles(batch)
+        return
+    db.cursor.executemany(LEGACY_INSERT_SQL, [tuple(article.get(c) for c in LEGACY_COLUMNS) for article in batch])
+
+def time_query(conn, sql, params, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=20000)
+    args = parser.parse_args()
+
+    week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for layout in ("inline", "side"):
+            path = os.path.join(tmp, f"{layout}.db")
+            conn, html_bytes = load(path, args.articles, side=layout == "side")
+            times = {name: time_query(conn, sql, (week_ago,) if "?" in sql else ())
+                     for name, sql in QUERIES[layout].items()}
+            results[layout] = (os.path.getsize(path), times)
+            conn.close()
+
+        print(f"{args.articles} articles, {html_bytes / 1e6:.0f} MB raw HTML ({html_store.CODEC} in the side table)")
+        (inline_size, inline_times), (side_size, side_times) = results["inline"], results["side"]
+        print(f"db size        inline {inline_size / 1e6:8.1f} MB  side {side_size / 1e6:8.1f} MB  "
+              f"({inline_size / side_size:.1f}x smaller)")
+        for name in inline_times:
+            print(f"{name:14} inline {inline_times[name] * 1000:8.2f} ms  side {side_times[name] * 1000:8.2f} ms  "
+                  f"({inline_times[name] / side_times[name]:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: report dedup, pairwise is_duplicate scan vs the DuplicateIndex in select_top_articles.
+
+  baseline  the original loop: legacy_is_duplicate against every kept article, both texts
+            regex-normalized inside each of up to three calculate_similarity calls per pair
+  index     select_top_articles on stored fingerprints: MinHash LSH candidates only, exact
+            SequenceMatcher checks with the quick upper bounds first
+
+A synthetic week of stories, each covered by 1-4 outlets with small headline/summary edits,
+is deduplicated with no report size cap (--max-articles 0) so every candidate is checked, the
+worst case. Both must keep the same articles; the run fails loudly if they do not.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_report_dedup [--articles 1000 3000] [--max-articles 40]
+"""
+import argparse
+import time
+from benchmarks.legacy import legacy_is_duplicate
+from benchmarks.synthetic import TitleGenerator
+from utils.article_filter import fingerprints, normalize_text, select_top_articles
+from utils.dedup import DuplicateIndex
+
+def synthetic_week(n, seed=0):
+    """Candidates in descending impact order, with duplicate coverage of the same story"""
+    gen = TitleGenerator(seed=seed)
+    rng = gen.rng
+    articles = []
+    while len(articles) < n:
+        title, summary = gen.title(), gen.paragraph(rng.randint(2, 4))
+        for _ in range(min(rng.choice((1, 1, 2, 3, 4)), n - len(articles))):
+            articles.append({"title_translated": title, "summary": summary})
+            title, summary = gen.perturb(title), gen.perturb(summary, edits=rng.randint(1, 12))
+    rng.shuffle(articles)
+    for i, article in enumerate(articles):
+        article.update(url=f"https://example.com/{i}", impact_score=float(n - i))
+    return articles
+
+def baseline_select(articles, max_articles):
+    unique_articles = []
+    for article in articles:
+        if not legacy_is_duplicate(article, unique_articles):
+            unique_articles.append(article)
+            if len(unique_articles) >= max_articles:
+                break
+    return unique_articles
+
+def index_select(stored, max_articles):
+    """select_top_articles' loop, returning the DuplicateIndex for its check count"""
+    index = DuplicateIndex()
+    selected = []
+    for article in stored:
+        if index.add_if_new(*fingerprints(article)):
+            selected.append(article)
+            if len(selected) >= max_articles:
+                break
+    return selected, index
+
+def with_fingerprints(articles):
+    """As stored by report_features"""
+    return [dict(a, title_fingerprint=normalize_text(a["title_translated"]),
+                 summary_fingerprint=normalize_text(a["summary"])) for a in articles]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, nargs="+", default=[1000, 3000])
+    parser.add_argument("--max-articles", type=int, default=0, help="report size cap, 0 for none")
+    args = parser.parse_args()
+
+    for n in args.articles:
+        articles = synthetic_week(n, seed=n)
+        cap = args.max_articles or n
+
+        start = time.perf_counter()
+        expected = baseline_select(articles, cap)
+        baseline = time.perf_counter() - start
+
+        stored = with_fingerprints(articles)
+        start = time.perf_counter()
+        selected, index = index_select(stored, cap)
+        indexed = time.perf_counter() - start
+        assert selected == select_top_articles(stored, max_articles=cap, min_impact_score=0)
+
+        same = [a["url"] for a in selected] == [a["url"] for a in expected]
+        print(f"{n:6} candidates -> {len(selected):5} kept   baseline {baseline:8.2f} s   index {indexed:6.2f} s "
+              f"({baseline / indexed:5.1f}x)   exact checks {index.checks}   same result: {same}")
+        if not same:
+            raise SystemExit("DuplicateIndex kept different articles than the pairwise scan")
+
+if __name__ == "__main__":
+    main()
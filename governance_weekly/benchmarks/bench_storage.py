@@ -0,0 +1,157 @@
+"""
+Benchmark: articles database inserts and report queries on synthetic articles.
+
+  baseline  default connection (rollback journal, synchronous=FULL), no secondary indexes,
+            raw_html inline, one INSERT + commit per article as collect() used to do
+  tuned     database.db.connect() pragmas (WAL, synchronous=NORMAL, cache, mmap), the
+            migrations.INDEXES, and DB.insert_articles batches of DB_INSERT_BATCH rows per commit
+
+Baseline inserts are timed on a sample (--baseline-sample) and the rest bulk loaded, so both
+databases hold the same rows for the query timings. fetched_at spans a year, so the weekly
+report window selects ~2% of the rows.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_storage [--articles 100000] [--baseline-sample 5000] [--html-kb 8]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from benchmarks.synthetic import SOURCES, TitleGenerator, article_page
+from config import Config
+from database.db import ARTICLE_COLUMNS, DB, connect
+from database.migrations import INDEXES
+
+LEGACY_COLUMNS = tuple(c for c in ARTICLE_COLUMNS if c != "content_hash") + ("raw_html",)
+LEGACY_INSERT_SQL = f"INSERT INTO articles ({', '.join(LEGACY_COLUMNS)}) VALUES ({', '.join('?' * len(LEGACY_COLUMNS))})"
+
+def synthetic_rows(n, html_kb, seed=0):
+    """
+    Article dicts as collect() stores them, oldest first, fetched over the last 365 days.
+    Titles and texts come from a small pre-generated pool so generation stays out of the timings.
+    """
+    gen = TitleGenerator(seed=seed)
+    rng = gen.rng
+    now = datetime.now(timezone.utc)
+    page = article_page(gen, "example.com", "en", now)
+    html = (page * (html_kb * 1024 // len(page) + 1))[:html_kb * 1024]
+    titles = gen.titles(500)
+    texts = ["\n\n".join(gen.paragraph(rng.randint(3, 6)) for _ in range(4)) for _ in range(500)]
+    categories = [json.dumps(pair) for pair in (["Election Commission", "Political Parties"], ["Judiciary", "Security"])]
+    for i in range(n):
+        domain, language = SOURCES[i % len(SOURCES)]
+        fetched = now - timedelta(days=365 * (n - i) / n)
+        text = texts[i % len(texts)]
+        pending = language == "ne" and i % 20 == 0
+        yield {
+            "url": f"https://{domain}/news/{i}", "source_domain": domain,
+            "title_original": titles[i % len(titles)], "full_text_original": text,
+            "published_at": (fetched - timedelta(hours=i % 48)).isoformat(), "fetched_at": fetched.isoformat(),
+            "language": language,
+            "title_translated": None if pending else titles[(i * 7) % len(titles)],
+            "full_text_translated": None if pending else text, "summary": None if pending else text[:400],
+            "categories": None if pending else categories[i % 2],
+            "relevance_score": None if pending else float(i % 30),
+            "raw_html": html, "status": "pending_translation" if pending else "pending_review",
+        }
+
+def create_schema(path, tuned):
+    """Tuned: DB.init_db() as the pipeline does. Baseline: the same table, default connection, no indexes."""
+    with_config = Config.DB_PATH
+    Config.DB_PATH = path
+    try:
+        db = DB()
+        db.init_db()
+        db.close()
+    finally:
+        Config.DB_PATH = with_config
+    if tuned:
+        return connect(path)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=DELETE")
+    for name in INDEXES:
+        conn.execute(f"DROP INDEX {name}")
+    conn.commit()
+    return conn
+
+def time_queries(conn, repeat=5):
+    week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
+    hashes = [f"{i:064x}" for i in range(100)]
+    queries = {
+        "weekly report": lambda: conn.execute(
+            "SELECT * FROM articles WHERE fetched_at >= ? "
+            "AND COALESCE(status, '') NOT IN ('pending_translation', 'translation_failed', 'excluded')",
+            (week_ago,)).fetchall(),
+        "pending count": lambda: conn.execute(
+            "SELECT COUNT(*) FROM articles WHERE status = 'pending_translation'").fetchone(),
+        "queue claim scan": lambda: conn.execute(
+            "SELECT url FROM articles WHERE status = 'pending_translation' "
+            "AND (lease_expires IS NULL OR lease_expires <= ?) ORDER BY fetched_at LIMIT 4",
+            (time.time(),)).fetchall(),
+        "known urls": lambda: conn.execute("SELECT url FROM articles").fetchall(),
+        "100 hash lookups": lambda: [conn.execute(
+            "SELECT 1 FROM articles WHERE content_hash = ?", (h,)).fetchone() for h in hashes],
+    }
+    results = {}
+    for name, query in queries.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            query()
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100000)
+    parser.add_argument("--baseline-sample", type=int, default=5000, help="baseline rows inserted one commit each")
+    parser.add_argument("--html-kb", type=int, default=8, help="raw_html size per article")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{args.articles} articles, {args.html_kb} KB raw_html each")
+
+        baseline = create_schema(os.path.join(tmp, "baseline.db"), tuned=False)
+        rows = synthetic_rows(args.articles, args.html_kb)
+        sample = min(args.baseline_sample, args.articles)
+        start = time.perf_counter()
+        for _, row in zip(range(sample), rows):
+            baseline.execute(LEGACY_INSERT_SQL, tuple(row.get(c) for c in LEGACY_COLUMNS))
+            baseline.commit()
+        elapsed = time.perf_counter() - start
+        print(f"insert baseline {sample / elapsed:9.0f} rows/s  ({elapsed:.1f} s for {sample}, "
+              f"~{elapsed * args.articles / sample:.0f} s projected for {args.articles})")
+        # Rest untimed, for the query comparison
+        baseline.executemany(LEGACY_INSERT_SQL, (tuple(row.get(c) for c in LEGACY_COLUMNS) for row in rows))
+        baseline.commit()
+
+        tuned = create_schema(os.path.join(tmp, "tuned.db"), tuned=True)
+        db = DB()
+        db.conn, db.cursor = tuned, tuned.cursor()
+        rows = synthetic_rows(args.articles, args.html_kb)
+        start = time.perf_counter()
+        while True:
+            chunk = [row for _, row in zip(range(Config.DB_INSERT_BATCH), rows)]
+            if not chunk:
+                break
+            db.insert_articles(chunk)
+            tuned.commit()
+        elapsed = time.perf_counter() - start
+        print(f"insert tuned    {args.articles / elapsed:9.0f} rows/s  ({elapsed:.1f} s for {args.articles}, "
+              f"batches of {Config.DB_INSERT_BATCH}, indexes maintained, HTML compressed)")
+
+        before, after = time_queries(baseline), time_queries(tuned)
+        for name in before:
+            print(f"{name:18} baseline {before[name] * 1000:8.2f} ms  tuned {after[name] * 1000:8.2f} ms  "
+                  f"({before[name] / after[name]:.1f}x)")
+        plan = tuned.execute("EXPLAIN QUERY PLAN SELECT * FROM articles WHERE fetched_at >= ?", ("",)).fetchall()
+        print("report plan:", "; ".join(row[-1] for row in plan))
+        baseline.close()
+        tuned.close()
+
+if __name__ == "__main__":
+    main()
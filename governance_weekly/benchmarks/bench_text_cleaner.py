@@ -0,0 +1,106 @@
+"""
+Benchmark: junk-pattern cleanup throughput, baseline (~25 re.sub calls per article) vs the
+precompiled per-source cleaner in extractor.text_cleaner.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_text_cleaner [--per-source 200] [--repeat 5]
+  python -m benchmarks.bench_text_cleaner --write-fixture   # regenerate tests/fixtures/text_cleaner_corpus.json
+"""
+import argparse
+import json
+import os
+import random
+import time
+from benchmarks.legacy import legacy_clean_text
+from benchmarks.synthetic import TitleGenerator, SOURCES, nepali_sentence
+from extractor.text_cleaner import clean_text
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "tests", "fixtures", "text_cleaner_corpus.json")
+
+# Boilerplate seen in extracted text from every site
+SHARED_BOILERPLATE = [
+    "Read Time : < 1 minute", "Read Time : > 3 minutes 2o82 Paush 3 Thursday o6:36:oo",
+    "2082 Falgun 8 Friday 06:36:00", "2026 February 20 Friday 10:30",
+    "Share on Facebook Share on Twitter", "Share via Email", "Print this page", "Advertisement",
+    "Related Articles:", "Related Article", "Tags: election, politics", "Published on: Feb 3", "Updated on: Feb 4",
+    "[Photo Gallery]", "Sign In", "Facebook Messenger Twitter Whatsapp Viber Copy Link",
+    "Your browser does not support the audio element.", "Pvt. Ltd Kathmandu 3 February 2026 at 10:00",
+    "Kedar Sivakoti 8 February 2026 at 10:00", "Falgun 8, 2082 Kedar Sivakoti",
+    "Republica Online", "Kantipur Media", "Setopati Staff",
+]
+
+# Boilerplate only registered for one site
+SOURCE_BOILERPLATE = {
+    "ekantipur.com": ["News Sign In", "Read In English", "What you should know"],
+    "onlinekhabar.com": ["News Summary Generated by OK AI. Editorially reviewed.", "12 Comments", "3 Comments Shares"],
+}
+
+SEPARATORS = [" ", "\n", "\n\n", "  ", ". "]
+
+def article_texts(per_source=200, seed=0):
+    """(url, text) pairs: synthetic article text with the source's boilerplate mixed in"""
+    gen = TitleGenerator(seed=seed)
+    rng = random.Random(seed)
+    texts = []
+    for domain, language in SOURCES:
+        boilerplate = SHARED_BOILERPLATE + SOURCE_BOILERPLATE.get(domain, [])
+        for i in range(per_source):
+            parts = []
+            for _ in range(rng.randint(4, 16)):
+                if rng.random() < 0.4:
+                    parts.append(rng.choice(boilerplate))
+                else:
+                    sentences = rng.randint(1, 4)
+                    parts.append(" ".join(nepali_sentence(rng) for _ in range(sentences)) if language == "ne"
+                                 else gen.paragraph(sentences))
+                parts.append(rng.choice(SEPARATORS))
+            texts.append((f"https://{domain}/news/2026/02/{i}", "".join(parts)))
+    return texts
+
+def write_fixture(per_source):
+    cases = []
+    for url, text in article_texts(per_source, seed=1):
+        expected = legacy_clean_text(text)
+        if clean_text(text, url) != expected:
+            raise SystemExit(f"Cleaner output differs from the baseline for {url}")
+        cases.append({"url": url, "text": text, "expected": expected})
+    os.makedirs(os.path.dirname(FIXTURE_PATH), exist_ok=True)
+    with open(FIXTURE_PATH, "w", encoding="utf-8") as f:
+        json.dump(cases, f, ensure_ascii=False, indent=1)
+    print(f"Wrote {len(cases)} cases to {FIXTURE_PATH}")
+
+def throughput(fn, texts, repeat):
+    total_bytes = sum(len(text.encode("utf-8")) for _, text in texts) * repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for url, text in texts:
+            fn(text, url)
+    elapsed = time.perf_counter() - start
+    return total_bytes / elapsed / 1024 / 1024, elapsed / (len(texts) * repeat) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--per-source", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--write-fixture", action="store_true")
+    args = parser.parse_args()
+
+    if args.write_fixture:
+        write_fixture(per_source=10)
+        return
+
+    texts = article_texts(args.per_source)
+    mb = sum(len(text.encode("utf-8")) for _, text in texts) / 1024 / 1024
+    print(f"Corpus: {len(texts)} texts, {mb:.1f} MB")
+
+    legacy_mbs, legacy_us = throughput(lambda text, url: legacy_clean_text(text), texts, args.repeat)
+    new_mbs, new_us = throughput(clean_text, texts, args.repeat)
+    print(f"baseline  {legacy_mbs:7.1f} MB/s  {legacy_us:8.1f} us/text")
+    print(f"cleaner   {new_mbs:7.1f} MB/s  {new_us:8.1f} us/text  ({new_mbs / legacy_mbs:.2f}x)")
+
+    same = sum(1 for url, text in texts if clean_text(text, url) == legacy_clean_text(text))
+    print(f"Identical output: {same}/{len(texts)}")
+
+if __name__ == "__main__":
+    main()
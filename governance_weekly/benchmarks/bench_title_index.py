@@ -0,0 +1,85 @@
+"""
+Benchmark: near-duplicate title lookup, LSH index vs the old full SequenceMatcher scan.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_title_index                 # 10k, 100k, 1M stored titles
+  python -m benchmarks.bench_title_index --sizes 10000   # quick run
+"""
+import argparse
+import os
+import tempfile
+import time
+from difflib import SequenceMatcher
+from benchmarks.synthetic import TitleGenerator
+from utils.title_index import TitleIndex, TITLE_SIMILARITY_THRESHOLD
+
+SCAN_SLICE = 10000  # the full scan is timed on this many titles and scaled linearly
+
+def scan_has_similar(title, stored):
+    """The original collect() check: SequenceMatcher against every stored title"""
+    query = title.lower()
+    for existing in stored:
+        if SequenceMatcher(None, query, existing.lower()).ratio() >= TITLE_SIMILARITY_THRESHOLD:
+            return True
+    return False
+
+def planted_duplicates(gen, stored, n):
+    """Edited copies of stored titles that the old check would flag (ratio >= threshold)"""
+    planted = []
+    while len(planted) < n:
+        source = gen.rng.choice(stored)
+        query = gen.perturb(source)
+        if SequenceMatcher(None, query.lower(), source.lower()).ratio() >= TITLE_SIMILARITY_THRESHOLD:
+            planted.append(query)
+    return planted
+
+def run(size, queries, scan_queries):
+    gen = TitleGenerator(seed=size)
+    stored = gen.titles(size)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "title_index.db")
+        index = TitleIndex(path=path)
+        start = time.perf_counter()
+        index.add_many(stored)
+        index.commit()
+        build = time.perf_counter() - start
+        index_mb = os.path.getsize(path) / 1024 / 1024
+
+        planted = planted_duplicates(gen, stored, queries // 2)
+        fresh = gen.titles(queries - len(planted))
+
+        planted_set = set(planted)
+        start = time.perf_counter()
+        candidate_total = 0
+        found = 0
+        for q in planted + fresh:
+            candidate_total += len(index.candidates(q))
+            if index.find_similar(q) is not None and q in planted_set:
+                found += 1
+        lsh_ms = (time.perf_counter() - start) / queries * 1000
+        index.close()
+
+    # Old behaviour: every query scans every stored title
+    scan_slice = stored[:SCAN_SLICE]
+    start = time.perf_counter()
+    for q in fresh[:scan_queries]:
+        scan_has_similar(q, scan_slice)
+    scan_ms = (time.perf_counter() - start) / scan_queries * 1000 * size / len(scan_slice)
+
+    print(f"{size:>9,} titles | build {build:6.1f}s, {index_mb:6.1f} MB | "
+          f"LSH {lsh_ms:6.2f} ms/query ({candidate_total / queries:6.1f} candidates) | "
+          f"full scan {scan_ms:9.1f} ms/query{' (extrapolated)' if size > SCAN_SLICE else ''} | "
+          f"speedup {scan_ms / lsh_ms:6.0f}x | recall {found / len(planted):.3f} on {len(planted)} planted duplicates")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--queries", type=int, default=400)
+    parser.add_argument("--scan-queries", type=int, default=10, help="queries timed with the full scan")
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.queries, args.scan_queries)
+
+if __name__ == "__main__":
+    main()
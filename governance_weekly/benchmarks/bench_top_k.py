@@ -0,0 +1,60 @@
+"""
+Benchmark: filter_top_articles on a large week, baseline vs one scoring pass + lazy heap top-K.
+
+  baseline  keyword tiers scanned twice per article (validation, then impact score), every
+            validated article fully sorted, pairwise dedup of the sorted list
+  top-k     report_features once per article (one classify_batch pass), a heap of the
+            validated articles popped in impact order only until max_articles are kept
+  cached    top-k again on the same dicts: their stored features are reused
+
+Articles are classifier_texts shaped as report rows (title + 600-char summary) with report
+categories, some of them re-covered by other outlets with small headline edits.
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_top_k [--articles 20000] [--max-articles 40]
+"""
+import argparse
+import copy
+import random
+import time
+from benchmarks.bench_classifier import classifier_texts, report_articles
+from benchmarks.legacy import legacy_filter_top_articles
+from benchmarks.synthetic import TitleGenerator
+from utils.article_filter import filter_top_articles
+
+CATEGORIES = (["Election"], ["Governance"], ["Election", "Governance"], ["Governance", "Judiciary"], ["Economy"])
+
+def large_week(n, seed=0):
+    rng = random.Random(seed)
+    gen = TitleGenerator(seed=seed)
+    articles = report_articles(classifier_texts(n, seed=seed))
+    for i, article in enumerate(articles):
+        if i and rng.random() < 0.2:  # Another outlet's take on an earlier story
+            source = articles[rng.randrange(i)]
+            article.update(title_translated=gen.perturb(source["title_translated"]), summary=source["summary"])
+        article.update(url=f"https://example.com/{i}", categories=rng.choice(CATEGORIES),
+                       relevance_score=rng.randint(0, 30))
+    return articles
+
+def timed(fn, articles, max_articles):
+    start = time.perf_counter()
+    top = fn(articles, max_articles=max_articles, min_impact_score=10.0)
+    return time.perf_counter() - start, [a["url"] for a in top]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=20000)
+    parser.add_argument("--max-articles", type=int, default=40)
+    args = parser.parse_args()
+
+    articles = large_week(args.articles)
+    print(f"{len(articles)} articles, top {args.max_articles}")
+    baseline, expected = timed(legacy_filter_top_articles, copy.deepcopy(articles), args.max_articles)
+    print(f"baseline {baseline * 1000:9.1f} ms")
+    fresh = copy.deepcopy(articles)
+    for name in ("top-k", "cached"):
+        elapsed, urls = timed(filter_top_articles, fresh, args.max_articles)
+        print(f"{name:8} {elapsed * 1000:9.1f} ms  ({baseline / elapsed:5.1f}x)  same articles: {urls == expected}")
+
+if __name__ == "__main__":
+    main()
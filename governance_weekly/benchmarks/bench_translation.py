@@ -0,0 +1,74 @@
+"""
+Benchmark: translation throughput with the offline fake backend (simulated round-trip latency).
+
+  baseline     the old collect() flow: title, then fixed 4000-char slices, one request each,
+               sequential, 0.5 s sleep after every call
+  per article  Translator.translate_many([title, body]) per article
+  all at once  one translate_many call over every article (what a translation queue can batch)
+
+Usage (from governance_weekly/):
+  python -m benchmarks.bench_translation [--articles 20] [--latency 0.05] [--sleep 0.5]
+"""
+import argparse
+import random
+import time
+from unittest.mock import patch
+from benchmarks.synthetic import nepali_sentence
+from config import Config
+from translator.fake import FakeBackend
+from translator.translator import Translator
+
+def nepali_articles(n, seed=0):
+    """(title, body) pairs: body is 4-12 paragraphs of Nepali sentences (~2-12k chars)"""
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(n):
+        title = nepali_sentence(rng, rng.randint(6, 12))
+        paragraphs = [" ".join(nepali_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(3, 8)))
+                      for _ in range(rng.randint(4, 12))]
+        articles.append((title, "\n\n".join(paragraphs)))
+    return articles
+
+def run_baseline(articles, fake, sleep):
+    for title, body in articles:
+        fake.translate_batch([title])
+        time.sleep(sleep)
+        for i in range(0, len(body), 4000):
+            fake.translate_batch([body[i:i + 4000]])
+            time.sleep(sleep)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="fake backend seconds per request")
+    parser.add_argument("--sleep", type=float, default=0.5, help="baseline sleep after each call")
+    args = parser.parse_args()
+
+    articles = nepali_articles(args.articles)
+    chars = sum(len(t) + len(b) for t, b in articles)
+    print(f"{len(articles)} articles, {chars / 1000:.0f}k chars; fake latency {args.latency * 1000:.0f} ms/request")
+
+    def report(name, elapsed, fake):
+        print(f"{name:12} {elapsed:7.2f} s  {len(articles) / elapsed:7.2f} articles/s  {chars / elapsed / 1000:7.1f}k chars/s  "
+              f"{fake.requests:4} requests")
+
+    fake = FakeBackend(latency=args.latency)
+    start = time.perf_counter()
+    run_baseline(articles, fake, args.sleep)
+    report("baseline", time.perf_counter() - start, fake)
+
+    with patch.object(Config, "TRANSLATION_BACKEND", "fake"):
+        for name in ("per article", "all at once"):
+            translator = Translator(cache_path=None)
+            translator.fake = fake = FakeBackend(latency=args.latency)
+            start = time.perf_counter()
+            if name == "per article":
+                for title, body in articles:
+                    translator.translate_many([title, body])
+            else:
+                flat = [text for article in articles for text in article]
+                translator.translate_many(flat)
+            report(name, time.perf_counter() - start, fake)
+
+if __name__ == "__main__":
+    main()
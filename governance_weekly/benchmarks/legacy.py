@@ -0,0 +1,471 @@
+"""
+Baseline implementations kept verbatim for before/after benchmarks and regression checks.
+Not used by the pipeline.
+"""
+try:
+    from readability import Document
+except ImportError:
+    Document = None
+from bs4 import BeautifulSoup
+import dateparser
+import logging
+import re
+from difflib import SequenceMatcher
+from classifier.keywords import tier1_election_keywords, tier2_political_keywords, tier3_context_keywords
+
+TIER1_WEIGHT, TIER2_WEIGHT, TIER3_WEIGHT = 5, 3, 1
+
+logger = logging.getLogger(__name__)
+
+def legacy_extract_article(html, url):
+    """extract_article as of the baseline: three full parses (readability, then two BeautifulSoup html.parser)"""
+    if not html:
+        return None
+        
+    try:
+        if Document:
+            doc = Document(html)
+            title = doc.short_title()
+            content_html = doc.summary()
+        else:
+            # Fallback for missing readability
+            soup = BeautifulSoup(html, "html.parser")
+            title = soup.title.string if soup.title else "No Title"
+            # Try to find <article> or just body
+            article_body = soup.find('article') or soup.body
+            content_html = str(article_body) if article_body else html
+        
+        # Clean up tags using BeautifulSoup
+        soup = BeautifulSoup(content_html, "html.parser")
+        text_content = soup.get_text(separator="\n").strip()
+        
+        # Remove junk patterns (read time, date stamps, social media prompts, etc.)
+        import re
+        junk_patterns = [
+            r'Read Time\s*:.*?\d+\s*(?:minute|min|second|sec)',  # Read Time : < 1 minute
+            r'Read Time\s*:.*?2o?\d{2}\s+\w+\s+\d+\s+\w+\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Read Time : > 3 minutes 2o82 Paush 3 Thursday o6:36:oo
+            r'2o?\d{2}\s+(?:Paush|Magh|Falgun|Chaitra|Baisakh|Jestha|Ashadh|Shrawan|Bhadra|Ashwin|Kartik|Mangsir)\s+\d+\s+(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Nepali calendar dates
+            r'\d{4}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}:\d{2}',  # Date stamps
+            r'News Summary Generated by OK AI\.?\s*Editorially reviewed\.?',  # OnlineKhabar AI summary notice
+            r'Share on Facebook.*?Share on Twitter',  # Social media
+            r'Share via Email',
+            r'Print this page',
+            r'Advertisement',
+            r'Related Articles?:?',
+            r'Tags?:.*',
+            r'Published on:.*',
+            r'Updated on:.*',
+            r'\[.*?\]',  # [Photo Gallery] etc
+            # Site-specific boilerplate
+            r'News\s*Sign\s*In',                                         # Ekantipur login overlay
+            r'(?:^|\n)\s*Sign\s*In\s*(?:\n|$)',                          # Standalone "Sign In" line
+            r'Read\s*In\s*English',                                       # Ekantipur language toggle
+            r'Facebook\s+Messenger\s+Twitter\s+Whatsapp\s+Viber\s+Copy\s+Link',  # Share bar
+            r'What you should know',                                      # Ekantipur section header
+            r'Your browser does not support the audio element\.?',        # HTML5 audio fallback
+            r'\d+\s*Comments?\s*(?:Shares?)?',                           # OnlineKhabar comment count
+            r'Pvt\.\s+\w+[\w\s]+\d{1,2}\s+\w+\s+\d{4}\s+at\s+\d{1,2}:\d{2}',  # Author byline
+            r'[A-Z][a-z]+\s+[A-Z][a-z]+\s+\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s+at\s+\d{1,2}:\d{2}',  # "Name Surname DD Month YYYY at HH:MM"
+            r'Falgun\s+\d+,?\s+\d{4}\s+[A-Z][a-z]+\s+[A-Z][a-z]+',   # "Falgun 8, 2082 Kedar Sivakoti"
+            r'(?:Republica|Kantipur|OnlineKhabar|Setopati|Ratopati)\s+(?:Online|Media|Staff)',  # Source tags
+        ]
+        
+        for pattern in junk_patterns:
+            text_content = re.sub(pattern, '', text_content, flags=re.IGNORECASE)
+        
+        # Remove excessive whitespace
+        text_content = re.sub(r'\n\s*\n+', '\n\n', text_content)
+        text_content = text_content.strip()
+        
+        # Metadata extraction (heuristic)
+        # Often readability doesn't get the date well, so we might need custom parsing per site
+        # or use generic meta tag scraping
+        
+        soup_full = BeautifulSoup(html, "html.parser")
+        
+        # Attempt to find published time from multiple sources
+        published_at = None
+        
+        # Try multiple date extraction methods
+        date_candidates = []
+        
+        # 1. Meta tags
+        for meta_tag in soup_full.find_all("meta"):
+            for attr in ['property', 'name', 'itemprop']:
+                if meta_tag.get(attr) in ['article:published_time', 'publishedDate', 'datePublished', 'date', 'publication_date']:
+                    content = meta_tag.get("content")
+                    if content:
+                        date_candidates.append(content)
+        
+        # 2. Time tags
+        for time_tag in soup_full.find_all("time"):
+            datetime_attr = time_tag.get("datetime") or time_tag.get_text()
+            if datetime_attr:
+                date_candidates.append(datetime_attr)
+        
+        # 3. JSON-LD structured data
+        for script in soup_full.find_all("script", type="application/ld+json"):
+            try:
+                import json
+                data = json.loads(script.string)
+                if isinstance(data, dict):
+                    if 'datePublished' in data:
+                        date_candidates.append(data['datePublished'])
+                    elif 'dateCreated' in data:
+                        date_candidates.append(data['dateCreated'])
+            except:
+                pass
+        
+        # 4. Common date class patterns
+        for date_elem in soup_full.find_all(class_=re.compile(r'date|time|publish', re.I)):
+            date_text = date_elem.get_text().strip()
+            if date_text:
+                date_candidates.append(date_text)
+        
+        # Parse first valid date
+        for candidate in date_candidates:
+            try:
+                parsed = dateparser.parse(str(candidate), settings={'PREFER_DATES_FROM': 'past'})
+                if parsed:
+                    published_at = parsed
+                    break
+            except:
+                continue
+        
+        return {
+            "title": title,
+            "full_text": text_content,
+            "published_at": published_at,
+            "raw_html": html
+        }
+        
+    except Exception as e:
+        logger.error(f"Extraction failed for {url}: {e}")
+        return None
+
+def legacy_resolve_date(date_candidates):
+    """extract_article's date loop as of the baseline: dateparser on each candidate in order"""
+    for candidate in date_candidates:
+        try:
+            parsed = dateparser.parse(str(candidate), settings={'PREFER_DATES_FROM': 'past'})
+            if parsed:
+                return parsed
+        except:
+            continue
+    return None
+
+def legacy_clean_text(text_content):
+    """The junk-pattern cleanup from the baseline extract_article: ~25 re.sub calls, list rebuilt per call"""
+    import re
+    junk_patterns = [
+        r'Read Time\s*:.*?\d+\s*(?:minute|min|second|sec)',  # Read Time : < 1 minute
+        r'Read Time\s*:.*?2o?\d{2}\s+\w+\s+\d+\s+\w+\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Read Time : > 3 minutes 2o82 Paush 3 Thursday o6:36:oo
+        r'2o?\d{2}\s+(?:Paush|Magh|Falgun|Chaitra|Baisakh|Jestha|Ashadh|Shrawan|Bhadra|Ashwin|Kartik|Mangsir)\s+\d+\s+(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Nepali calendar dates
+        r'\d{4}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}:\d{2}',  # Date stamps
+        r'News Summary Generated by OK AI\.?\s*Editorially reviewed\.?',  # OnlineKhabar AI summary notice
+        r'Share on Facebook.*?Share on Twitter',  # Social media
+        r'Share via Email',
+        r'Print this page',
+        r'Advertisement',
+        r'Related Articles?:?',
+        r'Tags?:.*',
+        r'Published on:.*',
+        r'Updated on:.*',
+        r'\[.*?\]',  # [Photo Gallery] etc
+        # Site-specific boilerplate
+        r'News\s*Sign\s*In',                                         # Ekantipur login overlay
+        r'(?:^|\n)\s*Sign\s*In\s*(?:\n|$)',                          # Standalone "Sign In" line
+        r'Read\s*In\s*English',                                       # Ekantipur language toggle
+        r'Facebook\s+Messenger\s+Twitter\s+Whatsapp\s+Viber\s+Copy\s+Link',  # Share bar
+        r'What you should know',                                      # Ekantipur section header
+        r'Your browser does not support the audio element\.?',        # HTML5 audio fallback
+        r'\d+\s*Comments?\s*(?:Shares?)?',                           # OnlineKhabar comment count
+        r'Pvt\.\s+\w+[\w\s]+\d{1,2}\s+\w+\s+\d{4}\s+at\s+\d{1,2}:\d{2}',  # Author byline
+        r'[A-Z][a-z]+\s+[A-Z][a-z]+\s+\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s+at\s+\d{1,2}:\d{2}',  # "Name Surname DD Month YYYY at HH:MM"
+        r'Falgun\s+\d+,?\s+\d{4}\s+[A-Z][a-z]+\s+[A-Z][a-z]+',   # "Falgun 8, 2082 Kedar Sivakoti"
+        r'(?:Republica|Kantipur|OnlineKhabar|Setopati|Ratopati)\s+(?:Online|Media|Staff)',  # Source tags
+    ]
+
+    for pattern in junk_patterns:
+        text_content = re.sub(pattern, '', text_content, flags=re.IGNORECASE)
+
+    # Remove excessive whitespace
+    text_content = re.sub(r'\n\s*\n+', '\n\n', text_content)
+    text_content = text_content.strip()
+    return text_content
+
+def legacy_classify(classifier, text):
+    """Classifier.classify as of the baseline: one substring scan per keyword; `classifier` supplies the tiers and weights"""
+    text_lower = text.lower()
+
+    # Extract title for stricter exclusion check
+    title_line = text_lower.split('\n')[0] if text_lower else ""
+
+    # ===========================================
+    # STEP 1: Check exclusion keywords FIRST
+    # ===========================================
+    for k in classifier.exclude_keywords:
+        k_lower = k.lower()
+        # If exclusion keyword is in title, definitely exclude
+        if k_lower in title_line:
+            return {
+                "categories": [],
+                "relevance_score": 0,
+                "weighted_score": 0,
+                "is_excluded": True,
+                "exclusion_reason": f"Title contains excluded term: {k}"
+            }
+
+        # Check body for strong exclusion indicators
+        strong_excludes = [
+            "nepse", "stock market", "share market", "beauty pageant",
+            "mrs world", "miss world", "tourist", "tourism", "pilgrimage",
+            "trump", "biden", "venezuela", "poem", "poetry", "poet",
+            "hacking", "cyber attack", "cricket", "football"
+        ]
+        if k_lower in strong_excludes and k_lower in text_lower:
+            return {
+                "categories": [],
+                "relevance_score": 0,
+                "weighted_score": 0,
+                "is_excluded": True,
+                "exclusion_reason": f"Body contains excluded term: {k}"
+            }
+
+    # ===========================================
+    # STEP 2: Calculate WEIGHTED SCORE
+    # ===========================================
+    tier1_matches = []
+    tier2_matches = []
+    tier3_matches = []
+
+    # Count Tier 1 matches (5 points each)
+    for k in classifier.tier1_keywords:
+        if k.lower() in text_lower:
+            tier1_matches.append(k)
+
+    # Count Tier 2 matches (3 points each)
+    for k in classifier.tier2_keywords:
+        if k.lower() in text_lower:
+            tier2_matches.append(k)
+
+    # Count Tier 3 matches (1 point each)
+    for k in classifier.tier3_keywords:
+        if k.lower() in text_lower:
+            tier3_matches.append(k)
+
+    # Calculate weighted score
+    weighted_score = (
+        len(tier1_matches) * classifier.TIER1_WEIGHT +
+        len(tier2_matches) * classifier.TIER2_WEIGHT +
+        len(tier3_matches) * classifier.TIER3_WEIGHT
+    )
+
+    # ===========================================
+    # STEP 3: Check if passes threshold
+    # ===========================================
+    if weighted_score < classifier.PASS_THRESHOLD:
+        return {
+            "categories": [],
+            "relevance_score": 0,
+            "weighted_score": weighted_score,
+            "is_excluded": True,
+            "exclusion_reason": f"Score {weighted_score} below threshold {classifier.PASS_THRESHOLD}",
+            "tier1_matches": len(tier1_matches),
+            "tier2_matches": len(tier2_matches),
+            "tier3_matches": len(tier3_matches)
+        }
+
+    # ===========================================
+    # STEP 4: Build categories and final score
+    # ===========================================
+    found_categories = ["Election"]  # Always Election if passes
+
+    # Add Governance if has tier1 election commission keywords
+    if any("election commission" in k.lower() or "निर्वाचन आयोग" in k for k in tier1_matches):
+        found_categories.append("Governance")
+
+    # Relevance score for sorting (backward compat)
+    relevance_score = weighted_score
+
+    return {
+        "categories": found_categories,
+        "relevance_score": relevance_score,
+        "weighted_score": weighted_score,
+        "is_excluded": False,
+        "tier1_matches": len(tier1_matches),
+        "tier2_matches": len(tier2_matches),
+        "tier3_matches": len(tier3_matches),
+        "matched_keywords": {
+            "tier1": tier1_matches[:5],  # Top 5 for logging
+            "tier2": tier2_matches[:5],
+            "tier3": tier3_matches[:3]
+        }
+    }
+
+def legacy_calculate_weighted_score(article):
+    """utils.article_filter.calculate_weighted_score as of the baseline: one scan per tier keyword"""
+    title = (article.get('title_translated') or article.get('title_original', '')).lower()
+    summary = (article.get('summary', '')).lower()
+    combined = f"{title} {summary}"
+    
+    tier1_count = sum(1 for k in tier1_election_keywords if k.lower() in combined)
+    tier2_count = sum(1 for k in tier2_political_keywords if k.lower() in combined)
+    tier3_count = sum(1 for k in tier3_context_keywords if k.lower() in combined)
+    
+    weighted_score = (
+        tier1_count * TIER1_WEIGHT +
+        tier2_count * TIER2_WEIGHT +
+        tier3_count * TIER3_WEIGHT
+    )
+    
+    return weighted_score
+
+def legacy_has_exclusion_keyword(article):
+    """utils.article_filter.has_exclusion_keyword as of the baseline"""
+    title = (article.get('title_translated') or article.get('title_original', '')).lower()
+    summary = (article.get('summary', '')).lower()
+    combined = f"{title} {summary}"
+    
+    strong_excludes = [
+        "nepse", "stock market", "share market", "trading volume",
+        "beauty pageant", "mrs world", "miss world", "mrs nepal",
+        "tourist", "tourism", "pilgrimage", "pilgrim", "lumbini",
+        "trump", "biden", "venezuela", "foreign policy",
+        "poem", "poetry", "poet", "literature", "book launch",
+        "cricket", "football", "sports", "entertainment",
+        "hacking", "cyber attack", "data theft",
+        "weather", "cold wave", "temperature"
+    ]
+    
+    for keyword in strong_excludes:
+        if keyword in combined:
+            return True
+    return False
+
+def legacy_has_nepali(text):
+    """main.has_nepali as of the baseline: character-by-character scan"""
+    if not text:
+        return False
+    return any('ऀ' <= char <= 'ॿ' for char in text)
+
+def legacy_normalize_text(text):
+    """utils.article_filter.normalize_text as of the baseline"""
+    if not text:
+        return ""
+    text = re.sub(r'[^\w\s]', ' ', text.lower())
+    text = ' '.join(text.split())
+    return text
+
+def legacy_calculate_similarity(text1, text2):
+    """utils.article_filter.calculate_similarity as of the baseline"""
+    norm1 = legacy_normalize_text(text1)
+    norm2 = legacy_normalize_text(text2)
+    
+    if not norm1 or not norm2:
+        return 0.0
+    
+    return SequenceMatcher(None, norm1, norm2).ratio()
+
+def legacy_is_duplicate(article, seen_articles, title_threshold=0.90, summary_threshold=0.80):
+    """utils.article_filter.is_duplicate as of the baseline: every pair, texts normalized per call"""
+    current_title = article.get('title_translated') or article.get('title_original', '')
+    current_summary = article.get('summary', '')
+    
+    for seen in seen_articles:
+        seen_title = seen.get('title_translated') or seen.get('title_original', '')
+        seen_summary = seen.get('summary', '')
+        
+        title_sim = legacy_calculate_similarity(current_title, seen_title)
+        
+        if title_sim >= title_threshold:
+            return True
+        
+        if title_sim >= 0.6:
+            summary_sim = legacy_calculate_similarity(current_summary, seen_summary)
+            if summary_sim >= summary_threshold:
+                return True
+        
+        if title_sim >= 0.7:
+            current_combined = f"{current_title} {current_summary}"
+            seen_combined = f"{seen_title} {seen_summary}"
+            combined_sim = legacy_calculate_similarity(current_combined, seen_combined)
+            if combined_sim >= 0.85:
+                return True
+    
+    return False
+
+def legacy_calculate_impact_score(article):
+    """utils.article_filter.calculate_impact_score as of the baseline: rescans the keyword tiers"""
+    score = 0.0
+    
+    # Base: weighted score from keyword tiers
+    weighted = legacy_calculate_weighted_score(article)
+    score += weighted
+    
+    # Add classifier's relevance score
+    score += article.get('relevance_score', 0)
+    
+    # Category bonuses
+    categories = article.get('categories', [])
+    if "Election" in categories:
+        score += 10
+    if "Governance" in categories:
+        score += 5
+    
+    # Content depth bonus
+    summary_length = len(article.get('summary', ''))
+    if summary_length > 300:
+        score += 5
+    elif summary_length > 150:
+        score += 3
+    
+    return score
+
+def legacy_filter_top_articles(articles, max_articles=40, min_impact_score=10.0):
+    """utils.article_filter.filter_top_articles as of the baseline: full sort, pairwise dedup"""
+    # STEP 1: Filter to only Election/Governance articles
+    election_articles = []
+    for article in articles:
+        categories = article.get('categories', [])
+        if "Election" in categories or "Governance" in categories:
+            election_articles.append(article)
+    
+    # STEP 2: Validate with weighted scoring
+    validated_articles = []
+    for article in election_articles:
+        # Must NOT have exclusion keywords
+        if legacy_has_exclusion_keyword(article):
+            continue
+        
+        # Calculate weighted score
+        weighted = legacy_calculate_weighted_score(article)
+        
+        # Must pass threshold (5 points)
+        if weighted >= 5:
+            article['weighted_score'] = weighted
+            validated_articles.append(article)
+    
+    # STEP 3: Calculate impact scores
+    for article in validated_articles:
+        article['impact_score'] = legacy_calculate_impact_score(article)
+    
+    # STEP 4: Sort by impact score
+    articles_sorted = sorted(validated_articles, key=lambda x: x['impact_score'], reverse=True)
+    
+    # STEP 5: Deduplicate
+    unique_articles = []
+    seen_articles = []
+    
+    for article in articles_sorted:
+        if article['impact_score'] < min_impact_score:
+            continue
+        
+        if not legacy_is_duplicate(article, seen_articles):
+            unique_articles.append(article)
+            seen_articles.append(article)
+            
+            if len(unique_articles) >= max_articles:
+                break
+    
+    return unique_articles
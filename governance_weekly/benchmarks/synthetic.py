@@ -0,0 +1,105 @@
+"""
+Synthetic news-like data for offline benchmarks.
+Words follow a Zipf-like distribution so common terms ("election", "nepal") repeat across titles like real headlines.
+"""
+import random
+import string
+from itertools import accumulate
+
+COMMON_WORDS = [
+    "election", "commission", "nepal", "vote", "party", "congress", "uml", "maoist",
+    "minister", "government", "candidate", "polling", "ballot", "kathmandu", "parliament",
+    "court", "supreme", "budget", "police", "protest", "leader", "prime", "federal",
+    "province", "march", "date", "announces", "says", "meeting", "rally", "district",
+    "chief", "officer", "code", "conduct", "voter", "list", "registration",
+]
+
+def make_vocabulary(size=5000, seed=0):
+    rng = random.Random(seed)
+    syllables = ["ka", "ma", "ra", "ta", "na", "sa", "pa", "la", "ja", "ha", "pra", "dev", "shi", "ku", "bi", "ro"]
+    vocab = list(COMMON_WORDS)
+    while len(vocab) < size:
+        vocab.append("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return vocab
+
+class TitleGenerator:
+    def __init__(self, vocab_size=5000, seed=0):
+        self.rng = random.Random(seed)
+        self.vocab = make_vocabulary(vocab_size, seed)
+        self.cum_weights = list(accumulate(1.0 / (rank + 1) for rank in range(len(self.vocab))))
+
+    def title(self):
+        n = self.rng.randint(6, 12)
+        return " ".join(self.rng.choices(self.vocab, cum_weights=self.cum_weights, k=n)).capitalize()
+
+    def titles(self, n):
+        return [self.title() for _ in range(n)]
+
+    def perturb(self, title, edits=None):
+        """Small character/word edits, the kind two outlets make to the same wire headline"""
+        chars = list(title)
+        for _ in range(edits or self.rng.randint(1, 4)):
+            i = self.rng.randrange(len(chars))
+            op = self.rng.random()
+            if op < 0.4:
+                chars[i] = self.rng.choice(string.ascii_lowercase)
+            elif op < 0.7:
+                chars.insert(i, self.rng.choice(string.ascii_lowercase))
+            elif len(chars) > 1:
+                del chars[i]
+        return "".join(chars)
+
+    def paragraph(self, sentences=5):
+        return ". ".join(self.title() for _ in range(sentences)) + "."
+
+NEPALI_WORDS = [
+    "निर्वाचन", "आयोग", "मतदाता", "नामावली", "उम्मेदवार", "दल", "सरकार", "प्रधानमन्त्री",
+    "संसद", "अदालत", "प्रहरी", "जिल्ला", "प्रदेश", "मतदान", "केन्द्र", "बैठक", "नेता", "कांग्रेस",
+]
+
+SOURCES = [
+    ("ekantipur.com", "ne"), ("kathmandupost.com", "en"), ("myrepublica.nagariknetwork.com", "en"),
+    ("setopati.com", "ne"), ("nayapatrikadaily.com", "ne"), ("annapurnapost.com", "ne"),
+    ("theannapurnaexpress.com", "en"), ("onlinekhabar.com", "ne"), ("ratopati.com", "ne"), ("ukaalo.com", "ne"),
+]
+
+def nepali_sentence(rng, n=12):
+    return " ".join(rng.choice(NEPALI_WORDS) for _ in range(n)) + "।"
+
+def article_page(gen, domain, language, published):
+    """
+    A news-site-shaped article page: navigation, scripts, meta/JSON-LD dates, share bars,
+    the article body with site boilerplate mixed in, related links and a footer.
+    """
+    rng = gen.rng
+    title = gen.title()
+    sentence = (lambda: nepali_sentence(rng)) if language == "ne" else (lambda: gen.title() + ".")
+    nav = "".join(f'<li><a href="/{w}/2026/01/{i}">{w.title()}</a></li>' for i, w in enumerate(rng.sample(gen.vocab[:300], 60)))
+    paragraphs = "".join(f"<p>{' '.join(sentence() for _ in range(rng.randint(3, 6)))}</p>" for _ in range(rng.randint(8, 20)))
+    related = "".join(f'<div class="related-item"><a href="/news/2026/{i}">{gen.title()}</a><span class="post-date">2 hours ago</span></div>' for i in range(12))
+    iso = published.strftime("%Y-%m-%dT%H:%M:%S+05:45")
+    return f"""<!DOCTYPE html>
+<html lang="{language}"><head>
+<meta charset="utf-8"><title>{title} | {domain}</title>
+<meta property="og:title" content="{title}">
+<meta property="article:published_time" content="{iso}">
+<meta name="description" content="{gen.title()}">
+<link rel="stylesheet" href="/static/site.css">
+<style>.hidden{{display:none}} body{{font-family:sans-serif}}</style>
+<script>window.dataLayer=window.dataLayer||[];function gtag(){{dataLayer.push(arguments);}}gtag('js',new Date());</script>
+<script type="application/ld+json">{{"@context":"https://schema.org","@type":"NewsArticle","headline":"{title}","datePublished":"{iso}"}}</script>
+</head><body>
+<header><div class="top-bar"><span class="today-date">{published.strftime('%A, %B %d, %Y')}</span><a href="/login">News Sign In</a></div>
+<nav><ul>{nav}</ul></nav></header>
+<div class="ad-slot">Advertisement</div>
+<main><article class="article-detail">
+<h1>{title}</h1>
+<div class="author-info"><span class="author">Staff Reporter</span><time datetime="{iso}">{published.strftime('%B %d, %Y')}</time></div>
+<div class="share-bar">Share on Facebook Share on Twitter Share via Email</div>
+<div class="read-time">Read Time : 3 minutes</div>
+<div class="article-body">{paragraphs}<p>[Photo Gallery]</p><p>Tags: election, politics</p></div>
+<div class="comments">12 Comments</div>
+</article>
+<aside class="related"><h3>Related Articles</h3>{related}</aside></main>
+<footer><p>Copyright {published.year} {domain}</p><script src="/static/app.js"></script></footer>
+</body></html>"""
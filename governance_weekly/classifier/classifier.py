@@ -1,9 +1,33 @@
+import numpy as np
 from .keywords import (
     tier1_election_keywords, tier2_political_keywords, tier3_context_keywords,
-    election_keywords, governance_keywords, exclude_keywords
+    election_keywords, governance_keywords, exclude_keywords, strong_exclude_keywords,
+    report_exclude_keywords
 )
+from .matcher import KeywordMatcher
 from config import Config
 
+class BatchResult:
+    """
+    Compact classification of a list of texts; row i belongs to texts[i].
+      tier_counts      (n, 3) int32  keyword hits per tier (tier1, tier2, tier3)
+      weighted_scores  (n,) int32    tier hits weighted 5/3/1 (before any exclusion)
+      is_excluded      (n,) bool     same verdict as classify(): exclusion keyword or below threshold
+      keyword_ids      list of sorted int32 arrays, ids into Classifier.matcher.keywords
+    """
+    def __init__(self, tier_counts, weighted_scores, is_excluded, keyword_ids):
+        self.tier_counts = tier_counts
+        self.weighted_scores = weighted_scores
+        self.is_excluded = is_excluded
+        self.keyword_ids = keyword_ids
+
+    def __len__(self):
+        return len(self.keyword_ids)
+
+    def contains_any(self, mask):
+        """(n,) bool: texts that matched at least one keyword id set in `mask` (see Classifier.keyword_mask)"""
+        return np.array([bool(mask[ids].any()) for ids in self.keyword_ids], dtype=bool)
+
 class Classifier:
     """
     WEIGHTED SCORING Classifier for Nepal March 5, 2026 Election
@@ -29,69 +53,86 @@ class Classifier:
         
         # Threshold to pass (5 = one direct term OR two political terms)
         self.PASS_THRESHOLD = 5
+        
+        # One matcher over every tier and exclusion keyword (including the report filter's);
+        # each list keeps its own order as (keyword, matcher id) so matches are reported
+        # in keyword-list order
+        self.matcher = KeywordMatcher(
+            self.tier1_keywords + self.tier2_keywords + self.tier3_keywords +
+            self.exclude_keywords + report_exclude_keywords
+        )
+        ids = self.matcher.ids
+        self._tier1 = [(k, ids[k.lower()]) for k in self.tier1_keywords]
+        self._tier2 = [(k, ids[k.lower()]) for k in self.tier2_keywords]
+        self._tier3 = [(k, ids[k.lower()]) for k in self.tier3_keywords]
+        strong = set(strong_exclude_keywords)
+        self._excludes = [(k, ids[k.lower()], k.lower() in strong) for k in self.exclude_keywords]
+        
+        # Per keyword id, how many entries of each tier it accounts for (for batch scoring)
+        self.tier_membership = np.zeros((len(self.matcher.keywords), 3), dtype=np.int32)
+        for column, tier in enumerate((self._tier1, self._tier2, self._tier3)):
+            for _, kid in tier:
+                self.tier_membership[kid, column] += 1
+        self.tier_weights = np.array([self.TIER1_WEIGHT, self.TIER2_WEIGHT, self.TIER3_WEIGHT], dtype=np.int32)
+    
+    def keyword_mask(self, keywords):
+        """Boolean array over matcher keyword ids, True for `keywords`"""
+        mask = np.zeros(len(self.matcher.keywords), dtype=bool)
+        for k in keywords:
+            mask[self.matcher.ids[k.lower()]] = True
+        return mask
+    
+    def _match(self, text):
+        """Lowercase once and scan once: returns (hits, title_end) for the exclusion and tier checks"""
+        text_lower = text.lower()
+        # Title is the first line; a keyword is in it if its first occurrence ends there
+        title_end = text_lower.find('\n')
+        if title_end == -1:
+            title_end = len(text_lower)
+        # Every keyword present -> end offset of its first occurrence
+        return self.matcher.find(text_lower), title_end
+    
+    def _exclusion(self, hits, title_end):
+        """First exclusion keyword (in list order) found in the title, or a strong one anywhere: (keyword, "Title"|"Body")"""
+        for k, kid, strong in self._excludes:
+            end = hits.get(kid)
+            if end is None:
+                continue
+            # If exclusion keyword is in title, definitely exclude
+            if end <= title_end:
+                return k, "Title"
+            # Check body for strong exclusion indicators
+            if strong:
+                return k, "Body"
+        return None
     
     def classify(self, text):
         """
         WEIGHTED SCORING classification
         Returns a dictionary with categories, relevance score, and exclusion status.
         """
-        text_lower = text.lower()
-        
-        # Extract title for stricter exclusion check
-        title_line = text_lower.split('\n')[0] if text_lower else ""
+        hits, title_end = self._match(text)
         
         # ===========================================
         # STEP 1: Check exclusion keywords FIRST
         # ===========================================
-        for k in self.exclude_keywords:
-            k_lower = k.lower()
-            # If exclusion keyword is in title, definitely exclude
-            if k_lower in title_line:
-                return {
-                    "categories": [],
-                    "relevance_score": 0,
-                    "weighted_score": 0,
-                    "is_excluded": True,
-                    "exclusion_reason": f"Title contains excluded term: {k}"
-                }
-            
-            # Check body for strong exclusion indicators
-            strong_excludes = [
-                "nepse", "stock market", "share market", "beauty pageant",
-                "mrs world", "miss world", "tourist", "tourism", "pilgrimage",
-                "trump", "biden", "venezuela", "poem", "poetry", "poet",
-                "hacking", "cyber attack", "cricket", "football"
-            ]
-            if k_lower in strong_excludes and k_lower in text_lower:
-                return {
-                    "categories": [],
-                    "relevance_score": 0,
-                    "weighted_score": 0,
-                    "is_excluded": True,
-                    "exclusion_reason": f"Body contains excluded term: {k}"
-                }
+        exclusion = self._exclusion(hits, title_end)
+        if exclusion:
+            k, where = exclusion
+            return {
+                "categories": [],
+                "relevance_score": 0,
+                "weighted_score": 0,
+                "is_excluded": True,
+                "exclusion_reason": f"{where} contains excluded term: {k}"
+            }
         
         # ===========================================
         # STEP 2: Calculate WEIGHTED SCORE
         # ===========================================
-        tier1_matches = []
-        tier2_matches = []
-        tier3_matches = []
-        
-        # Count Tier 1 matches (5 points each)
-        for k in self.tier1_keywords:
-            if k.lower() in text_lower:
-                tier1_matches.append(k)
-        
-        # Count Tier 2 matches (3 points each)
-        for k in self.tier2_keywords:
-            if k.lower() in text_lower:
-                tier2_matches.append(k)
-        
-        # Count Tier 3 matches (1 point each)
-        for k in self.tier3_keywords:
-            if k.lower() in text_lower:
-                tier3_matches.append(k)
+        tier1_matches = [k for k, kid in self._tier1 if kid in hits]  # 5 points each
+        tier2_matches = [k for k, kid in self._tier2 if kid in hits]  # 3 points each
+        tier3_matches = [k for k, kid in self._tier3 if kid in hits]  # 1 point each
         
         # Calculate weighted score
         weighted_score = (
@@ -141,3 +182,33 @@ class Classifier:
                 "tier3": tier3_matches[:3]
             }
         }
+    
+    def classify_batch(self, texts):
+        """
+        Score many texts with one matcher scan each and return a BatchResult
+        (tier hit counts, weighted scores, exclusion verdicts and matched keyword ids)
+        instead of a dict per article.
+        """
+        keyword_ids = []
+        is_excluded = np.zeros(len(texts), dtype=bool)
+        for i, text in enumerate(texts):
+            hits, title_end = self._match(text)
+            keyword_ids.append(np.fromiter(sorted(hits), dtype=np.int32, count=len(hits)))
+            is_excluded[i] = self._exclusion(hits, title_end) is not None
+        
+        tier_counts = np.zeros((len(texts), 3), dtype=np.int32)
+        if keyword_ids:
+            rows = np.repeat(np.arange(len(texts)), [len(ids) for ids in keyword_ids])
+            np.add.at(tier_counts, rows, self.tier_membership[np.concatenate(keyword_ids)])
+        weighted_scores = tier_counts @ self.tier_weights
+        is_excluded |= weighted_scores < self.PASS_THRESHOLD
+        return BatchResult(tier_counts, weighted_scores, is_excluded, keyword_ids)
+
+_classifier = None
+
+def get_classifier():
+    """Shared Classifier, so collection and report filtering compile the keyword matcher once"""
+    global _classifier
+    if _classifier is None:
+        _classifier = Classifier()
+    return _classifier
@@ -202,6 +202,26 @@ core_election_keywords = tier1_election_keywords  # For backward compat
 election_context_keywords = tier2_political_keywords
 election_corruption_keywords = [k for k in tier1_election_keywords if "fraud" in k or "rigging" in k or "corruption" in k or "irregularity" in k]
 
+# Exclusion keywords that also exclude an article when they only appear in the body
+strong_exclude_keywords = [
+    "nepse", "stock market", "share market", "beauty pageant",
+    "mrs world", "miss world", "tourist", "tourism", "pilgrimage",
+    "trump", "biden", "venezuela", "poem", "poetry", "poet",
+    "hacking", "cyber attack", "cricket", "football"
+]
+
+# Exclusion keywords the report filter checks in title + summary (utils.article_filter)
+report_exclude_keywords = [
+    "nepse", "stock market", "share market", "trading volume",
+    "beauty pageant", "mrs world", "miss world", "mrs nepal",
+    "tourist", "tourism", "pilgrimage", "pilgrim", "lumbini",
+    "trump", "biden", "venezuela", "foreign policy",
+    "poem", "poetry", "poet", "literature", "book launch",
+    "cricket", "football", "sports", "entertainment",
+    "hacking", "cyber attack", "data theft",
+    "weather", "cold wave", "temperature"
+]
+
 # Governance - minimal, only election-related
 governance_keywords = [
     "election commission", "निर्वाचन आयोग",
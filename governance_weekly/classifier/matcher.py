@@ -0,0 +1,61 @@
+"""
+Single-pass keyword matching for the classifier.
+
+Every keyword is folded into one trie-shaped regex, so the text is scanned once instead of
+once per keyword. Matching keeps the substring semantics of `keyword.lower() in text.lower()`:
+overlapping and nested keywords ("voter list" / "voter list update" / "list") are all found.
+"""
+import re
+
+def _trie_pattern(words):
+    """Regex alternation shaped like a trie over `words`; at a given position it matches the longest word"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def emit(node):
+        children = sorted((ch, child) for ch, child in node.items() if ch)
+        if not children:
+            return ""
+        alternatives = [re.escape(ch) + emit(child) for ch, child in children]
+        if len(alternatives) == 1:
+            body = alternatives[0]
+            return f"(?:{body})?" if "" in node else body
+        body = "(?:" + "|".join(alternatives) + ")"
+        return body + "?" if "" in node else body
+
+    return emit(trie)
+
+class KeywordMatcher:
+    def __init__(self, keywords):
+        # Keywords are matched lowercased; duplicates share one id
+        self.keywords = list(dict.fromkeys(k.lower() for k in keywords))
+        self.ids = {k: i for i, k in enumerate(self.keywords)}
+        self.pattern = re.compile(_trie_pattern(self.keywords))
+        # Every keyword that starts where a longer one starts is one of its prefixes
+        self._prefix_ids = {
+            k: tuple(self.ids[p] for p in self.keywords if k.startswith(p))
+            for k in self.keywords
+        }
+
+    def find(self, text_lower):
+        """
+        Keywords contained in `text_lower` (already lowercased).
+        Returns {keyword id: end offset of its first occurrence}.
+        """
+        found = {}
+        search = self.pattern.search
+        pos = 0
+        while True:
+            m = search(text_lower, pos)
+            if not m:
+                return found
+            start = m.start()
+            for kid in self._prefix_ids[m.group()]:
+                if kid not in found:
+                    found[kid] = start + len(self.keywords[kid])
+            # Restart one character later so keywords beginning inside this match are found too
+            pos = start + 1
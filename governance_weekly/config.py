@@ -6,12 +6,26 @@ load_dotenv()
 class Config:
     # Scraper Settings
     MAX_ARTICLES_PER_SITE = int(os.getenv("MAX_ARTICLES_PER_SITE", 100))
-    RATE_LIMIT_SEC = float(os.getenv("RATE_LIMIT_SEC", 1.0))
+    RATE_LIMIT_SEC = float(os.getenv("RATE_LIMIT_SEC", 1.0))  # Per host
+    FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", 20))  # Shared fetch pool size
+    FETCH_PER_HOST = int(os.getenv("FETCH_PER_HOST", 2))  # Concurrent article fetches per site
+    STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", 20))  # Extracted articles buffered ahead of translation
+    EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", 0))  # Processes for page extraction + classification (0 = in the scraper threads)
+    USE_FEED_DISCOVERY = os.getenv("USE_FEED_DISCOVERY", "True").lower() == "true"  # Article links from sitemaps/RSS, homepage as fallback
+    MAX_FEED_DOCUMENTS = int(os.getenv("MAX_FEED_DOCUMENTS", 20))  # Sitemaps/feeds read per site
     USER_AGENT = os.getenv("USER_AGENT", "GovernanceWeeklyBot/1.0 (+https://accountabilitylab.org/)")
     
     # Paths
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     DB_PATH = os.path.join(BASE_DIR, "data", "gov_weekly.db").replace("\\", "/")
+    DB_CACHE_MB = int(os.getenv("DB_CACHE_MB", 64))  # SQLite page cache per connection
+    DB_MMAP_MB = int(os.getenv("DB_MMAP_MB", 256))  # Memory-mapped reads (0 = off)
+    DB_BUSY_TIMEOUT_SEC = float(os.getenv("DB_BUSY_TIMEOUT_SEC", 30))  # Wait this long for another writer's lock
+    DB_INSERT_BATCH = int(os.getenv("DB_INSERT_BATCH", 50))  # Articles per executemany/commit in collect
+    HTTP_CACHE_PATH = os.path.join(BASE_DIR, "data", "http_cache.db").replace("\\", "/")  # ETag/Last-Modified store
+    HTTP_CACHE_MAX_AGE_DAYS = int(os.getenv("HTTP_CACHE_MAX_AGE_DAYS", 30))
+    TITLE_INDEX_PATH = os.path.join(BASE_DIR, "data", "title_index.db").replace("\\", "/")  # Near-duplicate title LSH
+    TRANSLATION_CACHE_PATH = os.path.join(BASE_DIR, "data", "translation_cache.db").replace("\\", "/")  # Translations keyed by text hash
     OUTPUT_DIR = os.path.join(BASE_DIR, "output")
     
     # Translation
@@ -19,6 +33,23 @@ class Config:
     TRANSLATION_BACKEND = os.getenv("TRANSLATION_BACKEND", "googletrans") # googletrans, gemini, google, marian
     GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", 200000))  # LRU cap (0 = unbounded)
+    TRANSLATION_RATE_PER_SEC = float(os.getenv("TRANSLATION_RATE_PER_SEC", 0))  # Requests/sec per backend (0 = backend default)
+    TRANSLATION_WORKERS = int(os.getenv("TRANSLATION_WORKERS", 0))  # Concurrent translation requests (0 = backend default)
+    TRANSLATION_QUEUE_WORKERS = int(os.getenv("TRANSLATION_QUEUE_WORKERS", 2))  # Threads draining pending_translation rows
+    TRANSLATION_QUEUE_BATCH = int(os.getenv("TRANSLATION_QUEUE_BATCH", 4))  # Articles claimed (and translated together) per worker
+    TRANSLATION_LEASE_SEC = int(os.getenv("TRANSLATION_LEASE_SEC", 600))  # Claimed articles return to the queue after this
+    TRANSLATION_MAX_ATTEMPTS = int(os.getenv("TRANSLATION_MAX_ATTEMPTS", 3))
+    TRANSLATION_RETRY_BASE_SEC = float(os.getenv("TRANSLATION_RETRY_BASE_SEC", 60))  # Doubles after each failed attempt
+    TRANSLATION_POLL_SEC = float(os.getenv("TRANSLATION_POLL_SEC", 2))  # Idle workers check the queue this often
+    
+    # Local MarianMT engine (TRANSLATION_BACKEND=marian)
+    MARIAN_MODEL = os.getenv("MARIAN_MODEL", "Helsinki-NLP/opus-mt-ne-en")
+    MARIAN_THREADS = int(os.getenv("MARIAN_THREADS", 0))  # torch intra-op threads (0 = torch default)
+    MARIAN_BATCH_SIZE = int(os.getenv("MARIAN_BATCH_SIZE", 16))  # Sentences per generate() call
+    MARIAN_MAX_TOKENS = int(os.getenv("MARIAN_MAX_TOKENS", 512))  # Per sentence, input and output
+    MARIAN_QUANTIZE = os.getenv("MARIAN_QUANTIZE", "False").lower() == "true"  # int8 dynamic quantization
+    MARIAN_ONNX = os.getenv("MARIAN_ONNX", "False").lower() == "true"  # ONNX Runtime export (needs optimum[onnxruntime])
     
     # Drive
     DRIVE_FOLDER_ID = os.getenv("DRIVE_FOLDER_ID")
@@ -31,8 +62,10 @@ class Config:
     MIN_IMPACT_SCORE = float(os.getenv("MIN_IMPACT_SCORE", 10.0))
 
     # Selenium
-    USE_SELENIUM = os.getenv("USE_SELENIUM", "True").lower() == "true"
+    USE_SELENIUM = os.getenv("USE_SELENIUM", "True").lower() == "true"  # Browser for sources that need JS; others use plain HTTP
     SELENIUM_HEADLESS = os.getenv("SELENIUM_HEADLESS", "True").lower() == "true"
+    SELENIUM_POOL_SIZE = int(os.getenv("SELENIUM_POOL_SIZE", 2))  # Browsers rendering pages concurrently
+    SELENIUM_PAGE_TIMEOUT = int(os.getenv("SELENIUM_PAGE_TIMEOUT", 30))  # Seconds per page load
     
     # Robots.txt - Skip for personal/research use
     SKIP_ROBOTS_CHECK = os.getenv("SKIP_ROBOTS_CHECK", "True").lower() == "true"
@@ -3,22 +3,61 @@ import json
 import logging
 from datetime import datetime
 from config import Config
+from database import html_store, migrations
 
 logger = logging.getLogger(__name__)
 
+# Applied to every connection. WAL lets report queries and translation workers read while
+# collection writes; synchronous=NORMAL is safe under WAL (a power cut can lose the last
+# commits but never corrupts the file) and skips an fsync per commit.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    f"PRAGMA cache_size=-{Config.DB_CACHE_MB * 1024}",
+    f"PRAGMA mmap_size={Config.DB_MMAP_MB * 1024 * 1024}",
+)
+
+# Columns written by collect(); insert_articles takes dicts with these keys (plus raw_html,
+# which goes to the html_store side table and is referenced by content_hash)
+ARTICLE_COLUMNS = (
+    "url", "source_domain", "title_original", "full_text_original",
+    "published_at", "fetched_at", "language",
+    "title_translated", "full_text_translated", "summary",
+    "categories", "relevance_score", "content_hash", "status",
+    # utils.article_filter.FEATURE_COLUMNS, NULL until computed
+    "weighted_score", "report_excluded", "impact_score",
+    "title_fingerprint", "summary_fingerprint", "features_version",
+)
+INSERT_ARTICLE_SQL = (
+    f"INSERT OR IGNORE INTO articles ({', '.join(ARTICLE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(ARTICLE_COLUMNS))})"
+)
+
+URL_CHUNK = 500  # URLs per IN (...) lookup, under SQLite's bound-parameter limit
+
+def connect(path=None, **kwargs):
+    """sqlite3 connection to the articles database with PRAGMAS applied"""
+    conn = sqlite3.connect(path or Config.DB_PATH, timeout=Config.DB_BUSY_TIMEOUT_SEC, **kwargs)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
 class DB:
     def __init__(self):
         self.conn = None
         self.cursor = None
 
     def connect(self):
-        self.conn = sqlite3.connect(Config.DB_PATH)
+        self.conn = connect()
         self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
 
     def close(self):
         if self.conn:
+            self.conn.execute("PRAGMA optimize")  # Refresh planner statistics where they are stale
             self.conn.close()
+            self.conn = None
 
     def commit(self):
         if self.conn:
@@ -28,32 +67,79 @@ class DB:
         if self.conn:
             self.conn.rollback()
 
+    def get_known_urls(self):
+        """Load every stored article URL once, for skipping known links before fetching"""
+        self.cursor.execute("SELECT url FROM articles")
+        return {row[0] for row in self.cursor.fetchall()}
+
+    def insert_articles(self, rows):
+        """
+        Insert article dicts (ARTICLE_COLUMNS keys) with one executemany; URLs already
+        stored are ignored. A row's raw_html is stored compressed in the raw_html table and
+        linked through content_hash, for the rows actually inserted only, so ignored
+        duplicates leave no unreferenced HTML. Returns the number of rows inserted. The
+        caller commits.
+        """
+        rows = [dict(row, content_hash=html_store.content_hash(row["raw_html"])) if row.get("raw_html") else row
+                for row in rows]
+        before = self.conn.total_changes
+        self.cursor.executemany(INSERT_ARTICLE_SQL, [tuple(row.get(c) for c in ARTICLE_COLUMNS) for row in rows])
+        inserted = self.conn.total_changes - before
+        pages = {}
+        for row in rows:
+            if row.get("raw_html"):
+                pages.setdefault(row["url"], row)  # A URL repeated in the batch is inserted from its first row
+        if inserted and pages:
+            stored = {}
+            urls = list(pages)
+            for start in range(0, len(urls), URL_CHUNK):
+                chunk = urls[start:start + URL_CHUNK]
+                stored.update(self.conn.execute(
+                    f"SELECT url, content_hash FROM articles WHERE url IN ({', '.join('?' * len(chunk))})", chunk))
+            # A row was inserted if its URL now carries its hash (an identical page already stored is skipped by put_many)
+            html_store.put_many(self.conn, [row["raw_html"] for url, row in pages.items()
+                                            if stored.get(url) == row["content_hash"]])
+        return inserted
+
+    def update_articles(self, rows, columns):
+        """Set columns of stored articles from dicts keyed by url; the caller commits"""
+        assignments = ", ".join(f"{c} = ?" for c in columns)
+        self.cursor.executemany(f"UPDATE articles SET {assignments} WHERE url = ?",
+                                [tuple(row.get(c) for c in columns) + (row["url"],) for row in rows])
+
+    def get_raw_html(self, url):
+        """Stored HTML of an article, or None"""
+        row = self.conn.execute("SELECT content_hash, raw_html FROM articles WHERE url = ?", (url,)).fetchone()
+        if not row:
+            return None
+        if row[1]:
+            return row[1]  # Not moved to the raw_html table yet
+        return html_store.get(self.conn, row[0]) if row[0] else None
+
+    def compact(self):
+        """
+        Delete stored HTML no article references, then VACUUM the database file, returning
+        free pages (e.g. left by moved HTML) to the filesystem. It rewrites the whole file under an exclusive lock, so run it when no
+        collection or translation process is using the database. Returns bytes freed.
+        """
+        orphans = html_store.delete_unreferenced(self.conn)
+        if orphans:
+            logger.info(f"Deleted {orphans} stored pages no article references")
+        page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+        before = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        self.conn.commit()
+        self.conn.execute("VACUUM")
+        after = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        freed = (before - after) * page_size
+        logger.info(f"Compacted database: {before * page_size / 1e6:.1f} MB -> {after * page_size / 1e6:.1f} MB")
+        return freed
+
     def init_db(self):
+        """Connect and bring the schema up to date (see database/migrations.py)"""
         self.connect()
-        # Create table mimicking the previous SQLAlchemy model
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS articles (
-                url TEXT PRIMARY KEY,
-                source_domain TEXT NOT NULL,
-                title_original TEXT,
-                full_text_original TEXT,
-                published_at TIMESTAMP,
-                fetched_at TIMESTAMP,
-                language TEXT,
-                title_translated TEXT,
-                full_text_translated TEXT,
-                translation_metadata TEXT,
-                summary TEXT,
-                categories TEXT,
-                relevance_score REAL,
-                content_hash TEXT,
-                raw_html TEXT,
-                status TEXT,
-                requires_review INTEGER,
-                reviewer_notes TEXT
-            )
-        ''')
-        self.conn.commit()
+        version = migrations.migrate(self.conn)
+        logger.info(f"Database schema at version {version}")
+        return version
 
 # Singleton-ish pattern for main.py to use
 def get_db():
@@ -66,5 +152,7 @@ def get_db():
 
 def init_db():
     db = DB()
-    db.init_db()
-    db.close()
+    try:
+        return db.init_db()
+    finally:
+        db.close()
@@ -0,0 +1,68 @@
+"""
+Content-addressed store for fetched article HTML, kept out of the articles table so scans
+and report queries never page through it. Pages are keyed by sha256 of the HTML (the
+articles.content_hash column) and compressed with zstd when installed, zlib otherwise;
+each row records its codec so either can be read back.
+"""
+import hashlib
+import logging
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+CODEC = "zstd" if zstandard else "zlib"
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 6
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS raw_html (
+        content_hash TEXT PRIMARY KEY,
+        codec TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        html BLOB NOT NULL
+    )
+'''
+
+def content_hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+def compress(html: str) -> bytes:
+    data = html.encode("utf-8")
+    if CODEC == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, ZLIB_LEVEL)
+
+def decompress(codec: str, blob: bytes) -> str:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("raw_html stored with zstd; pip install zstandard to read it")
+        return zstandard.ZstdDecompressor().decompress(blob).decode("utf-8")
+    return zlib.decompress(blob).decode("utf-8")
+
+def put_many(conn, pages):
+    """Store HTML pages (identical pages once); returns their content hashes in order"""
+    hashes, rows = [], {}
+    for html in pages:
+        key = content_hash(html)
+        hashes.append(key)
+        if key not in rows:
+            rows[key] = (key, CODEC, len(html), compress(html))
+    conn.executemany("INSERT OR IGNORE INTO raw_html (content_hash, codec, size, html) VALUES (?, ?, ?, ?)",
+                     list(rows.values()))
+    return hashes
+
+def get(conn, key):
+    """HTML for a content hash, or None"""
+    row = conn.execute("SELECT codec, html FROM raw_html WHERE content_hash = ?", (key,)).fetchone()
+    return decompress(row[0], row[1]) if row else None
+
+def delete_unreferenced(conn):
+    """Delete pages no article's content_hash points to; returns how many. The caller commits."""
+    cursor = conn.execute("DELETE FROM raw_html WHERE content_hash NOT IN "
+                          "(SELECT content_hash FROM articles WHERE content_hash IS NOT NULL)")
+    return cursor.rowcount
@@ -0,0 +1,175 @@
+"""
+Versioned schema migrations for the articles database.
+
+The applied version is stored in the database header (PRAGMA user_version). migrate() runs
+every migration newer than that, in order, and bumps the version after each one succeeds.
+Files created before versioning report version 0 and replay from the start, so every
+migration must be idempotent (IF NOT EXISTS, add_columns, backfills that select only rows
+still to do); that also makes a migration interrupted half way safe to rerun.
+
+Schema changes are cheap in SQLite (ALTER TABLE ADD COLUMN and CREATE INDEX never rewrite
+rows beyond building the index). Data changes go through backfill(), which works in batches
+of one short transaction each so collection, translation workers and reports keep running.
+
+To change the schema, append a function to MIGRATIONS; never edit one that has shipped.
+"""
+import logging
+import sqlite3
+import time
+from database import html_store
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH = 500
+
+# Secondary indexes on articles (the SQLAlchemy model's index=True columns plus the date
+# columns every report filters on). status is the leading column of idx_articles_queue.
+INDEXES = {
+    "idx_articles_source_domain": "articles (source_domain)",
+    "idx_articles_content_hash": "articles (content_hash)",
+    "idx_articles_fetched_at": "articles (fetched_at)",
+    "idx_articles_published_at": "articles (published_at)",
+    "idx_articles_queue": "articles (status, lease_expires)",  # Translation queue claims
+}
+
+def user_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def add_columns(conn, table, columns):
+    """ALTER TABLE ADD COLUMN for each {name: definition} the table lacks"""
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    for name, definition in columns.items():
+        if name in existing:
+            continue
+        try:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+            logger.info(f"Added column {table}.{name}")
+        except sqlite3.OperationalError as e:
+            if "duplicate column" not in str(e):  # Another process migrating at the same time
+                raise
+
+def backfill(conn, select_sql, update_sql, compute, batch_size=BACKFILL_BATCH, pause=0.0):
+    """
+    Fill data in batches of one transaction each. select_sql takes a LIMIT parameter and must
+    return only rows still to do, so each batch makes progress and a restart resumes;
+    compute(rows) returns the parameter tuples for update_sql. pause sleeps between batches to
+    leave the write lock to other processes. Returns the number of rows updated.
+    """
+    done = 0
+    while True:
+        rows = conn.execute(select_sql, (batch_size,)).fetchall()
+        if not rows:
+            break
+        conn.executemany(update_sql, compute(rows))
+        conn.commit()
+        done += len(rows)
+        if pause:
+            time.sleep(pause)
+    return done
+
+def create_articles(conn):
+    """Articles table as the SQLAlchemy model defined it before versioning"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS articles (
+            url TEXT PRIMARY KEY,
+            source_domain TEXT NOT NULL,
+            title_original TEXT,
+            full_text_original TEXT,
+            published_at TIMESTAMP,
+            fetched_at TIMESTAMP,
+            language TEXT,
+            title_translated TEXT,
+            full_text_translated TEXT,
+            translation_metadata TEXT,
+            summary TEXT,
+            categories TEXT,
+            relevance_score REAL,
+            content_hash TEXT,
+            raw_html TEXT, -- Unused since HTML moved to the raw_html table; kept so old files open
+            status TEXT,
+            requires_review INTEGER,
+            reviewer_notes TEXT
+        )
+    ''')
+
+def add_translation_queue(conn):
+    add_columns(conn, "articles", {
+        "translation_attempts": "INTEGER DEFAULT 0",
+        "lease_owner": "TEXT",
+        "lease_expires": "REAL",  # epoch seconds; also the retry-not-before time
+        "last_error": "TEXT",
+    })
+
+def add_indexes(conn):
+    for name, target in INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+def move_inline_html(conn):
+    """
+    Move HTML stored inline by older versions into the content-addressed raw_html table.
+    The freed pages stay in the file for SQLite to reuse; no VACUUM here, it would lock the
+    database while rewriting it. `python main.py --mode compact` (DB.compact) returns them.
+    """
+    conn.execute(html_store.SCHEMA)
+    conn.commit()
+
+    def store(rows):
+        hashes = html_store.put_many(conn, [row[1] for row in rows])
+        return [(key, row[0]) for key, row in zip(hashes, rows)]
+
+    moved = backfill(conn, "SELECT rowid, raw_html FROM articles WHERE raw_html IS NOT NULL LIMIT ?",
+                     "UPDATE articles SET content_hash = ?, raw_html = NULL WHERE rowid = ?", store, batch_size=200)
+    if moved:
+        logger.info(f"Moved raw HTML of {moved} articles to the raw_html table; "
+                    f"run `python main.py --mode compact` when nothing else uses the database to shrink the file")
+
+def add_report_features(conn):
+    """
+    Columns for utils.article_filter.report_features, and the index the report ranks from.
+    Rows stored earlier get their features the first time a report window includes them.
+    """
+    add_columns(conn, "articles", {
+        "weighted_score": "INTEGER",
+        "report_excluded": "INTEGER",
+        "impact_score": "REAL",
+        "title_fingerprint": "TEXT",
+        "summary_fingerprint": "TEXT",
+        "features_version": "INTEGER",
+    })
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_report ON articles (fetched_at, impact_score) "
+                 "WHERE report_excluded = 0")
+
+def rank_report_index(conn):
+    """
+    Replace idx_articles_report (fetched_at, impact_score): after the range on fetched_at it
+    cannot give rows in impact order, so the report sorted its whole window. Led by
+    impact_score, the report reads candidates best first and stops once it has enough.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_articles_report")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_report_rank ON articles (impact_score, fetched_at) "
+                 "WHERE report_excluded = 0")
+
+# Position in the list is the version: MIGRATIONS[0] brings a file to version 1
+MIGRATIONS = [
+    create_articles,
+    add_translation_queue,
+    add_indexes,
+    move_inline_html,
+    add_report_features,
+    rank_report_index,
+]
+LATEST = len(MIGRATIONS)
+
+def migrate(conn):
+    """Apply pending migrations; returns the schema version the database is at"""
+    current = user_version(conn)
+    if current > LATEST:
+        raise RuntimeError(f"Database schema version {current} is newer than this code ({LATEST}); update the pipeline")
+    for version, migration in enumerate(MIGRATIONS[current:], start=current + 1):
+        logger.info(f"Migrating database to version {version}: {migration.__name__}")
+        start = time.perf_counter()
+        migration(conn)
+        conn.execute(f"PRAGMA user_version = {version}")
+        conn.commit()
+        logger.info(f"Database at version {version} ({time.perf_counter() - start:.2f}s)")
+    return max(current, LATEST)
@@ -1,7 +1,9 @@
-from sqlalchemy import Column, String, Integer, Float, Text, DateTime, JSON, Boolean, create_engine
+from sqlalchemy import Index, Column, String, Integer, Float, Text, DateTime, JSON, Boolean, LargeBinary, create_engine
 from sqlalchemy.orm import declarative_base
 from datetime import datetime
 
+# Reference model of the articles database. The live schema is created and upgraded by
+# database/migrations.py; keep this in step when adding a migration.
 Base = declarative_base()
 
 class Article(Base):
@@ -11,8 +13,8 @@ class Article(Base):
     source_domain = Column(String, nullable=False, index=True)
     title_original = Column(String, nullable=True)
     full_text_original = Column(Text, nullable=True)
-    published_at = Column(DateTime, nullable=True)
-    fetched_at = Column(DateTime, default=datetime.utcnow)
+    published_at = Column(DateTime, nullable=True, index=True)
+    fetched_at = Column(DateTime, default=datetime.utcnow, index=True)
     
     language = Column(String, default="ne") # ne or en
     
@@ -27,13 +29,40 @@ class Article(Base):
     relevance_score = Column(Float, default=0.0)
     
     # Deduplication & Provenance
-    content_hash = Column(String, index=True, nullable=True)
-    raw_html = Column(Text, nullable=True)
+    content_hash = Column(String, index=True, nullable=True) # sha256 of the page, key into raw_html
+    raw_html = Column(Text, nullable=True) # unused: pages live in the raw_html table
     
     # Review Workflow
-    status = Column(String, default="pending_review", index=True) # pending_review, verified, rejected
+    status = Column(String, default="pending_review") # pending_translation, pending_review, excluded, translation_failed, verified, rejected
     requires_review = Column(Boolean, default=False)
     reviewer_notes = Column(Text, nullable=True)
+
+    # Translation work queue
+    translation_attempts = Column(Integer, default=0)
+    lease_owner = Column(String, nullable=True)
+    lease_expires = Column(Float, nullable=True) # epoch seconds; also the retry-not-before time
+    last_error = Column(Text, nullable=True)
+
+    # Report features (utils.article_filter.report_features)
+    weighted_score = Column(Integer, nullable=True)
+    report_excluded = Column(Boolean, nullable=True)
+    impact_score = Column(Float, nullable=True)
+    title_fingerprint = Column(Text, nullable=True) # normalized title, for duplicate checks
+    summary_fingerprint = Column(Text, nullable=True)
+    features_version = Column(Integer, nullable=True) # FEATURES_VERSION at scoring time
+
+    __table_args__ = (
+        Index("idx_articles_queue", "status", "lease_expires"),
+        Index("idx_articles_report_rank", "impact_score", "fetched_at", sqlite_where=report_excluded == False),
+    )
     
     def __repr__(self):
         return f"<Article(source={self.source_domain}, title={self.title_original})>"
+
+class RawHtml(Base):
+    __tablename__ = 'raw_html'
+
+    content_hash = Column(String, primary_key=True)
+    codec = Column(String, nullable=False) # zstd or zlib
+    size = Column(Integer, nullable=False) # uncompressed characters
+    html = Column(LargeBinary, nullable=False)
@@ -0,0 +1,107 @@
+import logging
+import sqlite3
+import time
+from config import Config
+from database.db import connect
+
+logger = logging.getLogger(__name__)
+
+class TranslationQueue:
+    """
+    Articles waiting for translation, leased out of the articles table.
+    Collection inserts rows with status='pending_translation'; a worker claims a few at a
+    time, which sets lease_owner/lease_expires and counts the attempt. Rows whose lease
+    has expired (worker crashed or was killed) are claimable again, so work resumes
+    where it stopped. lease_expires also holds the not-before time of a scheduled retry.
+    Each worker thread or process opens its own queue (own SQLite connection).
+    """
+    PENDING = "pending_translation"
+
+    def __init__(self, db_path=None, lease_sec=None):
+        self.lease_sec = lease_sec or Config.TRANSLATION_LEASE_SEC
+        self.conn = connect(db_path, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+
+    def claim(self, owner, limit):
+        """Lease up to `limit` pending articles to `owner`, oldest first"""
+        now = time.time()
+        # BEGIN IMMEDIATE takes the write lock before reading, so two workers never claim the same row
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self.conn.execute(
+                "SELECT url, title_original, full_text_original, language, translation_attempts FROM articles "
+                "WHERE status = ? AND (lease_expires IS NULL OR lease_expires <= ?) "
+                "ORDER BY fetched_at LIMIT ?",
+                (self.PENDING, now, limit)
+            ).fetchall()
+            self.conn.executemany(
+                "UPDATE articles SET lease_owner = ?, lease_expires = ?, translation_attempts = translation_attempts + 1 "
+                "WHERE url = ?",
+                [(owner, now + self.lease_sec, row["url"]) for row in rows]
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return [dict(row, translation_attempts=row["translation_attempts"] + 1) for row in rows]
+
+    def complete(self, url, owner, status, fields):
+        """Store the results for a leased article and move it to `status`. False if the lease was lost."""
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        cursor = self.conn.execute(
+            f"UPDATE articles SET {columns}, status = ?, lease_owner = NULL, lease_expires = NULL, last_error = NULL "
+            "WHERE url = ? AND lease_owner = ? AND status = ?",
+            (*fields.values(), status, url, owner, self.PENDING)
+        )
+        if not cursor.rowcount:
+            logger.warning(f"Lease on {url} expired before its translation was stored")
+        return bool(cursor.rowcount)
+
+    def retry(self, url, owner, error, delay):
+        """Give a leased article back to the queue, claimable again after `delay` seconds"""
+        self.conn.execute(
+            "UPDATE articles SET lease_owner = NULL, lease_expires = ?, last_error = ? "
+            "WHERE url = ? AND lease_owner = ? AND status = ?",
+            (time.time() + delay, error, url, owner, self.PENDING)
+        )
+
+    def fail(self, url, owner, error):
+        """Stop retrying a leased article"""
+        self.conn.execute(
+            "UPDATE articles SET status = 'translation_failed', lease_owner = NULL, lease_expires = NULL, last_error = ? "
+            "WHERE url = ? AND lease_owner = ? AND status = ?",
+            (error, url, owner, self.PENDING)
+        )
+
+    def release(self, owner):
+        """Hand back everything `owner` still holds (clean shutdown); the interrupted attempt is not counted"""
+        cursor = self.conn.execute(
+            "UPDATE articles SET lease_owner = NULL, lease_expires = NULL, "
+            "translation_attempts = MAX(translation_attempts - 1, 0) WHERE lease_owner = ? AND status = ?",
+            (owner, self.PENDING)
+        )
+        return cursor.rowcount
+
+    def counts(self):
+        """Pending articles: {'ready': claimable now, 'leased': held by a worker, 'waiting': retry scheduled}"""
+        now = time.time()
+        row = self.conn.execute(
+            "SELECT "
+            "COALESCE(SUM(lease_expires IS NULL OR lease_expires <= ?), 0), "
+            "COALESCE(SUM(lease_owner IS NOT NULL AND lease_expires > ?), 0), "
+            "COALESCE(SUM(lease_owner IS NULL AND lease_expires > ?), 0) "
+            "FROM articles WHERE status = ?",
+            (now, now, now, self.PENDING)
+        ).fetchone()
+        return {"ready": row[0], "leased": row[1], "waiting": row[2]}
+
+    def next_retry(self):
+        """Earliest not-before time of a scheduled retry (epoch seconds), or None if none is waiting"""
+        row = self.conn.execute(
+            "SELECT MIN(lease_expires) FROM articles WHERE status = ? AND lease_owner IS NULL AND lease_expires > ?",
+            (self.PENDING, time.time())
+        ).fetchone()
+        return row[0]
+
+    def close(self):
+        self.conn.close()
@@ -2,134 +2,117 @@ try:
     from readability import Document
 except ImportError:
     Document = None
-from bs4 import BeautifulSoup
-import dateparser
-from datetime import datetime
+import lxml.html
+from extractor.date_resolver import resolve_published_date
+from extractor.text_cleaner import clean_text
 import logging
+import json
+import re
 
 logger = logging.getLogger(__name__)
 
+# Same as readability's build_doc: always hand lxml UTF-8 bytes so <?xml encoding?> declarations don't break parsing
+_utf8_parser = lxml.html.HTMLParser(encoding="utf-8")
+
+DATE_META_KEYS = ['article:published_time', 'publishedDate', 'datePublished', 'date', 'publication_date']
+DATE_CLASS_RE = re.compile(r'date|time|publish', re.I)
+
+def parse_html(html):
+    """Parse a page once into an lxml tree"""
+    return lxml.html.document_fromstring(html.encode("utf-8", "replace"), parser=_utf8_parser)
+
+def html_to_text(fragment_html):
+    """Text of an HTML fragment, one line per text node (like BeautifulSoup's get_text(separator="\\n"))"""
+    if not fragment_html or not fragment_html.strip():
+        return ""
+    # readability returns a whole <html> document, so parse it as one
+    return "\n".join(parse_html(fragment_html).itertext()).strip()
+
+def find_date_candidates(tree):
+    """Collect published-date strings from meta tags, <time>, JSON-LD and date-like classes, in priority order"""
+    date_candidates = []
+    
+    # 1. Meta tags
+    for meta_tag in tree.iter("meta"):
+        for attr in ['property', 'name', 'itemprop']:
+            if meta_tag.get(attr) in DATE_META_KEYS:
+                content = meta_tag.get("content")
+                if content:
+                    date_candidates.append(content)
+    
+    # 2. Time tags
+    for time_tag in tree.iter("time"):
+        datetime_attr = time_tag.get("datetime") or time_tag.text_content()
+        if datetime_attr:
+            date_candidates.append(datetime_attr)
+    
+    # 3. JSON-LD structured data
+    for script in tree.iter("script"):
+        if script.get("type") != "application/ld+json":
+            continue
+        try:
+            data = json.loads(script.text)
+            if isinstance(data, dict):
+                if 'datePublished' in data:
+                    date_candidates.append(data['datePublished'])
+                elif 'dateCreated' in data:
+                    date_candidates.append(data['dateCreated'])
+        except:
+            pass
+    
+    # 4. Common date class patterns
+    for date_elem in tree.iter():
+        css_class = date_elem.get("class") if isinstance(date_elem.tag, str) else None
+        if css_class and DATE_CLASS_RE.search(css_class):
+            date_text = date_elem.text_content().strip()
+            if date_text:
+                date_candidates.append(date_text)
+    
+    return date_candidates
+
 def extract_article(html, url):
     """
     Extracts the main content, title, and metadata from an article HTML.
+    The page is parsed into a single lxml tree that serves date, title and content extraction.
     """
     if not html:
         return None
         
     try:
+        tree = parse_html(html)
+        
+        # Metadata first: readability prunes hidden elements from the tree it is given
+        date_candidates = find_date_candidates(tree)
+        
         if Document:
-            doc = Document(html)
+            doc = Document(tree)
             title = doc.short_title()
             content_html = doc.summary()
         else:
             # Fallback for missing readability
-            soup = BeautifulSoup(html, "html.parser")
-            title = soup.title.string if soup.title else "No Title"
+            title_elem = tree.find(".//title")
+            title = title_elem.text if title_elem is not None and title_elem.text else "No Title"
             # Try to find <article> or just body
-            article_body = soup.find('article') or soup.body
-            content_html = str(article_body) if article_body else html
-        
-        # Clean up tags using BeautifulSoup
-        soup = BeautifulSoup(content_html, "html.parser")
-        text_content = soup.get_text(separator="\n").strip()
-        
-        # Remove junk patterns (read time, date stamps, social media prompts, etc.)
-        import re
-        junk_patterns = [
-            r'Read Time\s*:.*?\d+\s*(?:minute|min|second|sec)',  # Read Time : < 1 minute
-            r'Read Time\s*:.*?2o?\d{2}\s+\w+\s+\d+\s+\w+\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Read Time : > 3 minutes 2o82 Paush 3 Thursday o6:36:oo
-            r'2o?\d{2}\s+(?:Paush|Magh|Falgun|Chaitra|Baisakh|Jestha|Ashadh|Shrawan|Bhadra|Ashwin|Kartik|Mangsir)\s+\d+\s+(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Nepali calendar dates
-            r'\d{4}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}:\d{2}',  # Date stamps
-            r'News Summary Generated by OK AI\.?\s*Editorially reviewed\.?',  # OnlineKhabar AI summary notice
-            r'Share on Facebook.*?Share on Twitter',  # Social media
-            r'Share via Email',
-            r'Print this page',
-            r'Advertisement',
-            r'Related Articles?:?',
-            r'Tags?:.*',
-            r'Published on:.*',
-            r'Updated on:.*',
-            r'\[.*?\]',  # [Photo Gallery] etc
-            # Site-specific boilerplate
-            r'News\s*Sign\s*In',                                         # Ekantipur login overlay
-            r'(?:^|\n)\s*Sign\s*In\s*(?:\n|$)',                          # Standalone "Sign In" line
-            r'Read\s*In\s*English',                                       # Ekantipur language toggle
-            r'Facebook\s+Messenger\s+Twitter\s+Whatsapp\s+Viber\s+Copy\s+Link',  # Share bar
-            r'What you should know',                                      # Ekantipur section header
-            r'Your browser does not support the audio element\.?',        # HTML5 audio fallback
-            r'\d+\s*Comments?\s*(?:Shares?)?',                           # OnlineKhabar comment count
-            r'Pvt\.\s+\w+[\w\s]+\d{1,2}\s+\w+\s+\d{4}\s+at\s+\d{1,2}:\d{2}',  # Author byline
-            r'[A-Z][a-z]+\s+[A-Z][a-z]+\s+\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s+at\s+\d{1,2}:\d{2}',  # "Name Surname DD Month YYYY at HH:MM"
-            r'Falgun\s+\d+,?\s+\d{4}\s+[A-Z][a-z]+\s+[A-Z][a-z]+',   # "Falgun 8, 2082 Kedar Sivakoti"
-            r'(?:Republica|Kantipur|OnlineKhabar|Setopati|Ratopati)\s+(?:Online|Media|Staff)',  # Source tags
-        ]
+            article_body = tree.find(".//article")
+            if article_body is None:
+                article_body = tree.find(".//body")
+            content_html = lxml.html.tostring(article_body, encoding="unicode") if article_body is not None else html
         
-        for pattern in junk_patterns:
-            text_content = re.sub(pattern, '', text_content, flags=re.IGNORECASE)
+        # Only the (small) extracted content fragment is parsed again, to get its text
+        text_content = html_to_text(content_html)
         
-        # Remove excessive whitespace
-        text_content = re.sub(r'\n\s*\n+', '\n\n', text_content)
-        text_content = text_content.strip()
+        # First valid date: ISO / known formats / BS first, dateparser only if none resolves.
+        # The uncleaned text is passed for BS byline stamps, which clean_text removes.
+        published_at, date_tier = resolve_published_date(date_candidates, url, text_content)
         
-        # Metadata extraction (heuristic)
-        # Often readability doesn't get the date well, so we might need custom parsing per site
-        # or use generic meta tag scraping
-        
-        soup_full = BeautifulSoup(html, "html.parser")
-        
-        # Attempt to find published time from multiple sources
-        published_at = None
-        
-        # Try multiple date extraction methods
-        date_candidates = []
-        
-        # 1. Meta tags
-        for meta_tag in soup_full.find_all("meta"):
-            for attr in ['property', 'name', 'itemprop']:
-                if meta_tag.get(attr) in ['article:published_time', 'publishedDate', 'datePublished', 'date', 'publication_date']:
-                    content = meta_tag.get("content")
-                    if content:
-                        date_candidates.append(content)
-        
-        # 2. Time tags
-        for time_tag in soup_full.find_all("time"):
-            datetime_attr = time_tag.get("datetime") or time_tag.get_text()
-            if datetime_attr:
-                date_candidates.append(datetime_attr)
-        
-        # 3. JSON-LD structured data
-        for script in soup_full.find_all("script", type="application/ld+json"):
-            try:
-                import json
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    if 'datePublished' in data:
-                        date_candidates.append(data['datePublished'])
-                    elif 'dateCreated' in data:
-                        date_candidates.append(data['dateCreated'])
-            except:
-                pass
-        
-        # 4. Common date class patterns
-        for date_elem in soup_full.find_all(class_=re.compile(r'date|time|publish', re.I)):
-            date_text = date_elem.get_text().strip()
-            if date_text:
-                date_candidates.append(date_text)
-        
-        # Parse first valid date
-        for candidate in date_candidates:
-            try:
-                parsed = dateparser.parse(str(candidate), settings={'PREFER_DATES_FROM': 'past'})
-                if parsed:
-                    published_at = parsed
-                    break
-            except:
-                continue
+        # Remove junk patterns (read time, date stamps, social media prompts, etc.)
+        text_content = clean_text(text_content, url)
         
         return {
             "title": title,
             "full_text": text_content,
             "published_at": published_at,
+            "date_tier": date_tier,
             "raw_html": html
         }
         
@@ -0,0 +1,215 @@
+"""
+Published-date resolution for extract_article, cheapest tier first:
+
+  iso         ISO-8601 values (meta tags, <time datetime>, JSON-LD) via datetime.fromisoformat
+  rfc2822     RFC 2822 values ("Fri, 20 Feb 2026 10:30:00 +0545") via email.utils
+  format      the visible date formats the 10 sources print, as precompiled regexes
+              (English or Devanagari digits, Gregorian months)
+  bs          the same formats with Bikram Sambat (BS) months, converted by utils.nepali_calendar
+  dateparser  only for a candidate none of the tiers above can read
+
+Candidates keep find_date_candidates' priority order: the first one any tier resolves wins,
+so a meta date only dateparser can read still beats a related-article stamp further down.
+Results of the fast tiers, and strings dateparser could not parse, are memoized: the same
+date strings repeat across every page of a site (related-article stamps, the header date).
+Pages with no usable candidate fall back to a BS stamp in the article text (find_text_date).
+"""
+import logging
+import re
+import threading
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import urlparse
+import dateparser
+from utils.nepali_calendar import bs_to_ad
+
+logger = logging.getLogger(__name__)
+
+DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+GREGORIAN_MONTHS = {
+    name: number for number, names in enumerate([
+        ("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"), ("may",),
+        ("june", "jun"), ("july", "jul"), ("august", "aug"), ("september", "sep", "sept"),
+        ("october", "oct"), ("november", "nov"), ("december", "dec"),
+    ], start=1) for name in names
+}
+
+# BS months in the spellings the sources use, romanized and in Devanagari
+BS_MONTHS = {
+    name: number for number, names in enumerate([
+        ("baisakh", "baishakh", "वैशाख", "बैशाख", "बैसाख"), ("jestha", "jeth", "जेठ", "जेष्ठ"),
+        ("ashadh", "asar", "asadh", "असार", "आषाढ"), ("shrawan", "saun", "srawan", "साउन", "श्रावण"),
+        ("bhadra", "bhadau", "भदौ", "भाद्र"), ("ashwin", "asoj", "असोज", "आश्विन"),
+        ("kartik", "kattik", "कात्तिक", "कार्तिक"), ("mangsir", "mansir", "मंसिर", "मङ्सिर", "मार्गशीर्ष"),
+        ("paush", "poush", "push", "pus", "पुस", "पौष"), ("magh", "माघ"),
+        ("falgun", "fagun", "phalgun", "फागुन", "फाल्गुन"), ("chaitra", "chait", "चैत", "चैत्र"),
+    ], start=1) for name in names
+}
+
+WEEKDAYS = ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday",
+            "sun", "mon", "tue", "wed", "thu", "fri", "sat",
+            "आइतबार", "सोमबार", "मंगलबार", "मङ्गलबार", "बुधबार", "बिहीबार", "शुक्रबार", "शनिबार")
+
+def _alternation(words):
+    return "|".join(sorted(map(re.escape, words), key=len, reverse=True))
+
+_DIGIT = "[0-9०-९]"
+_TOKENS = {
+    "{year}": rf"(?P<year>{_DIGIT}{{4}})",
+    "{month}": rf"(?P<month>{_alternation(list(GREGORIAN_MONTHS) + list(BS_MONTHS))})\.?",
+    "{day}": rf"(?P<day>{_DIGIT}{{1,2}})(?:\s*गते)?",
+    "{weekday}": rf"(?:{_alternation(WEEKDAYS)})",
+    "{time}": rf"(?P<hour>{_DIGIT}{{1,2}}):(?P<minute>{_DIGIT}{{2}})(?::(?P<second>{_DIGIT}{{2}}))?(?:\s*(?P<ampm>[ap]\.?m\.?))?",
+}
+
+def _compile(layout):
+    """Regex for a layout such as "{weekday}, {month} {day}, {year}"; a trailing time is optional"""
+    pattern = re.escape(layout).replace(r"\ ", r"\s+").replace(",", r",?")
+    for token, regex in _TOKENS.items():
+        pattern = pattern.replace(re.escape(token), regex)
+    return re.compile(rf"{pattern}(?:,?\s+{_TOKENS['{time}']})?", re.IGNORECASE)
+
+FORMATS = {
+    "month_day_year": _compile("{month} {day}, {year}"),                   # February 20, 2026 / फागुन ८, २०८२
+    "weekday_month_day_year": _compile("{weekday}, {month} {day}, {year}"),  # Friday, February 20, 2026
+    "year_month_day": _compile("{year} {month} {day}"),                     # २०८२ फागुन ८ गते
+    "year_month_day_weekday": _compile("{year} {month} {day} {weekday}"),   # 2082 Falgun 8 Friday 06:36:00
+    "day_month_year": _compile("{day} {month} {year}"),                     # 20 February 2026
+}
+
+# Formats each source prints, tried first for its pages; the rest follow
+SOURCE_FORMATS = {
+    "ekantipur.com": ("month_day_year",),
+    "kathmandupost.com": ("month_day_year",),
+    "myrepublica.nagariknetwork.com": ("month_day_year",),
+    "setopati.com": ("weekday_month_day_year",),
+    "nayapatrikadaily.com": ("year_month_day_weekday", "year_month_day"),
+    "annapurnapost.com": ("month_day_year", "year_month_day"),
+    "theannapurnaexpress.com": ("weekday_month_day_year", "month_day_year"),
+    "onlinekhabar.com": ("year_month_day", "year_month_day_weekday"),
+    "ratopati.com": ("year_month_day_weekday",),
+    "ukaalo.com": ("month_day_year",),
+}
+
+# BS stamps inside article text ("2082 Falgun 8 Friday 06:36:00" bylines), for pages with no
+# date element. Only the start of the text is searched, where bylines are.
+TEXT_DATE_SPAN = 600
+_TEXT_PATTERNS = [re.compile(rf"(?<![0-9०-९])(?:{p.pattern})(?![0-9०-९])", re.IGNORECASE) for p in FORMATS.values()]
+
+_ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ][\d:.,]+(?:Z|[+-]\d{2}:?\d{2})?)?$")
+_RFC2822_RE = re.compile(r"(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{1,2}:\d{2}(?::\d{2})?\s+(?:[+-]\d{4}|[A-Z]{1,3})$")
+
+def source_for_url(url):
+    """SOURCE_FORMATS key for an article URL, or None"""
+    host = urlparse(url or "").netloc.lower()
+    for domain in SOURCE_FORMATS:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return None
+
+def _format_order(source):
+    preferred = SOURCE_FORMATS.get(source, ())
+    return [FORMATS[name] for name in preferred] + [p for name, p in FORMATS.items() if name not in preferred]
+
+_ORDERS = {source: _format_order(source) for source in (*SOURCE_FORMATS, None)}
+
+def _from_match(match):
+    """(datetime or None, tier) for a FORMATS match"""
+    fields = {k: v.translate(DEVANAGARI_DIGITS) for k, v in match.groupdict().items() if v}
+    month_name = match.group("month").lower()
+    hour = int(fields.get("hour", 0))
+    ampm = fields.get("ampm", "").lower().replace(".", "")
+    if ampm and not 1 <= hour <= 12:
+        return None, None
+    if ampm == "pm" and hour < 12:
+        hour += 12
+    elif ampm == "am" and hour == 12:
+        hour = 0
+    year, day = int(fields["year"]), int(fields["day"])
+    time_of_day = (hour, int(fields.get("minute", 0)), int(fields.get("second", 0)))
+    try:
+        if month_name in GREGORIAN_MONTHS:
+            return datetime(year, GREGORIAN_MONTHS[month_name], day, *time_of_day), "format"
+        ad = bs_to_ad(year, BS_MONTHS[month_name], day)
+        return datetime(ad.year, ad.month, ad.day, *time_of_day), "bs"
+    except ValueError:
+        return None, None
+
+@lru_cache(maxsize=8192)
+def resolve_fast(text, source=None):
+    """
+    (datetime, tier) from the ISO, RFC 2822, format and BS tiers, or (None, None) when the
+    string has to go to dateparser.
+    """
+    text = text.strip()
+    if _ISO_RE.match(text):
+        try:
+            return datetime.fromisoformat(text), "iso"
+        except ValueError:
+            pass
+    if _RFC2822_RE.match(text):
+        try:
+            return parsedate_to_datetime(text), "rfc2822"
+        except (TypeError, ValueError, IndexError):
+            pass
+    for pattern in _ORDERS.get(source, _ORDERS[None]):
+        match = pattern.fullmatch(text)
+        if match:
+            return _from_match(match)
+    return None, None
+
+_DATEPARSER_SETTINGS = {'PREFER_DATES_FROM': 'past'}
+_unparseable = set()  # Strings dateparser returned nothing for; successes are not kept ("2 hours ago")
+_unparseable_lock = threading.Lock()
+MAX_UNPARSEABLE = 20000
+
+def _dateparser(text):
+    if text in _unparseable:
+        return None
+    try:
+        parsed = dateparser.parse(text, settings=_DATEPARSER_SETTINGS)
+    except Exception:
+        parsed = None
+    if parsed is None:
+        with _unparseable_lock:
+            if len(_unparseable) >= MAX_UNPARSEABLE:
+                _unparseable.clear()
+            _unparseable.add(text)
+    return parsed
+
+def find_text_date(text):
+    """First BS date stamp near the start of an article's text as a datetime, or None"""
+    head = (text or "")[:TEXT_DATE_SPAN]
+    found = []
+    for pattern in _TEXT_PATTERNS:
+        for match in pattern.finditer(head):
+            if match.group("month").lower() in BS_MONTHS:
+                parsed, _ = _from_match(match)
+                if parsed:
+                    found.append((match.start(), -match.end(), parsed))  # Earliest, then longest
+                    break
+    return min(found)[2] if found else None
+
+def resolve_published_date(candidates, url=None, text=None):
+    """
+    First of `candidates` (find_date_candidates order) that any tier resolves, dateparser
+    being tried on a candidate before moving to the next; else a BS stamp at the start of the
+    article `text`.
+    Returns (datetime or None, tier), tier being "iso", "rfc2822", "format", "bs", "dateparser",
+    "text" or None.
+    """
+    source = source_for_url(url)
+    for candidate in candidates:
+        candidate = str(candidate)
+        parsed, tier = resolve_fast(candidate, source)
+        if parsed:
+            return parsed, tier
+        parsed = _dateparser(candidate)
+        if parsed:
+            return parsed, "dateparser"
+    parsed = find_text_date(text)
+    if parsed:
+        return parsed, "text"
+    return None, None
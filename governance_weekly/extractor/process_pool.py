@@ -0,0 +1,168 @@
+"""
+CPU stage between fetching and the collect() loop: article extraction (lxml + readability +
+dateparser) and, for English pages, classification, in worker processes so they use every
+core instead of sharing the GIL with the scraper threads.
+
+Only (url, html) goes to a worker and the extracted record comes back without the HTML, which
+the caller already holds. Workers use the spawn start method (the only one on Windows, and
+safe with the fetch threads running) and build their classifier once, at start-up.
+"""
+import itertools
+import logging
+import multiprocessing
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from config import Config
+from extractor.article_extractor import extract_article
+from utils.language import contains_nepali
+
+logger = logging.getLogger(__name__)
+
+def _init_worker():
+    from classifier.classifier import get_classifier
+    get_classifier()
+
+def process_page(url, html, classify=True):
+    """
+    extract_article without the raw_html (the caller keeps it), or None when no article was
+    found. With classify=True, pages without Devanagari also carry 'classification', the
+    Classifier.classify result collect() would otherwise compute for them.
+    """
+    data = extract_article(html, url)
+    if not data or not data['title']:
+        return None
+    del data['raw_html']
+    if classify:
+        title, text = data['title'] or "", data['full_text'] or ""
+        if not (contains_nepali(title) or contains_nepali(text)):
+            from classifier.classifier import get_classifier
+            data['classification'] = get_classifier().classify(f"{title}\n{text}")
+    return data
+
+class ExtractionPool:
+    """
+    Process pool shared by all scrapers. With no workers, pages are extracted in the calling
+    thread as before and left for collect() to classify.
+    """
+    def __init__(self, workers=None):
+        self.workers = Config.EXTRACT_WORKERS if workers is None else workers
+        self._executor = None
+        self._broken = False  # A worker died; the executor takes no more pages
+        if self.workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker
+            )
+        self.pages = 0
+        self.failures = 0
+        self.date_tiers = Counter()  # How each article's published date was resolved
+        self._lock = threading.Lock()
+        self.started_at = time.monotonic()
+
+    def _count(self, record):
+        with self._lock:
+            self.pages += 1
+            if record is None:
+                self.failures += 1
+            else:
+                self.date_tiers[record.get('date_tier')] += 1
+
+    def process(self, pages):
+        """
+        Run process_page over (url, html) pairs and yield (url, html, record) as each finishes.
+        Up to two pages per worker are in flight per caller, so pages are read (and fetched)
+        only as fast as they are processed. If a worker dies, the pool is not used again:
+        pages in flight and those still to read are extracted in the calling thread.
+        """
+        if self._executor is None:
+            for url, html in pages:
+                record = process_page(url, html, classify=False)
+                self._count(record)
+                yield url, html, record
+            return
+
+        page_iter = iter(pages)
+        pending = {}
+        unsubmitted = []  # The page a dead pool refused
+
+        def submit():
+            """Hand the next page to the pool; False when pages run out or the pool has died"""
+            if self._broken:
+                return False
+            for url, html in page_iter:
+                try:
+                    pending[self._executor.submit(process_page, url, html)] = (url, html)
+                except BrokenProcessPool:
+                    self._mark_broken()
+                    unsubmitted.append((url, html))
+                    return False
+                return True
+            return False
+
+        while len(pending) < 2 * self.workers and submit():
+            pass
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            future = done.pop()
+            url, html = pending.pop(future)
+            try:
+                record = future.result()
+            except BrokenProcessPool:
+                self._mark_broken()
+                record = process_page(url, html)
+            except Exception as e:
+                logger.error(f"Extraction failed for {url}: {e}")
+                record = None
+            submit()
+            self._count(record)
+            yield url, html, record
+
+        # The pool died: the remaining pages one at a time, in order, still read as they are needed
+        for url, html in itertools.chain(unsubmitted, page_iter):
+            record = process_page(url, html)
+            self._count(record)
+            yield url, html, record
+
+    def _mark_broken(self):
+        with self._lock:
+            if self._broken:
+                return
+            self._broken = True
+        logger.error("An extraction worker died; extracting the remaining pages in-process")
+
+    def report(self):
+        wall = time.monotonic() - self.started_at
+        mode = f"{self.workers} worker processes" if self._executor else "in-process"
+        if self._broken:
+            mode += ", broken"
+        logger.info(f"Extraction pool ({mode}): {self.pages} pages, {self.failures} without an article, "
+                    f"{self.pages / wall if wall else 0:.1f} pages/s over {wall:.1f}s")
+        articles = sum(self.date_tiers.values())
+        if articles:
+            tiers = ", ".join(f"{tier or 'none'} {count}" for tier, count in self.date_tiers.most_common())
+            logger.info(f"Published dates: {tiers} ({self.date_tiers['dateparser'] / articles:.1%} needed dateparser)")
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+_pool_instance = None
+_pool_lock = threading.Lock()
+
+def get_extraction_pool():
+    """Returns the process-wide ExtractionPool shared by all scrapers"""
+    global _pool_instance
+    with _pool_lock:
+        if _pool_instance is None:
+            _pool_instance = ExtractionPool()
+        return _pool_instance
+
+def shutdown_extraction_pool():
+    global _pool_instance
+    with _pool_lock:
+        if _pool_instance:
+            _pool_instance.report()
+            _pool_instance.shutdown()
+            _pool_instance = None
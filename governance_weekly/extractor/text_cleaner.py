@@ -0,0 +1,124 @@
+"""
+Boilerplate cleanup for extracted article text.
+Patterns are compiled once at import and grouped into passes; consecutive patterns in the
+same pass are merged into one alternation. Passes keep the original application order, and
+patterns are only merged where their matches cannot overlap each other.
+
+Most patterns have no literal prefix for the regex engine to search for, so each one also
+lists keywords that any match must contain. A pass is skipped when none of its keywords
+occur in the (lowercased) text, which is the common case for the expensive byline/source
+patterns.
+"""
+import re
+from urllib.parse import urlparse
+
+GREGORIAN_MONTHS = ("january", "february", "march", "april", "may", "june", "july",
+                    "august", "september", "october", "november", "december")
+BS_MONTHS = ("paush", "magh", "falgun", "chaitra", "baisakh", "jestha", "ashadh",
+             "shrawan", "bhadra", "ashwin", "kartik", "mangsir")
+
+# (pass, pattern, keywords, sources) in application order.
+# keywords: lowercase literals, at least one of which appears in every match.
+# sources=None applies to every site. Every baseline pattern is global: chrome seen on one site
+# shows up on others too. A sources tuple only adds a pattern for those sites.
+JUNK_PATTERNS = [
+    ("read_time", r'Read Time\s*:.*?\d+\s*(?:minute|min|second|sec)', ("read time",), None),  # Read Time : < 1 minute
+    ("read_time", r'Read Time\s*:.*?2o?\d{2}\s+\w+\s+\d+\s+\w+\s+o?\d{1,2}:o?\d{2}:o?\d{2}', ("read time",), None),  # Read Time : > 3 minutes 2o82 Paush 3 Thursday o6:36:oo
+    ("dates", r'2o?\d{2}\s+(?:Paush|Magh|Falgun|Chaitra|Baisakh|Jestha|Ashadh|Shrawan|Bhadra|Ashwin|Kartik|Mangsir)\s+\d+\s+(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)\s+o?\d{1,2}:o?\d{2}:o?\d{2}', BS_MONTHS, None),  # Nepali calendar dates
+    ("dates", r'\d{4}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}:\d{2}', GREGORIAN_MONTHS, None),  # Date stamps
+    ("ok_ai", r'News Summary Generated by OK AI\.?\s*Editorially reviewed\.?', ("news summary generated by ok ai",), None),  # OnlineKhabar AI summary notice
+    ("share", r'Share on Facebook.*?Share on Twitter', ("share on facebook",), None),  # Social media
+    ("share", r'Share via Email', ("share via email",), None),
+    ("share", r'Print this page', ("print this page",), None),
+    ("share", r'Advertisement', ("advertisement",), None),
+    ("related", r'Related Articles?:?', ("related article",), None),  # Own pass: with IGNORECASE it can run into a following "Share..."
+    ("to_eol", r'Tags?:.*', ("tag",), None),
+    ("to_eol", r'Published on:.*', ("published on:",), None),
+    ("to_eol", r'Updated on:.*', ("updated on:",), None),
+    ("brackets", r'\[.*?\]', ("[",), None),  # [Photo Gallery] etc
+    # Site-specific boilerplate
+    ("login", r'News\s*Sign\s*In', ("sign",), None),                        # Ekantipur login overlay
+    ("sign_in_line", r'(?:^|\n)\s*Sign\s*In\s*(?:\n|$)', ("sign",), None),                # Standalone "Sign In" line; own pass, it anchors on text the previous pass removes
+    ("chrome", r'Read\s*In\s*English', ("english",), None),                 # Ekantipur language toggle
+    ("chrome", r'Facebook\s+Messenger\s+Twitter\s+Whatsapp\s+Viber\s+Copy\s+Link', ("messenger",), None),  # Share bar
+    ("chrome", r'What you should know', ("what you should know",), None),  # Ekantipur section header
+    ("chrome", r'Your browser does not support the audio element\.?', ("your browser does not support",), None),  # HTML5 audio fallback
+    ("comments", r'\d+\s*Comments?\s*(?:Shares?)?', ("comment",), None),  # OnlineKhabar comment count
+    ("byline_pvt", r'Pvt\.\s+\w+[\w\s]+\d{1,2}\s+\w+\s+\d{4}\s+at\s+\d{1,2}:\d{2}', ("pvt.",), None),  # Author byline
+    ("byline_name", r'[A-Z][a-z]+\s+[A-Z][a-z]+\s+\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s+at\s+\d{1,2}:\d{2}', GREGORIAN_MONTHS, None),  # "Name Surname DD Month YYYY at HH:MM"
+    ("byline_falgun", r'Falgun\s+\d+,?\s+\d{4}\s+[A-Z][a-z]+\s+[A-Z][a-z]+', ("falgun",), None),  # "Falgun 8, 2082 Kedar Sivakoti"
+    ("source_tags", r'(?:Republica|Kantipur|OnlineKhabar|Setopati|Ratopati)\s+(?:Online|Media|Staff)', ("republica", "kantipur", "onlinekhabar", "setopati", "ratopati"), None),  # Source tags
+]
+
+_EXCESS_BLANK_LINES = re.compile(r'\n\s*\n+')
+
+# Characters IGNORECASE matches against ASCII letters that str.lower() leaves different
+# ("ſ" ~ s, "ı" ~ i, and the combining dot lower() produces from "İ"). Keyword checks are
+# turned off for text containing them so a pass is never skipped wrongly.
+_UNFOLDED = ("ſ", "ı", "̇")
+
+class JunkCleaner:
+    def __init__(self, patterns):
+        self.passes = []  # (compiled pattern, keywords)
+        group_name, group, keywords = None, [], set()
+        for name, pattern, needs, _ in patterns:
+            if name != group_name and group:
+                self.passes.append(self._compile(group, keywords))
+                group, keywords = [], set()
+            group_name = name
+            group.append(pattern)
+            keywords.update(needs)
+        if group:
+            self.passes.append(self._compile(group, keywords))
+
+    @staticmethod
+    def _compile(group, keywords):
+        return re.compile("|".join(f"(?:{p})" for p in group), re.IGNORECASE), tuple(sorted(keywords))
+
+    def clean(self, text):
+        lowered = text.lower()
+        check = not any(ch in lowered for ch in _UNFOLDED)
+        for pattern, keywords in self.passes:
+            if check and not any(k in lowered for k in keywords):
+                continue
+            text, removed = pattern.subn('', text)
+            if removed:
+                # Removal can join the surrounding text into a keyword for a later pass
+                lowered = text.lower()
+        # Remove excessive whitespace
+        text = _EXCESS_BLANK_LINES.sub('\n\n', text)
+        return text.strip()
+
+_cleaners = {}
+GLOBAL = ""  # _cleaners key of the cleaner with only the global patterns
+
+def get_cleaner(source_domain=None):
+    """
+    Cleaner with the shared patterns plus those registered for `source_domain`.
+    With no domain every pattern applies.
+    """
+    if source_domain not in _cleaners:
+        patterns = [
+            entry for entry in JUNK_PATTERNS
+            if source_domain is None or entry[3] is None or source_domain in entry[3]
+        ]
+        if source_domain is not None and all(entry[3] is None for entry in patterns):
+            # No additions for this site: share the cleaner of the global patterns
+            if GLOBAL not in _cleaners:
+                _cleaners[GLOBAL] = JunkCleaner(patterns)
+            _cleaners[source_domain] = _cleaners[GLOBAL]
+        else:
+            _cleaners[source_domain] = JunkCleaner(patterns)
+    return _cleaners[source_domain]
+
+def source_for_url(url):
+    """Map an article URL to the domain key used in JUNK_PATTERNS, or None if the site is unknown"""
+    host = urlparse(url or "").netloc.lower()
+    for *_, sources in JUNK_PATTERNS:
+        for domain in sources or ():
+            if host == domain or host.endswith("." + domain):
+                return domain
+    return host or None
+
+def clean_text(text, url=None):
+    return get_cleaner(source_for_url(url) if url else None).clean(text)
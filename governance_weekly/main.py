@@ -5,6 +5,10 @@ import sys
 import json
 import sqlite3
 import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Basic debug print
 print("DEBUG: Script starting", flush=True)
@@ -33,8 +37,10 @@ print("DEBUG: Imported Ratopati", flush=True)
 from scrapers.domain_scrapers.ukaalo import UkaaloScraper
 print("DEBUG: Imported Ukaalo", flush=True)
 from translator.translator import Translator
+from translator.worker import TranslationWorkerPool
+from database.translation_queue import TranslationQueue
 print("DEBUG: Imported Translator", flush=True)
-from classifier.classifier import Classifier
+from classifier.classifier import get_classifier
 print("DEBUG: Imported Classifier", flush=True)
 from reporting.summarizer import Summarizer
 print("DEBUG: Imported Summarizer", flush=True)
@@ -44,16 +50,30 @@ from reporting.drive_uploader import DriveUploader
 print("DEBUG: Imported Drive", flush=True)
 from config import Config
 print("DEBUG: Imported Config", flush=True)
-from utils.article_filter import filter_top_articles, get_category_distribution
+from scrapers.fetch_engine import get_fetch_engine, shutdown_fetch_engine
+from extractor.process_pool import shutdown_extraction_pool
+from scrapers.http_client import close_http_client
+from scrapers.discovery import report_discovery
+from utils.selenium_manager import close_driver
+from utils.article_filter import (
+    FEATURE_COLUMNS, FEATURES_VERSION, PASS_THRESHOLD, add_report_features, get_category_distribution,
+    select_top_articles,
+)
 print("DEBUG: Imported Article Filter", flush=True)
+from utils.title_index import TitleIndex
+from utils.language import contains_nepali
 
 logger = logging.getLogger("GovernanceWeekly")
 
-def has_nepali(text):
-    """Check if text contains Nepali Unicode characters"""
-    if not text:
-        return False
-    return any('\u0900' <= char <= '\u097F' for char in text)
+def _put_until_stopped(q, item, stop):
+    """Blocking put that gives up once `stop` is set, so producers never hang on a full queue"""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=1)
+            return True
+        except queue.Full:
+            continue
+    return False
 
 def setup():
     print("DEBUG: Inside setup", flush=True)
@@ -61,7 +81,12 @@ def setup():
     init_db()
     print("DEBUG: init_db done", flush=True)
 
-def collect(target_scraper=None):
+def collect(target_scraper=None, translate=True):
+    """
+    Scrape, filter and store new articles. Nepali articles are stored as pending_translation;
+    with translate=True a translation worker pool drains them while scraping runs, otherwise
+    they wait for `--mode translate`.
+    """
     print("DEBUG: Inside collect", flush=True)
     logger.info("Starting collection phase...")
     db_gen = get_db()
@@ -104,173 +129,239 @@ def collect(target_scraper=None):
     
     print(f"DEBUG: Init {len(scrapers)} scrapers", flush=True)
     
-    translator = Translator()
-    print("DEBUG: Init Translator", flush=True)
-    classifier = Classifier()
+    classifier = get_classifier()
     print("DEBUG: Init Classifier", flush=True)
+    translator = None
+    scraping_done = threading.Event()
+    if translate:
+        translator = Translator()
+        print("DEBUG: Init Translator", flush=True)
+        translation_pool = TranslationWorkerPool(translator, classifier)
+        translation_pool.start(scraping_done)
     
     total_new = 0
+    total_queued = 0
+    relabelled = 0  # Articles labelled 'ne' by their scraper but detected as English
+    
+    # Load stored URLs once so scrapers only fetch links we have not seen
+    known_urls = db.get_known_urls()
+    logger.info(f"Loaded {len(known_urls)} known article URLs")
+    for scraper in scrapers:
+        scraper.known_urls = known_urls
+        scraper.since, scraper.until = last_friday, today  # Feed links dated outside are never fetched
+    
+    title_index = TitleIndex()
+    title_index.sync(db)
+    
+    # Scrapers run concurrently, share one fetch engine (rate-limited per host) and stream
+    # each article into a bounded queue. The main thread takes them one at a time through
+    # date filter -> dedup -> classify -> insert, so rows land as pages arrive and at most
+    # STREAM_QUEUE_SIZE extracted articles are held in memory. Nepali articles skip
+    # classification and are inserted as pending_translation for the translation workers,
+    # so a slow translation backend never holds up scraping.
+    engine = get_fetch_engine()
+    article_queue = queue.Queue(maxsize=Config.STREAM_QUEUE_SIZE)
+    stop = threading.Event()
+    
+    def produce(scraper):
+        try:
+            for data in scraper.run(stream=True):
+                if not _put_until_stopped(article_queue, (scraper, data), stop):
+                    return
+        except Exception as e:
+            logger.error(f"Scraper {scraper.domain} failed: {e}")
+        finally:
+            _put_until_stopped(article_queue, (scraper, None), stop)  # End-of-stream marker
+    
+    scrape_pool = ThreadPoolExecutor(max_workers=len(scrapers), thread_name_prefix="scraper")
+    for scraper in scrapers:
+        scrape_pool.submit(produce, scraper)
+    remaining = len(scrapers)
+    started = time.monotonic()
+    first_insert_logged = False
+    
+    # Accepted rows are inserted with one executemany per batch: when DB_INSERT_BATCH rows are
+    # waiting, or as soon as no article is waiting in the queue (rows never sit while scrapers are slow)
+    batch = []
+    
+    def flush():
+        nonlocal total_new, total_queued, first_insert_logged
+        if not batch:
+            return
+        try:
+            # Report features for rows that are final; queued ones get them once translated
+            add_report_features([row for row in batch if row['status'] != TranslationQueue.PENDING])
+            inserted = db.insert_articles(batch)
+            db.commit()
+            title_index.commit()
+        except Exception as e:
+            logger.error(f"Failed to store {len(batch)} articles: {e}")
+            db.rollback()
+            title_index.rollback()
+            known_urls.difference_update(row['url'] for row in batch)
+        else:
+            total_new += inserted
+            total_queued += sum(row['status'] == TranslationQueue.PENDING for row in batch)
+            if not first_insert_logged:
+                logger.info(f"First article stored {time.monotonic() - started:.1f}s after collection started")
+                first_insert_logged = True
+        batch.clear()
     
     try:
-        for scraper in scrapers:
+        while remaining:
+            scraper, data = article_queue.get()
+            if data is None:
+                remaining -= 1
+                logger.info(f"Scraper {scraper.domain} finished ({remaining} still running)")
+                continue
             try:
-                articles = scraper.run()
-                for data in articles:
-                    # 1. Date filter - skip articles outside date range
-                    if data.get('published_at'):
-                        pub_date = data['published_at']
-                        # Convert to timezone-naive for comparison with last_friday (which is naive)
-                        if hasattr(pub_date, 'tzinfo') and pub_date.tzinfo is not None:
-                            pub_date = pub_date.replace(tzinfo=None)
-                        
-                        if pub_date < last_friday or pub_date > today:
-                            logger.debug(f"Skipping article outside date range: {data.get('title', 'No title')[:50]} (published: {pub_date})")
-                            continue
-                    else:
-                        # No published_at date - skip article (can't verify it's within range)
-                        logger.debug(f"Skipping article with no date: {data.get('title', 'No title')[:50]}")
-                        continue
+                # 1. Date filter - skip articles outside date range
+                if data.get('published_at'):
+                    pub_date = data['published_at']
+                    # Convert to timezone-naive for comparison with last_friday (which is naive)
+                    if hasattr(pub_date, 'tzinfo') and pub_date.tzinfo is not None:
+                        pub_date = pub_date.replace(tzinfo=None)
                     
-                    # 2. Deduplication check by URL
-                    db.cursor.execute("SELECT 1 FROM articles WHERE url = ?", (data['url'],))
-                    if db.cursor.fetchone():
+                    if pub_date < last_friday or pub_date > today:
+                        logger.debug(f"Skipping article outside date range: {data.get('title', 'No title')[:50]} (published: {pub_date})")
                         continue
+                else:
+                    # No published_at date - skip article (can't verify it's within range)
+                    logger.debug(f"Skipping article with no date: {data.get('title', 'No title')[:50]}")
+                    continue
+                
+                # 2. Deduplication check by URL (stored, batched, or seen earlier this run)
+                if data['url'] in known_urls:
+                    continue
+                
+                # 3. Deduplication check by title similarity (catch same news from different sources)
+                # LSH index picks candidates; only those get the exact 85% SequenceMatcher check
+                title_to_check = data.get('title', '').strip()
+                if title_to_check and title_index.find_similar(title_to_check):
+                    logger.debug(f"Skipping duplicate by title: {title_to_check[:50]}")
+                    continue
+                
+                # 4. Filter out opinion/commentary content by URL and title patterns
+                url_lower = data['url'].lower()
+                title_lower = data.get('title', '').lower()
+                
+                opinion_patterns = [
+                    '/opinion/', '/editorial/', '/commentary/', '/column/',
+                    '/interview/', '/op-ed/', '/blog/', '/viewpoint/',
+                    'opinion', 'editorial', 'commentary', 'interview',
+                    'exclusive interview', 'in conversation', 'my view'
+                ]
+                
+                if any(pattern in url_lower or pattern in title_lower for pattern in opinion_patterns):
+                    logger.info(f"Skipping opinion/interview content: {data['title']}")
+                    continue
+                
+                # 5. Nepali content goes to the translation queue; the workers translate,
+                # summarize and classify it (translator/worker.py). Scrapers label whole
+                # sites, so the language is detected per paragraph from the script instead;
+                # the translator then sends only the Devanagari paragraphs.
+                needs_translation = contains_nepali(data.get('title', '')) or contains_nepali(data.get('full_text', ''))
+                detected = 'ne' if needs_translation else 'en'
+                if data.get('language') == 'ne' and detected == 'en':
+                    relabelled += 1
+                    logger.debug(f"Detected English content on a Nepali site: {data['url']}")
+                data['language'] = detected
+                
+                if needs_translation:
+                    data['title_translated'] = None
+                    data['full_text_translated'] = None
+                    summary_text, cats_json, relevance = None, None, None
+                    status = TranslationQueue.PENDING
+                else:
+                    data['title_translated'] = data['title']
+                    data['full_text_translated'] = data['full_text']
                     
-                    # 3. Deduplication check by title similarity (catch same news from different sources)
-                    title_to_check = data.get('title', '').strip()
-                    if title_to_check:
-                        db.cursor.execute("SELECT title_original FROM articles")
-                        existing_titles = [row[0] for row in db.cursor.fetchall()]
-                        
-                        from difflib import SequenceMatcher
-                        for existing_title in existing_titles:
-                            similarity = SequenceMatcher(None, title_to_check.lower(), existing_title.lower()).ratio()
-                            if similarity >= 0.85:  # 85% similar titles = duplicate
-                                logger.debug(f"Skipping duplicate by title: {title_to_check[:50]}")
-                                continue
-                    
-                    # 4. Filter out opinion/commentary content by URL and title patterns
-                    url_lower = data['url'].lower()
-                    title_lower = data.get('title', '').lower()
-                    
-                    opinion_patterns = [
-                        '/opinion/', '/editorial/', '/commentary/', '/column/',
-                        '/interview/', '/op-ed/', '/blog/', '/viewpoint/',
-                        'opinion', 'editorial', 'commentary', 'interview',
-                        'exclusive interview', 'in conversation', 'my view'
-                    ]
-                    
-                    if any(pattern in url_lower or pattern in title_lower for pattern in opinion_patterns):
-                        logger.info(f"Skipping opinion/interview content: {data['title']}")
-                        continue
-                    
-                    # 5. Translation - ensure Nepali content is properly translated
-                    # Check both title and full_text for Nepali characters
-                    needs_translation = (
-                        data.get('language') == 'ne' or 
-                        has_nepali(data.get('title', '')) or 
-                        has_nepali(data.get('full_text', ''))
-                    )
-                    
-                    if needs_translation:
-                        # Translate title
-                        try:
-                            trans_title = translator.translate(data['title'], source_lang='ne', target_lang='en')
-                            # If translation returns original Nepali (and it was Nepali), mark as failed
-                            if has_nepali(trans_title) and has_nepali(data['title']):
-                                data['title_translated'] = "[Translation Failed]"
-                            else:
-                                data['title_translated'] = trans_title
-                        except Exception as e:
-                            logger.warning(f"Title translation failed for {data['url']}: {e}")
-                            data['title_translated'] = "[Translation Failed]"
-                        
-                        # Small delay to avoid rate limiting
-                        import time
-                        time.sleep(0.5)
-                        
-                        # Translate full text (chunk if needed)
-                        try:
-                            full_text = data.get('full_text', '')
-                            if len(full_text) > 4000:
-                                # Chunk large text
-                                chunks = [full_text[i:i+4000] for i in range(0, len(full_text), 4000)]
-                                translated_chunks = []
-                                for chunk in chunks:
-                                    trans_chunk = translator.translate(chunk, source_lang='ne', target_lang='en')
-                                    translated_chunks.append(trans_chunk)
-                                    time.sleep(0.5)  # Delay between chunks
-                                data['full_text_translated'] = ' '.join(translated_chunks)
-                            else:
-                                data['full_text_translated'] = translator.translate(full_text, source_lang='ne', target_lang='en')
-                                
-                            # Check if full text translation failed (still contains Nepali)
-                            if has_nepali(data['full_text_translated']) and has_nepali(full_text):
-                                logger.warning(f"Full text translation returned Nepali for {data['url']}")
-                                # Try to keep what we have or mark failed? 
-                                # If it's mostly Nepali, it's useless for summary.
-                                # But maybe some parts translated.
-                                pass 
-                        except Exception as e:
-                            logger.warning(f"Text translation failed for {data['url']}: {e}")
-                            data['full_text_translated'] = "" # Empty better than blocks
-                    else:
-                        data['title_translated'] = data['title']
-                        data['full_text_translated'] = data['full_text']
-                    
-                    # 6. Generate summary from translated text (for English summaries)
+                    # 6. Generate summary (English articles)
                     summary_text = ""
                     if data.get('full_text_translated'):
                         temp_summarizer = Summarizer()
                         summary_text = temp_summarizer.summarize(data['full_text_translated'])
                     
-                    # 7. Classification
-                    text_for_class = (data.get('title_translated') or "") + "\n" + (data.get('full_text_translated') or "")
-                    classification = classifier.classify(text_for_class)
+                    # 7. Classification (already done by the extraction workers when EXTRACT_WORKERS > 0)
+                    classification = data.get('classification')
+                    if classification is None:
+                        text_for_class = (data.get('title_translated') or "") + "\n" + (data.get('full_text_translated') or "")
+                        classification = classifier.classify(text_for_class)
                     
                     # Skip if excluded (opinion/commentary detected by classifier)
                     if classification.get('is_excluded'):
                         logger.info(f"Skipping excluded content: {data['title']}")
                         continue
-                        
-                    # Insert
+                    
                     # Serialize complex types
                     cats_json = json.dumps(classification['categories'])
+                    relevance = classification['relevance_score']
+                    status = "pending_review"
                     
-                    db.cursor.execute("""
-                        INSERT INTO articles (
-                            url, source_domain, title_original, full_text_original, 
-                            published_at, fetched_at, language, 
-                            title_translated, full_text_translated, summary,
-                            categories, relevance_score, raw_html, status
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        data['url'],
-                        data['source_domain'],
-                        data['title'],
-                        data['full_text'],
-                        data.get('published_at').isoformat() if data.get('published_at') else None,
-                        datetime.now(timezone.utc).isoformat(),
-                        data.get('language', 'ne'),
-                        data['title_translated'],
-                        data['full_text_translated'],
-                        summary_text,
-                        cats_json,
-                        classification['relevance_score'],
-                        data.get('raw_html'),
-                        "pending_review"
-                    ))
-                    
-                    total_new += 1
-                    
-                db.commit()
+                # Insert (batched)
+                batch.append({
+                    'url': data['url'],
+                    'source_domain': data['source_domain'],
+                    'title_original': data['title'],
+                    'full_text_original': data['full_text'],
+                    'published_at': data.get('published_at').isoformat() if data.get('published_at') else None,
+                    'fetched_at': datetime.now(timezone.utc).isoformat(),
+                    'language': data.get('language', 'ne'),
+                    'title_translated': data['title_translated'],
+                    'full_text_translated': data['full_text_translated'],
+                    'summary': summary_text,
+                    'categories': cats_json,
+                    'relevance_score': relevance,
+                    'raw_html': data.get('raw_html'),
+                    'status': status,
+                })
+                known_urls.add(data['url'])
+                title_index.add(data['title'])
+                if len(batch) >= Config.DB_INSERT_BATCH or article_queue.empty():
+                    flush()
             except Exception as e:
-                logger.error(f"Scraper {scraper.domain} failed: {e}")
-                db.rollback()
+                logger.error(f"Failed to process {data.get('url')} from {scraper.domain}: {e}")
     finally:
+        flush()
+        stop.set()
+        scrape_pool.shutdown(wait=True)
+        title_index.close()
         db.close()
+        engine.report()
+        report_discovery()
+        shutdown_fetch_engine()
+        close_driver()
+        shutdown_extraction_pool()
+        close_http_client()
+        if translator:
+            # Scraping is over: the workers drain what is left of the queue, then exit
+            logger.info("Scraping finished, waiting for translation workers...")
+            scraping_done.set()
+            translation_pool.wait()
+            translation_pool.report()
+            translator.close()
 
-    logger.info(f"Collection complete. New articles: {total_new}")
+    logger.info(f"Collection complete. New articles: {total_new} ({total_queued} queued for translation, "
+                f"{relabelled} labelled Nepali but detected as English and not translated)")
+
+def translate_pending(follow=False):
+    """
+    Drain the translation queue (`--mode translate`). Safe to run next to a collection
+    process, or several at once: articles are leased, so each is translated once, and
+    leases left by a crashed run expire and are picked up again.
+    With follow=True keep waiting for new articles until interrupted.
+    """
+    logger.info("Starting translation phase...")
+    translator = Translator()
+    pool = TranslationWorkerPool(translator, get_classifier())
+    done = threading.Event()
+    if not follow:
+        done.set()
+    try:
+        pool.run(done)
+    finally:
+        pool.report()
+        translator.close()
 
 def summarize_and_report():
     logger.info("Starting reporting phase...")
@@ -288,70 +379,65 @@ def summarize_and_report():
         last_friday = today - timedelta(days=days_since_friday)
         last_friday = last_friday.replace(hour=0, minute=0, second=0, microsecond=0)
         
-        db.cursor.execute("SELECT * FROM articles WHERE fetched_at >= ?", (last_friday,))
-        rows = db.cursor.fetchall()
-        
-        items_by_category = {}
-        all_articles = []
-        
-        for row in rows:
-            # Row to dict
-            row_dict = dict(row)
-            
-            # Generate summary if missing
-            if not row_dict.get('summary'):
-                text_to_sum = row_dict.get('full_text_translated') or row_dict.get('full_text_original') or ""
-                summary_text = summarizer.summarize(text_to_sum)
-                
-                # Update DB
-                db.cursor.execute("UPDATE articles SET summary = ? WHERE url = ?", (summary_text, row_dict['url']))
-                row_dict['summary'] = summary_text
-            
-            # Helper to parse json categories
-            try:
-                cats = json.loads(row_dict.get('categories') or "[]")
-            except:
-                cats = []
-            
-            # Skip if no relevant categories (exclude Uncategorized)
-            if not cats:
-                continue
-                
-            relevance = row_dict.get('relevance_score', 0)
-            
-            article_data = {
-                'title_translated': row_dict.get('title_translated'),
-                'title_original': row_dict.get('title_original'),
-                'summary': row_dict.get('summary'),
-                'source_domain': row_dict.get('source_domain'),
-                'published_at': str(row_dict.get('published_at')),
-                'url': row_dict.get('url'),
-                'categories': cats,
-                'relevance_score': relevance
-            }
-            all_articles.append(article_data)
+        # Articles still in the translation queue (or excluded after translation) are left out
+        window = ("fetched_at >= ? AND COALESCE(status, '') NOT IN "
+                  "('pending_translation', 'translation_failed', 'excluded')")
+        db.cursor.execute("SELECT COUNT(*) FROM articles WHERE status = 'pending_translation'")
+        pending = db.cursor.fetchone()[0]
+        if pending:
+            logger.warning(f"{pending} articles are still waiting for translation (run --mode translate)")
         
-        logger.info(f"Total articles before filtering: {len(all_articles)}")
+        # Report features are stored with each article when it is inserted or translated.
+        # Only rows without them (stored by older versions, or scored with other keywords or
+        # weights) and rows still missing a summary are summarized and scored here.
+        started = time.perf_counter()
+        db.cursor.execute(
+            "SELECT url, title_translated, title_original, summary, categories, relevance_score "
+            f"FROM articles WHERE {window} AND (summary IS NULL OR features_version IS NOT ?)",
+            (last_friday, FEATURES_VERSION)
+        )
+        stale = [dict(row) for row in db.cursor.fetchall()]
+        summarized = 0
+        for row in stale:
+            if row['summary'] is None:
+                db.cursor.execute("SELECT full_text_translated, full_text_original FROM articles WHERE url = ?",
+                                  (row['url'],))
+                texts = db.cursor.fetchone()
+                row['summary'] = summarizer.summarize(texts['full_text_translated'] or texts['full_text_original'] or "")
+                summarized += 1
+        add_report_features(stale)
+        db.update_articles(stale, ("summary",) + FEATURE_COLUMNS)
+        db.commit()
+        refreshed = time.perf_counter() - started
         
-        # Apply smart filtering to get top most impactful articles
-        # Configurable via MAX_ARTICLES_IN_REPORT and MIN_IMPACT_SCORE in .env
-        # This includes:
-        # - Content-based deduplication (similar articles from different sources)
-        # - Impact scoring (category priority + relevance + content depth)
-        # - Quality threshold filtering
-        top_articles = filter_top_articles(
-            all_articles, 
-            max_articles=Config.MAX_ARTICLES_IN_REPORT, 
+        # Rank: idx_articles_report_rank (impact_score first) yields candidates in descending
+        # impact order without sorting the week, and dedup reads only until
+        # MAX_ARTICLES_IN_REPORT are kept (configurable with MIN_IMPACT_SCORE in .env)
+        started = time.perf_counter()
+        db.cursor.execute(
+            "SELECT url, title_translated, title_original, summary, source_domain, published_at, categories, "
+            "relevance_score, impact_score, title_fingerprint, summary_fingerprint "
+            f"FROM articles WHERE {window} AND report_excluded = 0 AND weighted_score >= ? AND impact_score >= ? "
+            "ORDER BY impact_score DESC",
+            (last_friday, PASS_THRESHOLD, Config.MIN_IMPACT_SCORE)
+        )
+        top_articles = select_top_articles(
+            (dict(row) for row in db.cursor),
+            max_articles=Config.MAX_ARTICLES_IN_REPORT,
             min_impact_score=Config.MIN_IMPACT_SCORE
         )
-        
-        logger.info(f"Top articles after filtering: {len(top_articles)}")
+        for article in top_articles:
+            article['categories'] = json.loads(article['categories'] or "[]")
+            article['published_at'] = str(article['published_at'])
+        logger.info(f"Report features refreshed for {len(stale)} articles ({summarized} summarized) "
+                    f"in {refreshed:.2f}s; top {len(top_articles)} articles ranked in {time.perf_counter() - started:.3f}s")
         
         # Log category distribution
         category_dist = get_category_distribution(top_articles)
         logger.info(f"Category distribution: {category_dist}")
         
         # Group by category (ensure each article appears only once)
+        items_by_category = {}
         seen_urls = set()
         for article in top_articles:
             # Skip if already added to another category
@@ -376,8 +462,6 @@ def summarize_and_report():
                     'relevance_score': article['relevance_score'],
                     'impact_score': article['impact_score']
                 })
-                
-        db.commit()
         
         # Generate PDF
         filename = f"GovernanceWeekly_{datetime.now().strftime('%Y%m%d')}.pdf"
@@ -391,23 +475,44 @@ def summarize_and_report():
     finally:
         db.close()
 
+def compact_db():
+    """Reclaim free space in the database file (`--mode compact`); run while nothing else uses it"""
+    db_gen = get_db()
+    db = next(db_gen)
+    try:
+        db.compact()
+    finally:
+        db.close()
+
 def main():
     parser = argparse.ArgumentParser(description="Governance Weekly Pipeline")
-    parser.add_argument("--mode", choices=["collect", "summarize", "force", "export-for-review"], required=True)
+    parser.add_argument("--mode", choices=["collect", "translate", "summarize", "force", "export-for-review", "compact"], required=True)
     parser.add_argument("--scraper", help="Run specific scraper (e.g. 'onlinekhabar')", default=None)
+    parser.add_argument("--no-translate", action="store_true",
+                        help="collect: leave Nepali articles queued for a separate --mode translate process")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="collect: processes for page extraction + classification (default EXTRACT_WORKERS)")
+    parser.add_argument("--follow", action="store_true",
+                        help="translate: keep waiting for newly queued articles until interrupted")
     args = parser.parse_args()
+    if args.workers is not None:
+        Config.EXTRACT_WORKERS = args.workers
     
     setup()
     
     if args.mode == "collect":
-        collect(target_scraper=args.scraper)
+        collect(target_scraper=args.scraper, translate=not args.no_translate)
+    elif args.mode == "translate":
+        translate_pending(follow=args.follow)
     elif args.mode == "summarize":
         summarize_and_report()
     elif args.mode == "force":
-        collect(target_scraper=args.scraper)
+        collect(target_scraper=args.scraper, translate=not args.no_translate)
         summarize_and_report()
     elif args.mode == "export-for-review":
         print("Export feature pending implementation.")
+    elif args.mode == "compact":
+        compact_db()
 
 if __name__ == "__main__":
     main()
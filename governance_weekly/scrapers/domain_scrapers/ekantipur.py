@@ -1,27 +1,21 @@
 print("DEBUG: Importing BaseScraper", flush=True)
 from scrapers.base_scraper import BaseScraper
-print("DEBUG: Importing Extractor", flush=True)
-from extractor.article_extractor import extract_article
-print("DEBUG: Extractor Imported", flush=True)
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 class EkantipurScraper(BaseScraper):
+    FEEDS = ("/rss",)
+
     def __init__(self):
         super().__init__("https://ekantipur.com", "ekantipur.com")
 
-    def run(self):
+    def run(self, stream=False):
         logger.info(f"Starting scrape for {self.domain}")
         
-        # 1. Fetch Homepage
-        homepage_html = self.fetch(self.base_url)
-        if not homepage_html:
-            return []
-            
-        # 2. Extract Links
-        links = self.extract_links(homepage_html)
+        # Sitemap/RSS links (already limited to the collection window), or the homepage's
+        links = self.candidate_links()
         
         # Filter by current year only
         today = datetime.now()
@@ -34,18 +28,7 @@ class EkantipurScraper(BaseScraper):
         article_links = [l for l in article_links if not any(x in l.lower() for x in ['/opinion/', '/blog/', '/column/', '/interview/', '/editorial/'])]
         
         # Limit
-        article_links = list(article_links)[:self.max_articles]
+        article_links = self.filter_new_links(article_links)[:self.max_articles]
         logger.info(f"Found {len(article_links)} potential articles")
         
-        results = []
-        for link in article_links:
-            html = self.fetch(link)
-            if html:
-                data = extract_article(html, link)
-                if data and data['title']:
-                    data['url'] = link
-                    data['source_domain'] = self.domain
-                    data['language'] = 'ne' # Default for Ekantipur
-                    results.append(data)
-            
-        return results
+        return self.fetch_articles(article_links, language='ne', stream=stream)  # Default for Ekantipur
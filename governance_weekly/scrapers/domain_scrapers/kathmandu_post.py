@@ -1,22 +1,21 @@
 from scrapers.base_scraper import BaseScraper
-from extractor.article_extractor import extract_article
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 class KathmanduPostScraper(BaseScraper):
+    FEEDS = ("/rss",)
+    NEEDS_JS = True  # Article pages render their content with JS
+
     def __init__(self):
         super().__init__("https://kathmandupost.com", "kathmandupost.com")
 
-    def run(self):
+    def run(self, stream=False):
         logger.info(f"Starting scrape for {self.domain}")
         
-        homepage_html = self.fetch(self.base_url)
-        if not homepage_html:
-            return []
-            
-        links = self.extract_links(homepage_html)
+        # Sitemap/RSS links (already limited to the collection window), or the homepage's
+        links = self.candidate_links()
         
         # Filter by current year only
         today = datetime.now()
@@ -28,17 +27,6 @@ class KathmanduPostScraper(BaseScraper):
         # Exclude opinion/blog/column/interview URLs
         article_links = [l for l in article_links if not any(x in l.lower() for x in ['/opinion/', '/blog/', '/column/', '/interview/', '/editorial/', '/perspective/'])]
         
-        article_links = list(article_links)[:self.max_articles]
+        article_links = self.filter_new_links(article_links)[:self.max_articles]
         
-        results = []
-        for link in article_links:
-            html = self.fetch(link, use_selenium=True)  # KP requires JS rendering
-            if html:
-                data = extract_article(html, link)
-                if data and data['title']:
-                    data['url'] = link
-                    data['source_domain'] = self.domain
-                    data['language'] = 'en' # KP is English
-                    results.append(data)
-                    
-        return results
+        return self.fetch_articles(article_links, language='en', stream=stream)  # Rendered in the browser pool (NEEDS_JS)
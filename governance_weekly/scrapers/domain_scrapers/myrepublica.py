@@ -1,5 +1,4 @@
 from scrapers.base_scraper import BaseScraper
-from extractor.article_extractor import extract_article
 import logging
 from datetime import datetime
 import re
@@ -7,17 +6,16 @@ import re
 logger = logging.getLogger(__name__)
 
 class MyRepublicaScraper(BaseScraper):
+    FEEDS = ("/rss",)
+
     def __init__(self):
         super().__init__("https://myrepublica.nagariknetwork.com", "myrepublica.nagariknetwork.com")
 
-    def run(self):
+    def run(self, stream=False):
         logger.info(f"Starting scrape for {self.domain}")
         
-        homepage_html = self.fetch(self.base_url)
-        if not homepage_html:
-            return []
-            
-        links = self.extract_links(homepage_html)
+        # Sitemap/RSS links (already limited to the collection window), or the homepage's
+        links = self.candidate_links()
         
         # Filter by current year (check for year pattern in URL)
         today = datetime.now()
@@ -29,18 +27,7 @@ class MyRepublicaScraper(BaseScraper):
         # Exclude opinion/blog/column/interview URLs
         article_links = [l for l in article_links if not any(x in l.lower() for x in ['/opinion/', '/blog/', '/column/', '/interview/', '/editorial/', '/perspective/', '/commentary/'])]
         
-        article_links = list(article_links)[:self.max_articles]
+        article_links = self.filter_new_links(article_links)[:self.max_articles]
         logger.info(f"Found {len(article_links)} potential articles")
         
-        results = []
-        for link in article_links:
-            html = self.fetch(link)
-            if html:
-                data = extract_article(html, link)
-                if data and data['title']:
-                    data['url'] = link
-                    data['source_domain'] = self.domain
-                    data['language'] = 'en'  # MyRepublica is English
-                    results.append(data)
-            
-        return results
+        return self.fetch_articles(article_links, language='en', stream=stream)  # MyRepublica is English
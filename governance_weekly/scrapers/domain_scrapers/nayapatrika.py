@@ -1,22 +1,20 @@
 from scrapers.base_scraper import BaseScraper
-from extractor.article_extractor import extract_article
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 class NayapatrikaScraper(BaseScraper):
+    FEEDS = ("/rss",)
+
     def __init__(self):
         super().__init__("https://nayapatrikadaily.com", "nayapatrikadaily.com")
 
-    def run(self):
+    def run(self, stream=False):
         logger.info(f"Starting scrape for {self.domain}")
         
-        homepage_html = self.fetch(self.base_url)
-        if not homepage_html:
-            return []
-            
-        links = self.extract_links(homepage_html)
+        # Sitemap/RSS links (already limited to the collection window), or the homepage's
+        links = self.candidate_links()
         
         # Filter by current year
         today = datetime.now()
@@ -28,18 +26,7 @@ class NayapatrikaScraper(BaseScraper):
         # Exclude opinion/blog/column/interview URLs
         article_links = [l for l in article_links if not any(x in l.lower() for x in ['/opinion/', '/blog/', '/column/', '/interview/', '/editorial/', '/bichar/'])]
         
-        article_links = list(article_links)[:self.max_articles]
+        article_links = self.filter_new_links(article_links)[:self.max_articles]
         logger.info(f"Found {len(article_links)} potential articles")
         
-        results = []
-        for link in article_links:
-            html = self.fetch(link)
-            if html:
-                data = extract_article(html, link)
-                if data and data['title']:
-                    data['url'] = link
-                    data['source_domain'] = self.domain
-                    data['language'] = 'ne'  # Nayapatrika is Nepali
-                    results.append(data)
-            
-        return results
+        return self.fetch_articles(article_links, language='ne', stream=stream)  # Nayapatrika is Nepali
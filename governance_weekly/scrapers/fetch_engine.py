@@ -0,0 +1,141 @@
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from urllib.parse import urlparse
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+def host_of(url):
+    return urlparse(url).netloc.lower()
+
+class HostRateLimiter:
+    """
+    Per-host politeness limiter.
+    Each host gets one request slot every `interval` seconds; different hosts never wait on each other.
+    """
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host):
+        # Reserve the slot under the lock, sleep outside it so other hosts are not blocked
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+class HostStats:
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.not_modified = 0
+        self.bytes = 0
+        self.latency = 0.0
+        self.first_at = None
+        self.last_at = None
+
+    def add(self, nbytes, elapsed, ok, not_modified=False):
+        now = time.monotonic()
+        if self.first_at is None:
+            self.first_at = now - elapsed
+        self.last_at = now
+        self.requests += 1
+        self.latency += elapsed
+        if not_modified:
+            self.not_modified += 1
+        if ok:
+            self.bytes += nbytes
+        else:
+            self.failures += 1
+
+class FetchEngine:
+    """
+    Shared thread pool used by all domain scrapers.
+    Pages from different hosts download in parallel while RATE_LIMIT_SEC still applies per host.
+    """
+    def __init__(self, max_workers=None, per_host=None, rate_limit=None):
+        self.max_workers = max_workers or Config.FETCH_WORKERS
+        self.per_host = per_host or Config.FETCH_PER_HOST
+        self.limiter = HostRateLimiter(Config.RATE_LIMIT_SEC if rate_limit is None else rate_limit)
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fetch")
+        self.started_at = time.monotonic()
+
+    def throttle(self, url):
+        self.limiter.wait(host_of(url))
+
+    def record(self, url, nbytes, elapsed, ok, not_modified=False):
+        host = host_of(url)
+        with self._stats_lock:
+            self.stats.setdefault(host, HostStats()).add(nbytes, elapsed, ok, not_modified)
+
+    def map(self, fn, urls):
+        """
+        Run fn(url) on the pool and yield (url, result) as each one finishes.
+        Only `per_host` calls are in flight per caller, so one site's backlog
+        cannot occupy every worker while it waits for its rate-limit slot.
+        """
+        url_iter = iter(urls)
+        pending = {}
+        for url in islice(url_iter, self.per_host):
+            pending[self._executor.submit(fn, url)] = url
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = pending.pop(future)
+                for next_url in islice(url_iter, 1):
+                    pending[self._executor.submit(fn, next_url)] = next_url
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Fetch task failed for {url}: {e}")
+                    result = None
+                yield url, result
+
+    def report(self):
+        """Log wall-clock time and per-host throughput for this run"""
+        wall = time.monotonic() - self.started_at
+        with self._stats_lock:
+            stats = dict(self.stats)
+        total = sum(s.requests for s in stats.values())
+        logger.info(f"Fetch engine: {total} requests in {wall:.1f}s wall-clock ({total / wall if wall else 0:.2f} req/s overall)")
+        for host, s in sorted(stats.items()):
+            span = (s.last_at - s.first_at) if s.requests > 1 else s.latency
+            rate = s.requests / span if span else 0.0
+            avg = s.latency / s.requests if s.requests else 0.0
+            logger.info(
+                f"  {host}: {s.requests} requests, {s.failures} failed, "
+                f"{s.not_modified} not modified, {s.bytes / 1024 / 1024:.2f} MB, {rate:.2f} req/s, avg latency {avg:.2f}s"
+            )
+        return {"wall_clock": wall, "hosts": stats}
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+_engine_instance = None
+_engine_lock = threading.Lock()
+
+def get_fetch_engine():
+    """
+    Returns the process-wide FetchEngine shared by all scrapers.
+    """
+    global _engine_instance
+    with _engine_lock:
+        if _engine_instance is None:
+            _engine_instance = FetchEngine()
+        return _engine_instance
+
+def shutdown_fetch_engine():
+    global _engine_instance
+    with _engine_lock:
+        if _engine_instance:
+            _engine_instance.shutdown()
+            _engine_instance = None
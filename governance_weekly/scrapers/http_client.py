@@ -0,0 +1,161 @@
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from config import Config
+from scrapers.fetch_engine import host_of
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli  # noqa: F401  (urllib3 decodes "br" only when this is installed)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+class ConditionalCache:
+    """
+    On-disk ETag / Last-Modified store.
+    Keeps the validators and a compressed copy of the body so a 304 can be served locally.
+    """
+    def __init__(self, path, max_age_days=None):
+        self.path = path
+        self.max_age_days = Config.HTTP_CACHE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB,
+                stored_at REAL
+            )
+        ''')
+        self.prune()
+
+    def prune(self):
+        cutoff = time.time() - self.max_age_days * 86400
+        with self._lock:
+            self.conn.execute("DELETE FROM http_cache WHERE stored_at < ?", (cutoff,))
+            self.conn.commit()
+
+    def lookup(self, url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, body FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+        if not row:
+            return None
+        etag, last_modified, body = row
+        return etag, last_modified, zlib.decompress(body).decode("utf-8")
+
+    def store(self, url, etag, last_modified, text):
+        body = zlib.compress(text.encode("utf-8"))
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, time.time())
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+class HttpClient:
+    """
+    One pooled keep-alive requests.Session per host, with compression and conditional GETs.
+    """
+    TIMEOUT = 15
+
+    def __init__(self, cache_path=Config.HTTP_CACHE_PATH):
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.cache_path = cache_path
+        self._cache = None
+
+    @property
+    def cache(self):
+        # Opened on first request so constructing scrapers has no disk side effects
+        if self._cache is None and self.cache_path:
+            with self._lock:
+                if self._cache is None:
+                    self._cache = ConditionalCache(self.cache_path)
+        return self._cache
+
+    def session_for(self, url):
+        host = host_of(url)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=Config.FETCH_PER_HOST + 1)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({
+                    "User-Agent": Config.USER_AGENT,
+                    "Accept-Encoding": ACCEPT_ENCODING,
+                    "Connection": "keep-alive",
+                })
+                self._sessions[host] = session
+            return session
+
+    def get(self, url):
+        """
+        Returns (text, not_modified).
+        not_modified is True when the server answered 304 and the cached body was used.
+        """
+        headers = {}
+        cached = self.cache.lookup(url) if self.cache else None
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        r = self.session_for(url).get(url, headers=headers, timeout=self.TIMEOUT)
+        if r.status_code == 304 and cached:
+            return cached[2], True
+        r.raise_for_status()
+        text = r.text
+
+        if self.cache:
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.cache.store(url, etag, last_modified, text)
+        return text, False
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+        if self._cache:
+            self._cache.close()
+            self._cache = None
+
+_client_instance = None
+_client_lock = threading.Lock()
+
+def get_http_client():
+    """
+    Returns the process-wide HttpClient shared by all scrapers.
+    """
+    global _client_instance
+    with _client_lock:
+        if _client_instance is None:
+            _client_instance = HttpClient()
+        return _client_instance
+
+def close_http_client():
+    global _client_instance
+    with _client_lock:
+        if _client_instance:
+            _client_instance.close()
+            _client_instance = None
@@ -0,0 +1,111 @@
+import copy
+import json
+import os
+import unittest
+from unittest.mock import patch
+import utils.article_filter as article_filter
+from utils.article_filter import (
+    FEATURES_VERSION, PASS_THRESHOLD, add_report_features, by_impact, calculate_similarity, filter_top_articles,
+    fingerprints, is_duplicate, report_features, select_top_articles,
+)
+from utils.dedup import EXACT_SCAN_MAX, DuplicateIndex
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "report_dedup_cases.json")
+
+ARTICLES = [
+    {"url": "https://example.com/1", "title_translated": "Election Commission publishes final voter list for March 5 election",
+     "summary": "The Election Commission published the final voter list and candidate nomination schedule for the "
+                "House of Representatives election.", "categories": ["Election"], "relevance_score": 8},
+    {"url": "https://example.com/2", "title_translated": "Election Commission publishes final voter list for March 5 elections",
+     "summary": "The final voter list and the candidate nomination schedule were published by the Election Commission.",
+     "categories": ["Election"], "relevance_score": 7},
+    {"url": "https://example.com/3", "title_translated": "Parliament passes bill on local government election code of conduct",
+     "summary": "Parliament endorsed the election code of conduct bill; political parties and candidates must follow it.",
+     "categories": ["Governance", "Election"], "relevance_score": 6},
+    {"url": "https://example.com/4", "title_translated": "Cricket team wins series",
+     "summary": "Nepal won the cricket series.", "categories": ["Election"], "relevance_score": 9},
+    {"url": "https://example.com/5", "title_translated": "Election Commission meets political parties on voter education",
+     "summary": None, "categories": [], "relevance_score": None},
+]
+
+class TestArticleFilter(unittest.TestCase):
+    def test_stored_features_rank_like_filter(self):
+        expected = [a["url"] for a in filter_top_articles(copy.deepcopy(ARTICLES), max_articles=10, min_impact_score=0)]
+        self.assertTrue(expected)
+
+        # What the report does: features stored per article, then a query and top-K
+        stored = add_report_features(copy.deepcopy(ARTICLES))
+        candidates = sorted((a for a in stored if not a["report_excluded"] and a["weighted_score"] >= PASS_THRESHOLD),
+                            key=lambda a: a["impact_score"], reverse=True)
+        top = select_top_articles(candidates, max_articles=10, min_impact_score=0)
+        self.assertEqual([a["url"] for a in top], expected)
+        self.assertNotIn("https://example.com/2", expected)  # Same story as /1
+
+    def test_features(self):
+        features = report_features([dict(ARTICLES[4], categories='["Election"]'), ARTICLES[4]])
+        self.assertEqual(features[0]["report_excluded"], 0)  # JSON categories from the database
+        self.assertEqual(features[1]["report_excluded"], 1)  # No report category
+        self.assertEqual(features[0]["title_fingerprint"], "election commission meets political parties on voter education")
+        self.assertEqual(features[0]["summary_fingerprint"], "")
+        self.assertEqual(features[0]["features_version"], FEATURES_VERSION)
+
+    def test_fingerprints_match_text_similarity(self):
+        a, b = copy.deepcopy(ARTICLES[0]), copy.deepcopy(ARTICLES[1])
+        self.assertGreater(calculate_similarity(a["title_translated"], b["title_translated"]), 0.9)
+        self.assertTrue(is_duplicate(a, [b]))
+        add_report_features([a, b])
+        a["title_translated"] = b["title_translated"] = "ignored once fingerprints are stored"
+        self.assertTrue(is_duplicate(a, [b]))
+        self.assertFalse(is_duplicate(a, [add_report_features([copy.deepcopy(ARTICLES[2])])[0]]))
+
+    def test_top_k_is_lazy_and_reuses_features(self):
+        articles = [{"url": str(i), "impact_score": score} for i, score in enumerate([3, 9, 5, 9, 1])]
+        ordered = by_impact(articles)
+        self.assertEqual([a["url"] for a in (next(ordered), next(ordered), next(ordered))], ["1", "3", "2"])
+
+        week = copy.deepcopy(ARTICLES)
+        first = filter_top_articles(week, max_articles=10, min_impact_score=0)
+        with patch.object(article_filter, "score_articles", side_effect=AssertionError("rescored")):
+            self.assertEqual(filter_top_articles(week, max_articles=10, min_impact_score=0), first)
+
+class TestDuplicateIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open(FIXTURE, encoding="utf-8") as f:
+            cls.cases = json.load(f)
+
+    def test_labelled_pairs(self):
+        for case in self.cases:
+            with self.subTest(case["note"]):
+                self.assertEqual(is_duplicate(case["a"], [case["b"]]), case["duplicate"])
+                for exact_scan in (EXACT_SCAN_MAX, 0):  # Full scan, and the LSH buckets (short titles still scanned)
+                    index = DuplicateIndex(exact_scan=exact_scan)
+                    index.add(*fingerprints(case["b"]))
+                    self.assertEqual(index.find(*fingerprints(case["a"])) is not None, case["duplicate"])
+
+    def test_signatures_only_past_exact_scan(self):
+        sides = [fingerprints(side) for case in self.cases for side in (case["b"], case["a"])]
+        index = DuplicateIndex()
+        with patch.object(index.hasher, "signature", side_effect=AssertionError("signature computed")):
+            kept = sum(index.add_if_new(*side) for side in sides)
+        self.assertLessEqual(len(index), EXACT_SCAN_MAX)
+
+        # Crossing exact_scan buckets every entry already accepted
+        small = DuplicateIndex(exact_scan=3)
+        self.assertEqual(sum(small.add_if_new(*side) for side in sides), kept)
+        self.assertTrue(small.bucketed)
+        self.assertEqual(sum(len(ids) for ids in small.title_buckets.values()) // small.hasher.bands, kept)
+
+    def test_selection_matches_pairwise_scan(self):
+        articles = [dict(side, url=f"{i}{key}", impact_score=100 - i)
+                    for i, case in enumerate(self.cases) for key, side in (("b", case["b"]), ("a", case["a"]))]
+        expected = []
+        for article in articles:
+            if not is_duplicate(article, expected):
+                expected.append(article)
+        top = select_top_articles(articles, max_articles=len(articles), min_impact_score=0)
+        self.assertEqual([a["url"] for a in top], [a["url"] for a in expected])
+        self.assertLess(len(top), len(articles))
+
+if __name__ == "__main__":
+    unittest.main()
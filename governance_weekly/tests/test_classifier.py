@@ -0,0 +1,55 @@
+import unittest
+from benchmarks.bench_classifier import classifier_texts, report_articles
+from benchmarks.legacy import legacy_classify, legacy_calculate_weighted_score, legacy_has_exclusion_keyword
+from classifier.classifier import Classifier
+from classifier.matcher import KeywordMatcher
+from utils.article_filter import score_articles, exclusion_flags, calculate_weighted_score, has_exclusion_keyword
+
+class TestKeywordMatcher(unittest.TestCase):
+    def test_finds_overlapping_and_nested_keywords(self):
+        matcher = KeywordMatcher(["Voter List", "voter list update", "list", "update", "un"])
+        hits = matcher.find("the voter list update is underway")
+        self.assertEqual({matcher.keywords[k] for k in hits}, {"voter list", "voter list update", "list", "update", "un"})
+        # End offset of the first occurrence
+        self.assertEqual(hits[matcher.ids["voter list"]], len("the voter list"))
+
+class TestClassifier(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.classifier = Classifier()
+
+    def test_matches_baseline_classification(self):
+        for text in classifier_texts(300, seed=3):
+            self.assertEqual(self.classifier.classify(text), legacy_classify(self.classifier, text))
+
+    def test_title_and_body_exclusions(self):
+        self.assertEqual(self.classifier.classify("Cricket team wins\nElection commission")["exclusion_reason"],
+                         "Title contains excluded term: cricket")
+        self.assertEqual(self.classifier.classify("Election commission update\nafter the football match")["exclusion_reason"],
+                         "Body contains excluded term: football")
+
+    def test_classify_batch_agrees_with_classify(self):
+        texts = classifier_texts(200, seed=4)
+        batch = self.classifier.classify_batch(texts)
+        self.assertEqual(batch.tier_counts.shape, (200, 3))
+        for i, text in enumerate(texts):
+            result = self.classifier.classify(text)
+            self.assertEqual(bool(batch.is_excluded[i]), result["is_excluded"])
+            if "tier1_matches" in result:
+                self.assertEqual(list(batch.tier_counts[i]), [result["tier1_matches"], result["tier2_matches"], result["tier3_matches"]])
+                self.assertEqual(int(batch.weighted_scores[i]), result["weighted_score"])
+        self.assertEqual(len(self.classifier.classify_batch([])), 0)
+
+class TestArticleFilterScoring(unittest.TestCase):
+    def test_matches_baseline_filter_scoring(self):
+        articles = report_articles(classifier_texts(300, seed=5))
+        scores = score_articles(articles)
+        flags = exclusion_flags(scores, len(articles))
+        for i, article in enumerate(articles):
+            self.assertEqual(int(scores.weighted_scores[i]), legacy_calculate_weighted_score(article))
+            self.assertEqual(bool(flags[i]), legacy_has_exclusion_keyword(article))
+        self.assertEqual(calculate_weighted_score(articles[0]), legacy_calculate_weighted_score(articles[0]))
+        self.assertEqual(has_exclusion_keyword(articles[0]), legacy_has_exclusion_keyword(articles[0]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from config import Config
+import sqlite3
+from database import html_store, migrations
+from database.db import DB
+from database.migrations import INDEXES
+
+class TestArticlesDatabase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.patch = patch.object(Config, "DB_PATH", os.path.join(self.tmp.name, "gov_weekly.db"))
+        self.patch.start()
+        self.db = DB()
+        self.db.init_db()
+
+    def tearDown(self):
+        self.db.close()
+        self.patch.stop()
+        self.tmp.cleanup()
+
+    def test_schema_pragmas_and_indexes(self):
+        self.assertEqual(self.db.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        indexes = {row[0] for row in self.db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue(set(INDEXES) <= indexes)
+        plan = self.db.conn.execute("EXPLAIN QUERY PLAN SELECT * FROM articles WHERE fetched_at >= ?", ("",)).fetchall()
+        self.assertIn("idx_articles_fetched_at", plan[0][-1])
+        # The report query (main.summarize_and_report) reads in impact order, no sort
+        plan = self.db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT url FROM articles WHERE fetched_at >= ? AND report_excluded = 0 "
+            "AND weighted_score >= ? AND impact_score >= ? ORDER BY impact_score DESC", ("", 5, 10.0)).fetchall()
+        self.assertEqual([row[-1] for row in plan],
+                         ["SEARCH articles USING INDEX idx_articles_report_rank (impact_score>?)"])
+
+    def test_batched_insert_ignores_known_urls(self):
+        rows = [{"url": f"https://example.com/{i}", "source_domain": "example.com", "title_original": f"Title {i}",
+                 "status": "pending_review"} for i in range(5)]
+        self.assertEqual(self.db.insert_articles(rows), 5)
+        self.assertEqual(self.db.insert_articles(rows[3:] + [dict(rows[0], url="https://example.com/new")]), 1)
+        self.db.commit()
+        self.assertEqual(self.db.get_known_urls(), {r["url"] for r in rows} | {"https://example.com/new"})
+
+    def test_raw_html_in_compressed_side_table(self):
+        page = "<html><body>" + "<p>Election news</p>" * 500 + "</body></html>"
+        rows = [{"url": f"https://example.com/{i}", "source_domain": "example.com", "raw_html": page} for i in range(3)]
+        self.db.insert_articles(rows)
+        self.db.commit()
+        self.assertEqual(self.db.get_raw_html("https://example.com/1"), page)
+        self.assertIsNone(self.db.get_raw_html("https://example.com/missing"))
+        # Inline column unused; identical pages stored once, compressed
+        self.assertEqual(self.db.conn.execute("SELECT COUNT(*) FROM articles WHERE raw_html IS NOT NULL").fetchone()[0], 0)
+        self.assertEqual(self.db.conn.execute("SELECT COUNT(*), MAX(LENGTH(html)) < ? FROM raw_html", (len(page) // 10,)).fetchone()[:], (1, 1))
+
+    def test_ignored_rows_store_no_html(self):
+        first = {"url": "https://example.com/a", "source_domain": "example.com", "raw_html": "<html>first</html>"}
+        self.assertEqual(self.db.insert_articles([first, dict(first, raw_html="<html>same url, later</html>")]), 1)
+        self.assertEqual(self.db.insert_articles([dict(first, raw_html="<html>refetched</html>")]), 0)
+        self.db.commit()
+        self.assertEqual(self.db.conn.execute("SELECT COUNT(*) FROM raw_html").fetchone()[0], 1)
+        self.assertEqual(self.db.get_raw_html("https://example.com/a"), "<html>first</html>")
+
+    def test_migrates_unversioned_database(self):
+        # A file written before versioning: original columns, HTML inline, user_version 0
+        self.db.close()
+        os.remove(Config.DB_PATH)
+        conn = sqlite3.connect(Config.DB_PATH)
+        migrations.create_articles(conn)
+        conn.executemany("INSERT INTO articles (url, source_domain, raw_html) VALUES (?, 'example.com', ?)",
+                         [(f"https://example.com/{i}", f"<html>{i}</html>") for i in range(450)])
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(self.db.init_db(), migrations.LATEST)
+        self.assertEqual(migrations.user_version(self.db.conn), migrations.LATEST)
+        columns = {row[1] for row in self.db.conn.execute("PRAGMA table_info(articles)")}
+        self.assertIn("lease_expires", columns)
+        self.assertEqual(self.db.conn.execute("SELECT COUNT(*) FROM articles WHERE raw_html IS NOT NULL").fetchone()[0], 0)
+        self.assertEqual(self.db.get_raw_html("https://example.com/7"), "<html>7</html>")
+        # Up to date: nothing reruns
+        with patch.object(migrations, "MIGRATIONS", [self.fail] * migrations.LATEST):
+            self.assertEqual(migrations.migrate(self.db.conn), migrations.LATEST)
+
+    def test_html_move_leaves_compaction_to_compact(self):
+        self.db.close()
+        os.remove(Config.DB_PATH)
+        conn = sqlite3.connect(Config.DB_PATH)
+        migrations.create_articles(conn)
+        conn.executemany("INSERT INTO articles (url, source_domain, raw_html) VALUES (?, 'example.com', ?)",
+                         [(f"https://example.com/{i}", f"<html>{i}</html>" * 2000) for i in range(200)])
+        conn.commit()
+        statements = []
+        conn.set_trace_callback(statements.append)
+        migrations.migrate(conn)
+        conn.close()
+        self.assertFalse([s for s in statements if s.strip().upper().startswith("VACUUM")])
+
+        self.db.connect()
+        self.assertGreater(self.db.conn.execute("PRAGMA freelist_count").fetchone()[0], 0)
+        html_store.put_many(self.db.conn, ["<html>orphan</html>"])  # As insert_articles used to leave for ignored rows
+        self.assertGreater(self.db.compact(), 0)
+        self.assertIsNone(html_store.get(self.db.conn, html_store.content_hash("<html>orphan</html>")))
+        self.assertEqual(self.db.conn.execute("PRAGMA freelist_count").fetchone()[0], 0)
+        self.assertEqual(self.db.get_raw_html("https://example.com/7"), "<html>7</html>" * 2000)
+
+    def test_backfill_batches_and_resumes(self):
+        self.db.insert_articles([{"url": f"https://example.com/{i}", "source_domain": "example.com"} for i in range(25)])
+        self.db.commit()
+        batches = []
+
+        def compute(rows):
+            batches.append(len(rows))
+            return [("x", row[0]) for row in rows]
+
+        done = migrations.backfill(self.db.conn, "SELECT rowid FROM articles WHERE summary IS NULL LIMIT ?",
+                                   "UPDATE articles SET summary = ? WHERE rowid = ?", compute, batch_size=10)
+        self.assertEqual((done, batches), (25, [10, 10, 5]))
+        self.assertEqual(migrations.backfill(self.db.conn, "SELECT rowid FROM articles WHERE summary IS NULL LIMIT ?",
+                                             "UPDATE articles SET summary = ? WHERE rowid = ?", compute), 0)
+
+if __name__ == "__main__":
+    unittest.main()
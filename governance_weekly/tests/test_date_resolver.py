@@ -0,0 +1,75 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+import extractor.date_resolver as date_resolver
+from extractor.article_extractor import extract_article
+from extractor.date_resolver import resolve_fast, resolve_published_date, source_for_url
+from utils.nepali_calendar import FIRST_AD, LAST_AD, ad_to_bs, bs_to_ad
+
+class TestDateResolver(unittest.TestCase):
+    def test_fast_tiers_match_dateparser(self):
+        cases = {
+            "2026-02-20T10:30:00+05:45": (datetime(2026, 2, 20, 10, 30, tzinfo=timezone(timedelta(hours=5, minutes=45))), "iso"),
+            "2026-02-20": (datetime(2026, 2, 20), "iso"),
+            "Friday, February 20, 2026": (datetime(2026, 2, 20), "format"),
+            "February 20, 2026 12:05 AM": (datetime(2026, 2, 20, 0, 5), "format"),
+            "2026 February 20 Friday 10:30": (datetime(2026, 2, 20, 10, 30), "format"),
+            "२०८२ फागुन ८ गते": (datetime(2026, 2, 20), "bs"),
+            "2082 Falgun 8 Friday 06:36:00": (datetime(2026, 2, 20, 6, 36), "bs"),
+            "बिहीबार, पुस ३, २०८२": (datetime(2025, 12, 18), "bs"),
+            "2082 Falgun 31": (None, None),  # Falgun 2082 has 30 days
+            "Feb 30, 2026": (None, None),  # Left to dateparser
+            "2 hours ago": (None, None),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text):
+                self.assertEqual(resolve_fast(text, source_for_url("https://www.onlinekhabar.com/2026/02/1")), expected)
+
+    def test_dateparser_only_for_unresolved_candidates(self):
+        with patch.object(date_resolver.dateparser, "parse", side_effect=AssertionError("dateparser called")):
+            self.assertEqual(resolve_published_date(["फागुन ८, २०८२", "2 hours ago"]), (datetime(2026, 2, 20), "bs"))
+        parsed, tier = resolve_published_date(["2 hours ago", "फागुन ८, २०८२"])
+        self.assertEqual(tier, "dateparser")
+        self.assertLess(abs(datetime.now() - timedelta(hours=2) - parsed), timedelta(minutes=1))
+
+        with patch.object(date_resolver.dateparser, "parse", return_value=None) as parse:
+            for _ in range(2):
+                self.assertEqual(resolve_published_date(["no date here"]), (None, None))
+        parse.assert_called_once()  # Misses are remembered
+
+    def test_meta_date_beats_later_stamps(self):
+        npt = timezone(timedelta(hours=5, minutes=45))
+        # RFC 2822 article:published_time ahead of a related-article stamp
+        self.assertEqual(resolve_published_date(["Fri, 20 Feb 2026 10:30:00 +0545", "February 18, 2026"]),
+                         (datetime(2026, 2, 20, 10, 30, tzinfo=npt), "rfc2822"))
+        # Only dateparser reads the meta value; it still comes first
+        parsed, tier = resolve_published_date(["20 Feb 2026, 10:30 AM NPT", "February 18, 2026"])
+        self.assertEqual((parsed.replace(tzinfo=None), tier), (datetime(2026, 2, 20, 10, 30), "dateparser"))
+
+    def test_bs_byline_in_text(self):
+        html = ('<html><title>निर्वाचन आयोगको बैठक</title><body><article><p>2082 Paush 3 Thursday 06:36:00</p>'
+                '<p>निर्वाचन आयोगले आज बैठक गर्‍यो। फागुन २१ गते मतदान हुनेछ।</p></article></body></html>')
+        with patch.object(date_resolver.dateparser, "parse", side_effect=AssertionError("dateparser called")):
+            data = extract_article(html, "https://www.ratopati.com/story/1")
+        self.assertEqual((data["published_at"], data["date_tier"]), (datetime(2025, 12, 18, 6, 36), "text"))
+
+class TestNepaliCalendar(unittest.TestCase):
+    def test_known_dates(self):
+        self.assertEqual(bs_to_ad(2082, 1, 1), date(2025, 4, 14))    # New Year 2082
+        self.assertEqual(bs_to_ad(2081, 1, 1), date(2024, 4, 13))
+        self.assertEqual(bs_to_ad(2082, 6, 16), date(2025, 10, 2))   # Vijaya Dashami
+        self.assertEqual(ad_to_bs(datetime(2026, 2, 20, 10, 30)), (2082, 11, 8))
+        for bad in ((2082, 11, 31), (2082, 13, 1), (2030, 1, 1)):
+            with self.assertRaises(ValueError):
+                bs_to_ad(*bad)
+        with self.assertRaises(ValueError):
+            ad_to_bs(LAST_AD + timedelta(days=1))
+
+    def test_round_trip(self):
+        day = FIRST_AD
+        while day <= LAST_AD:
+            self.assertEqual(bs_to_ad(*ad_to_bs(day)), day)
+            day += timedelta(days=1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import patch
+from config import Config
+from translator.fake import FakeBackend
+from translator.translator import Translator
+from utils.language import contains_nepali, devanagari_ratio, is_nepali, language_spans
+
+class TestLanguageDetection(unittest.TestCase):
+    def test_script_ratio(self):
+        self.assertEqual(devanagari_ratio("Election Commission"), 0.0)
+        self.assertEqual(devanagari_ratio("निर्वाचन आयोग"), 1.0)
+        self.assertEqual(devanagari_ratio(""), 0.0)
+        self.assertTrue(is_nepali("निर्वाचन आयोगले NC र UML लाई पत्र पठायो"))
+        self.assertFalse(is_nepali("Prime Minister Oli (ओली) addressed the House on Sunday."))
+        self.assertTrue(contains_nepali("The Commission said.\n\nआयोगले भन्यो।"))
+        self.assertFalse(contains_nepali("The Commission said.\n\nIt met on Sunday."))
+
+    def test_spans_round_trip(self):
+        text = "पहिलो अनुच्छेद।\nदोस्रो अनुच्छेद।\n\nAn English paragraph.\nAnother one.\n\nतेस्रो।"
+        spans = language_spans(text)
+        self.assertEqual([nepali for _, _, nepali in spans], [True, False, True])
+        self.assertEqual("".join(span + sep for span, sep, _ in spans), text)
+
+    def test_translate_many_skips_english_paragraphs(self):
+        with patch.object(Config, "TRANSLATION_BACKEND", "fake"):
+            translator = Translator(cache_path=None)
+        translator.fake = FakeBackend(latency=0)
+        english = "The Election Commission published the voter list on Sunday."
+        body = f"मतदाता नामावली प्रकाशन भयो।\n\n{english}\n\nमतदान केन्द्र तोकियो।"
+        title, result, plain = translator.translate_many(["निर्वाचन आयोग", body, english])
+        self.assertEqual(title, FakeBackend._transliterate("निर्वाचन आयोग"))
+        self.assertEqual(result, FakeBackend._transliterate(body))
+        self.assertEqual(plain, english)
+        self.assertEqual(translator.fake.characters, len("निर्वाचन आयोग") + len(body) - len(english) - 4)
+        self.assertEqual(translator.chars_skipped, 2 * len(english))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,17 @@
+import os
+import tempfile
+import threading
+import time
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
+from extractor.process_pool import ExtractionPool, process_page
 from scrapers.base_scraper import BaseScraper
+from scrapers.discovery import DiscoveryStats, discover, iter_feed
+from scrapers.fetch_engine import HostRateLimiter
+from scrapers.http_client import HttpClient
 from scrapers.domain_scrapers.ekantipur import EkantipurScraper
+from utils.selenium_manager import BrowserPool
 
 class TestBaseScraper(unittest.TestCase):
     def test_extract_links(self):
@@ -11,28 +21,258 @@ class TestBaseScraper(unittest.TestCase):
         self.assertIn("https://example.com/news/123", links)
         self.assertNotIn("https://other.com", links)
 
+    def test_filter_new_links_skips_known(self):
+        scraper = BaseScraper("https://example.com", "example.com")
+        scraper.known_urls = {"https://example.com/news/1"}
+        links = ["https://example.com/news/1", "https://example.com/news/2"]
+        self.assertEqual(scraper.filter_new_links(links), ["https://example.com/news/2"])
+
+class TestHostRateLimiter(unittest.TestCase):
+    def test_spaces_same_host_only(self):
+        limiter = HostRateLimiter(0.2)
+        start = time.monotonic()
+        limiter.wait("a.com")
+        limiter.wait("b.com")
+        self.assertLess(time.monotonic() - start, 0.1)
+        limiter.wait("a.com")
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
 class TestEkantipurScraper(unittest.TestCase):
-    @patch('scrapers.base_scraper.requests.get')
+    @patch('scrapers.base_scraper.Config.USE_SELENIUM', False)
+    @patch('scrapers.base_scraper.Config.USE_FEED_DISCOVERY', False)
+    @patch('scrapers.http_client.requests.Session.get')
     def test_run_mock(self, mock_get):
         # Mock homepage
         mock_response_home = MagicMock()
-        mock_response_home.text = '<html><a href="/news/2024/01/01/test">Test Article</a></html>'
+        mock_response_home.text = f'<html><a href="/news/{datetime.now().year}/01/01/test">Test Article</a></html>'
         mock_response_home.status_code = 200
+        mock_response_home.headers = {}
         
         # Mock article page
         mock_response_art = MagicMock()
         mock_response_art.text = '<html><title>Test Title</title><article>Test content here.</article></html>'
         mock_response_art.status_code = 200
+        mock_response_art.headers = {}
         
         mock_get.side_effect = [mock_response_home, mock_response_art]
         
         with patch('scrapers.base_scraper.is_allowed', return_value=True):
             scraper = EkantipurScraper()
+            scraper.http = HttpClient(cache_path=None)
             scraper.max_articles = 1
             results = scraper.run()
             
             self.assertEqual(len(results), 1)
             self.assertEqual(results[0]['title'], "Test Title")
 
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-2026-02.xml</loc><lastmod>2026-02-20T08:00:00+05:45</lastmod></sitemap>
+  <sitemap><loc>https://example.com/sitemap-2025-12.xml</loc><lastmod>2025-12-31T23:00:00+05:45</lastmod></sitemap>
+</sitemapindex>"""
+NEWS_SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>https://example.com/news/2026/02/new</loc><lastmod>2026-02-21T09:00:00+05:45</lastmod>
+    <news:news><news:publication_date>2026-02-19T10:00:00+05:45</news:publication_date></news:news></url>
+  <url><loc>https://example.com/news/2026/02/old</loc><lastmod>2026-02-10T09:00:00+05:45</lastmod></url>
+  <url><loc>https://example.com/news/2026/02/undated</loc></url>
+</urlset>"""
+RSS = """<rss version="2.0"><channel><link>https://example.com/</link>
+  <item><link>https://example.com/news/2026/02/rss</link><pubDate>Fri, 20 Feb 2026 10:30:00 +0545</pubDate></item>
+  <item><link>https://example.com/news/2026/02/new</link><pubDate>Thu, 19 Feb 2026 10:00:00 +0545</pubDate></item>
+</channel></rss>"""
+ATOM = """<feed xmlns="http://www.w3.org/2005/Atom"><entry><link href="https://example.com/news/atom"/>
+  <published>2026-02-18T07:00:00Z</published></entry></feed>"""
+
+NPT = timezone(timedelta(hours=5, minutes=45))
+
+def local(*args, tz=NPT):
+    """A feed date as discovery compares it: converted to local time, naive"""
+    return datetime(*args, tzinfo=tz).astimezone().replace(tzinfo=None)
+
+class TestDiscovery(unittest.TestCase):
+    def test_feed_formats(self):
+        self.assertEqual(list(iter_feed(SITEMAP_INDEX))[0], ("sitemap", "https://example.com/sitemap-2026-02.xml", local(2026, 2, 20, 8)))
+        self.assertEqual(list(iter_feed(NEWS_SITEMAP))[0], ("article", "https://example.com/news/2026/02/new", local(2026, 2, 19, 10)))
+        self.assertEqual(list(iter_feed(RSS))[0], ("article", "https://example.com/news/2026/02/rss", local(2026, 2, 20, 10, 30)))
+        self.assertEqual(list(iter_feed(ATOM)), [("article", "https://example.com/news/atom", local(2026, 2, 18, 7, tz=timezone.utc))])
+        self.assertEqual(list(iter_feed("<html>not a feed")), [])
+
+    def test_window_filters_before_fetching(self):
+        documents = {"https://example.com/sitemap.xml": SITEMAP_INDEX, "https://example.com/sitemap-2026-02.xml": NEWS_SITEMAP,
+                     "https://example.com/feed": RSS}
+        fetched = []
+        fetch = lambda url: fetched.append(url) or documents.get(url)
+        stats = DiscoveryStats()
+        articles = discover(fetch, ["https://example.com/sitemap.xml", "https://example.com/feed", "https://example.com/missing"],
+                            since=datetime(2026, 2, 13), until=datetime(2026, 2, 21), stats=stats)
+        self.assertEqual([url for url, _ in articles], ["https://example.com/news/2026/02/rss", "https://example.com/news/2026/02/new",
+                                                        "https://example.com/news/2026/02/undated"])
+        self.assertNotIn("https://example.com/sitemap-2025-12.xml", fetched)
+        self.assertEqual((stats.feeds, stats.sitemaps_skipped, stats.out_of_window, stats.undated), (4, 1, 1, 1))
+        self.assertEqual((stats.fetches_avoided, stats.net_fetches_saved), (3, -1))  # Four documents read to skip three fetches
+        self.assertIsNone(discover(lambda url: None, ["https://example.com/feed"]))
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+    def test_utc_dates_converted_at_window_edge(self):
+        sitemap = """<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+          <url><loc>https://example.com/news/edge</loc><lastmod>2026-02-13T00:30:00+00:00</lastmod></url>
+        </urlset>"""
+        self.addCleanup(time.tzset)  # Runs once TZ is restored
+        with patch.dict(os.environ, {"TZ": "Asia/Kathmandu"}):
+            time.tzset()
+            # 00:30 UTC is 06:15 in Kathmandu, inside a window opening at 06:00 local time
+            self.assertEqual(discover(lambda url: sitemap, ["https://example.com/sitemap.xml"], since=datetime(2026, 2, 13, 6)),
+                             [("https://example.com/news/edge", datetime(2026, 2, 13, 6, 15))])
+
+    @patch('scrapers.base_scraper.Config.USE_FEED_DISCOVERY', True)
+    def test_scraper_falls_back_to_homepage(self):
+        scraper = BaseScraper("https://example.com", "example.com")
+        scraper.FEEDS = ("/feed",)
+        pages = {"https://example.com/feed": RSS, "https://example.com": '<a href="/news/home">Home link</a>'}
+        with patch.object(scraper, "fetch", side_effect=lambda url, **kw: pages.get(url)) as fetch, \
+                patch("scrapers.base_scraper.site_maps", return_value=[]):
+            self.assertEqual(scraper.candidate_links()[0], "https://example.com/news/2026/02/rss")
+            fetch.assert_called_once_with("https://example.com/feed", browser=False)
+            del pages["https://example.com/feed"]
+            self.assertEqual(scraper.candidate_links(), {"https://example.com/news/home"})
+
+class FakeDriver:
+    def __init__(self, fail_on=None):
+        self.fail_on, self.quit_called, self.page_source = fail_on, False, ""
+
+    def get(self, url):
+        if url == self.fail_on:
+            raise RuntimeError("tab crashed")
+        self.page_source = f"<html>{url}</html>"
+
+    def quit(self):
+        self.quit_called = True
+
+class TestBrowserPool(unittest.TestCase):
+    def test_reuses_queues_and_replaces_browsers(self):
+        started = []
+        pool = BrowserPool(size=2, factory=lambda: started.append(FakeDriver(fail_on="https://example.com/bad")) or started[-1])
+        results = []
+        threads = [threading.Thread(target=lambda i=i: results.append(pool.get_page(f"https://example.com/{i}"))) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(results), 8)
+        self.assertLessEqual(len(started), 2)  # Fetches waited for an idle browser
+
+        with self.assertRaises(RuntimeError):
+            pool.get_page("https://example.com/bad")
+        self.assertTrue(any(d.quit_called for d in started))
+        self.assertEqual(pool.get_page("https://example.com/after"), "<html>https://example.com/after</html>")
+        pool.close()
+        self.assertTrue(all(d.quit_called for d in started))
+        with self.assertRaises(RuntimeError):
+            pool.get_page("https://example.com/closed")
+
+    def test_close_wakes_waiting_fetches(self):
+        pool = BrowserPool(size=1, factory=FakeDriver)
+        held = pool._acquire()  # The only browser is busy
+        errors = []
+
+        def fetch():
+            try:
+                pool.get_page("https://example.com/queued")
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=fetch) for _ in range(3)]
+        for t in threads:
+            t.start()
+        while pool._waiting < 3:
+            time.sleep(0.01)
+        started = time.monotonic()
+        pool.close()
+        for t in threads:
+            t.join(timeout=5)
+        self.assertFalse(any(t.is_alive() for t in threads))
+        self.assertLess(time.monotonic() - started, 0.5)  # Woken by close, not the poll
+        self.assertEqual([str(e) for e in errors], ["Browser pool is closed"] * 3)
+        pool._release(held)
+        self.assertTrue(held.quit_called)
+
+    @patch('scrapers.base_scraper.Config.USE_SELENIUM', True)
+    def test_plain_http_unless_source_needs_js(self):
+        pool = MagicMock()
+        pool.get_page.return_value = "<html>rendered</html>"
+        scraper = BaseScraper("https://example.com", "example.com")
+        scraper.engine, scraper.http = MagicMock(), MagicMock()  # No rate limiting
+        scraper.http.get.return_value = ("<html>plain</html>", False)
+        with patch("scrapers.base_scraper.get_browser_pool", return_value=pool):
+            self.assertEqual(scraper.fetch("https://example.com/a"), "<html>plain</html>")
+            scraper.NEEDS_JS = True
+            self.assertEqual(scraper.fetch("https://example.com/b"), "<html>rendered</html>")
+            self.assertEqual(scraper.fetch("https://example.com/feed", browser=False), "<html>plain</html>")
+        pool.get_page.assert_called_once_with("https://example.com/b")
+
+class TestExtractionPool(unittest.TestCase):
+    PAGES = [
+        ("https://example.com/en", "<html><title>Election Commission sets polling date</title><article><p>The Election "
+                                   "Commission announced the polling date after meeting political parties.</p></article></html>"),
+        ("https://example.com/ne", "<html><title>निर्वाचन आयोगले मिति तोक्यो</title><article><p>निर्वाचन आयोगले "
+                                   "राजनीतिक दलसँग छलफलपछि मतदानको मिति घोषणा गर्‍यो।</p></article></html>"),
+        ("https://example.com/empty", "<html><body></body></html>"),
+    ]
+
+    def test_workers_match_inline(self):
+        inline = {url: process_page(url, html) for url, html in self.PAGES}
+        self.assertNotIn("raw_html", inline["https://example.com/en"])  # The caller keeps the HTML
+        self.assertIn("classification", inline["https://example.com/en"])
+        self.assertNotIn("classification", inline["https://example.com/ne"])  # Classified after translation
+        self.assertIsNone(inline["https://example.com/empty"])
+
+        pool = ExtractionPool(workers=1)
+        try:
+            results = {url: (html, record) for url, html, record in pool.process(iter(self.PAGES))}
+        finally:
+            pool.shutdown()
+        self.assertEqual({url: record for url, (_, record) in results.items()}, inline)
+        self.assertEqual(results["https://example.com/ne"][0], self.PAGES[1][1])
+        self.assertEqual((pool.pages, pool.failures), (3, 1))
+
+    def test_dead_worker_falls_back_in_order(self):
+        pages = [(f"{url}/{i}", html) for i in range(6) for url, html in self.PAGES]
+        read = []
+
+        def page_source(pool):
+            for i, page in enumerate(pages):
+                if i == 1:  # The first page is with the worker by now
+                    for process in list(pool._executor._processes.values()):
+                        process.kill()
+                read.append(page[0])
+                yield page
+
+        pool = ExtractionPool(workers=1)
+        try:
+            results = []
+            for url, html, record in pool.process(page_source(pool)):
+                self.assertLessEqual(len(read) - len(results), 3)  # Never reads far ahead of the results
+                results.append((url, record))
+        finally:
+            pool.shutdown()
+        self.assertTrue(pool._broken)
+        self.assertEqual(len(results), len(pages))
+        self.assertEqual(dict(results), {url: process_page(url, html) for url, html in pages})
+        tail = [url for url, _ in results[-10:]]
+        self.assertEqual(tail, [url for url, _ in pages[-10:]])  # Pages after the failure keep their order
+
+class TestHttpClient(unittest.TestCase):
+    def test_not_modified_served_from_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            client = HttpClient(cache_path=os.path.join(tmp, "http_cache.db"))
+            first = MagicMock(status_code=200, text="<html>v1</html>", headers={"ETag": '"abc"'})
+            second = MagicMock(status_code=304, text="", headers={})
+            with patch('scrapers.http_client.requests.Session.get', side_effect=[first, second]) as mock_get:
+                self.assertEqual(client.get("https://example.com/a"), ("<html>v1</html>", False))
+                self.assertEqual(client.get("https://example.com/a"), ("<html>v1</html>", True))
+                self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"abc"')
+            client.close()
+
 if __name__ == '__main__':
     unittest.main()
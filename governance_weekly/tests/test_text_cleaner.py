@@ -0,0 +1,34 @@
+import json
+import os
+import unittest
+from unittest.mock import patch
+import extractor.text_cleaner as text_cleaner
+from extractor.text_cleaner import clean_text, source_for_url
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "text_cleaner_corpus.json")
+
+class TestTextCleaner(unittest.TestCase):
+    def test_matches_baseline_output(self):
+        """Corpus expectations were produced by the original per-pattern re.sub loop"""
+        with open(FIXTURE, encoding="utf-8") as f:
+            cases = json.load(f)
+        for case in cases:
+            self.assertEqual(clean_text(case["text"], case["url"]), case["expected"], case["url"])
+
+    def test_baseline_patterns_apply_to_every_source(self):
+        text = "Voters queue early. 12 Comments\nWhat you should know"
+        for url in ("https://www.onlinekhabar.com/2026/02/1", "https://ekantipur.com/news/2026/02/1",
+                    "https://kathmandupost.com/politics/1", None):
+            self.assertEqual(clean_text(text, url), "Voters queue early.", url)
+
+    def test_source_patterns_add_to_global(self):
+        site_only = ("site", r'Subscribe to our newsletter', ("subscribe",), ("onlinekhabar.com",))
+        text = "Voters queue early. 12 Comments Subscribe to our newsletter"
+        with patch.object(text_cleaner, "JUNK_PATTERNS", text_cleaner.JUNK_PATTERNS + [site_only]), \
+                patch.dict(text_cleaner._cleaners, clear=True):
+            self.assertEqual(source_for_url("https://english.onlinekhabar.com/x"), "onlinekhabar.com")
+            self.assertEqual(clean_text(text, "https://english.onlinekhabar.com/x"), "Voters queue early.")
+            self.assertEqual(clean_text(text, "https://kathmandupost.com/x"), "Voters queue early. Subscribe to our newsletter")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import sqlite3
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+import utils.title_index as title_index
+from utils.title_index import TitleIndex
+
+class TestTitleIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = TitleIndex(path=os.path.join(self.tmp.name, "title_index.db"))
+        self.index.add_many([
+            "Election Commission announces final candidate list for March 5 polls",
+            "निर्वाचन आयोगले मतदाता नामावली प्रकाशन गर्यो",
+        ])
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def test_finds_near_duplicate(self):
+        self.assertIsNotNone(self.index.find_similar("Election Commission announces final candidates list for March 5 poll"))
+        self.assertIsNotNone(self.index.find_similar("निर्वाचन आयोगले मतदाता नामावली प्रकाशन गर्‍यो"))
+
+    def test_ignores_unrelated_title(self):
+        self.assertIsNone(self.index.find_similar("Supreme Court hears writ against budget allocation"))
+
+    def test_rollback_discards_uncommitted_titles(self):
+        self.index.commit()
+        self.index.add("Police arrest three over ballot box vandalism")
+        self.index.rollback()
+        self.assertIsNone(self.index.find_similar("Police arrest three over ballot box vandalism"))
+
+    def test_sync_rebuilds_in_batches(self):
+        articles = sqlite3.connect(":memory:")
+        articles.execute("CREATE TABLE articles (title_original TEXT)")
+        titles = [f"Candidate {i} files nomination for constituency {i}" for i in range(25)] + [None, " "]
+        articles.executemany("INSERT INTO articles VALUES (?)", [(t,) for t in titles])
+        calls = []
+        signatures = self.index.hasher.signatures
+        with patch.object(title_index, "ADD_BATCH", 10), \
+                patch.object(self.index.hasher, "signatures", side_effect=lambda sets: calls.append(len(sets)) or signatures(sets)):
+            self.index.sync(SimpleNamespace(cursor=articles.cursor()))
+        self.assertEqual(self.index.count(), 25)
+        self.assertLessEqual(max(calls), 10)
+        self.assertIsNotNone(self.index.find_similar("Candidate 17 files nominations for constituency 17"))
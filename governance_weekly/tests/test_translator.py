@@ -0,0 +1,174 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from classifier.classifier import get_classifier
+from config import Config
+from database.db import init_db
+from database.translation_queue import TranslationQueue
+from translator.batching import TokenBucket, sentence_chunks
+from translator.cache import TranslationCache
+from translator.fake import FakeBackend
+from translator.translator import Translator
+from translator.worker import TranslationWorkerPool
+
+class TestTranslationCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "translation_cache.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_translate_checks_cache_first(self):
+        with patch.object(Config, "TRANSLATION_BACKEND", "none"):
+            translator = Translator(cache_path=self.path)
+        with patch.object(Translator, "_call_backend", return_value="Election Commission") as backend:
+            self.assertEqual(translator.translate("निर्वाचन आयोग"), "Election Commission")
+            self.assertEqual(translator.translate("निर्वाचन आयोग"), "Election Commission")
+            self.assertEqual(backend.call_count, 1)
+        self.assertEqual(translator.cache.stats()["hits"], 1)
+        self.assertEqual(translator.cache.hit_rate, 0.5)
+        translator.close()
+
+        # Persisted across instances
+        cache = TranslationCache(self.path)
+        self.assertEqual(cache.get("निर्वाचन आयोग", "none", "ne", "en"), "Election Commission")
+        self.assertIsNone(cache.get("निर्वाचन आयोग", "gemini", "ne", "en"))
+        cache.close()
+
+    def test_failed_translation_not_cached(self):
+        with patch.object(Config, "TRANSLATION_BACKEND", "none"):
+            translator = Translator(cache_path=self.path)
+        with patch.object(Translator, "_call_backend", return_value=None):
+            self.assertEqual(translator.translate("मतदान"), "मतदान")
+        self.assertEqual(translator.cache.stats()["entries"], 0)
+        translator.close()
+
+    def test_evicts_least_recently_used(self):
+        cache = TranslationCache(self.path, max_entries=10)
+        for i in range(10):
+            cache.put(f"text {i}", "gemini", "ne", "en", f"translated {i}")
+        cache.get("text 0", "gemini", "ne", "en")  # keep the oldest entry warm
+        cache.put("text 10", "gemini", "ne", "en", "translated 10")
+        self.assertEqual(cache.stats()["entries"], 9)
+        self.assertEqual(cache.evicted, 2)
+        self.assertIsNotNone(cache.get("text 0", "gemini", "ne", "en"))
+        self.assertIsNone(cache.get("text 1", "gemini", "ne", "en"))
+        cache.close()
+
+    def test_hits_do_not_write_and_replacements_keep_count(self):
+        cache = TranslationCache(self.path)
+        with patch("translator.cache.time.time", return_value=100.0):
+            cache.put("text", "gemini", "ne", "en", "old")
+            cache.put("text", "gemini", "ne", "en", "new")
+        self.assertEqual(cache.stats()["entries"], 1)
+        with patch("translator.cache.time.time", return_value=200.0):
+            self.assertEqual(cache.get("text", "gemini", "ne", "en"), "new")
+        self.assertFalse(cache.conn.in_transaction)  # The LRU touch waits in memory
+        cache.close()
+
+        cache = TranslationCache(self.path)  # ... and was written on close
+        self.assertEqual(cache.conn.execute("SELECT last_used FROM translation_cache").fetchall(), [(200.0,)])
+        cache.close()
+
+class TestTranslateMany(unittest.TestCase):
+    def test_sentence_chunks_end_on_sentence_boundaries(self):
+        text = "पहिलो वाक्य। दोस्रो वाक्य।\n\nतेस्रो अनुच्छेद। Fourth one."
+        chunks = sentence_chunks(text, 25)
+        self.assertEqual(chunks, [("पहिलो वाक्य।", " "), ("दोस्रो वाक्य।", "\n\n"), ("तेस्रो अनुच्छेद।", " "), ("Fourth one.", "")])
+        self.assertTrue(all(len(c) <= 10 for c, _ in sentence_chunks("एक दुई तीन चार पाँच छ सात आठ", 10)))
+        # merge=False (MarianEngine): one sentence per chunk however much room is left
+        self.assertEqual(sentence_chunks(text, 400, merge=False), chunks)
+
+    def test_results_in_order_with_shared_chunks_translated_once(self):
+        with patch.object(Config, "TRANSLATION_BACKEND", "fake"):
+            translator = Translator(cache_path=None)
+        translator.fake = FakeBackend(latency=0)
+        body = "मतदाता नामावली प्रकाशन भयो। " * 300  # several chunks, all identical sentences
+        texts = ["निर्वाचन आयोग", body, "", "मतदान केन्द्र"]
+        results = translator.translate_many(texts)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0], FakeBackend._transliterate("निर्वाचन आयोग"))
+        self.assertEqual(results[1].split(), FakeBackend._transliterate(body).split())
+        self.assertEqual(results[2], "")
+        self.assertEqual(results[3], FakeBackend._transliterate("मतदान केन्द्र"))
+        self.assertEqual(translator.fake.requests, 1)
+
+    def test_token_bucket_limits_rate(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+class TestTranslationQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "gov_weekly.db")
+        with patch.object(Config, "DB_PATH", self.db_path):
+            init_db()
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany(
+            "INSERT INTO articles (url, source_domain, title_original, full_text_original, fetched_at, status) "
+            "VALUES (?, 'example.com', ?, ?, ?, 'pending_translation')",
+            [(f"https://example.com/{i}", f"निर्वाचन आयोग {i}", "मतदाता नामावली प्रकाशन भयो।", f"2026-01-0{i + 1}")
+             for i in range(3)]
+        )
+        conn.commit()
+        conn.close()
+        self.queue = TranslationQueue(self.db_path)
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmp.cleanup()
+
+    def test_leases_expire_and_are_reclaimed(self):
+        first = self.queue.claim("worker-a", 2)
+        self.assertEqual([r["url"] for r in first], ["https://example.com/0", "https://example.com/1"])
+        self.assertEqual([r["url"] for r in self.queue.claim("worker-b", 5)], ["https://example.com/2"])
+        self.assertEqual(self.queue.claim("worker-b", 5), [])
+
+        # worker-a crashed: once its lease runs out the rows go to the next claimant
+        self.queue.conn.execute("UPDATE articles SET lease_expires = 0 WHERE lease_owner = 'worker-a'")
+        resumed = self.queue.claim("worker-c", 5)
+        self.assertEqual([r["translation_attempts"] for r in resumed], [2, 2])
+        self.assertFalse(self.queue.complete(first[0]["url"], "worker-a", "pending_review", {"summary": ""}))
+        self.assertTrue(self.queue.complete(first[0]["url"], "worker-c", "pending_review", {"summary": ""}))
+        self.assertEqual(self.queue.release("worker-c"), 1)
+        self.assertEqual(self.queue.counts(), {"ready": 1, "leased": 1, "waiting": 0})
+
+    def test_failed_translation_retried_then_kept(self):
+        with patch.object(Config, "TRANSLATION_BACKEND", "fake"):
+            translator = Translator(cache_path=None)
+        translator.fake = FakeBackend(latency=0)
+        done = threading.Event()
+        done.set()
+        untranslated = lambda texts, **kwargs: list(texts)
+
+        # The retry is scheduled after `done` is set; the pool waits out the backoff instead of exiting
+        pool = TranslationWorkerPool(translator, get_classifier(), workers=1, max_attempts=2, db_path=self.db_path)
+        with patch.object(translator, "translate_many", side_effect=untranslated), \
+                patch.object(Config, "TRANSLATION_RETRY_BASE_SEC", 0.2):
+            start = time.monotonic()
+            pool.run(done)
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertEqual(pool.counts["retried"], 3)
+        rows = self.queue.conn.execute("SELECT status, title_translated, translation_attempts FROM articles").fetchall()
+        self.assertTrue(all(r["status"] != "pending_translation" for r in rows))
+        self.assertEqual({r["title_translated"] for r in rows}, {"[Translation Failed]"})
+        self.assertEqual({r["translation_attempts"] for r in rows}, {2})
+
+        # A working backend drains the queue
+        self.queue.conn.execute("UPDATE articles SET status = 'pending_translation', translation_attempts = 0")
+        pool = TranslationWorkerPool(translator, get_classifier(), workers=2, db_path=self.db_path)
+        pool.run(done)
+        self.assertEqual(pool.counts["translated"] + pool.counts["excluded"], 3)
+        rows = self.queue.conn.execute("SELECT title_translated FROM articles ORDER BY url").fetchall()
+        self.assertEqual(rows[0]["title_translated"], FakeBackend._transliterate("निर्वाचन आयोग 0"))
+
+if __name__ == "__main__":
+    unittest.main()
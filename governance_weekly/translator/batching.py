@@ -0,0 +1,103 @@
+"""
+Helpers for Translator.translate_many: sentence-aligned chunking, packing chunks into
+request batches, and a token-bucket rate limiter shared by every request to one backend.
+"""
+import re
+import threading
+import time
+
+# Separators kept between sentences: a run of whitespace containing a newline, or the
+# whitespace after sentence-final punctuation (Devanagari danda included)
+_SENTENCE_SEP_RE = re.compile(r'(\s*\n\s*|(?<=[।॥.!?])\s+)')
+
+def _split_long(sentence, max_chars):
+    """Word-wrap a sentence longer than max_chars; words longer than that are sliced"""
+    pieces, current = [], ""
+    for word in sentence.split(" "):
+        while len(word) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
+
+def _joiner(separator):
+    """How two chunks are rejoined after translation: keep paragraph and line breaks"""
+    newlines = separator.count("\n")
+    return "\n\n" if newlines >= 2 else "\n" if newlines else " "
+
+def sentence_chunks(text, max_chars, merge=True):
+    """
+    Split `text` into chunks of at most `max_chars` that end on sentence boundaries.
+    Returns [(chunk, joiner)], where joiner is the whitespace to put after the chunk's
+    translation when reassembling ("" for the last chunk).
+    With merge=False every sentence is its own chunk (long ones are still wrapped).
+    """
+    parts = _SENTENCE_SEP_RE.split(text.strip())
+    chunks = []
+    current, pending_sep = "", ""
+    for i in range(0, len(parts), 2):
+        sentence = parts[i]
+        separator = parts[i + 1] if i + 1 < len(parts) else ""
+        if not sentence:
+            pending_sep += separator
+            continue
+        pieces = _split_long(sentence, max_chars) if len(sentence) > max_chars else [sentence]
+        for j, piece in enumerate(pieces):
+            sep_after = separator if j == len(pieces) - 1 else " "
+            if current and (not merge or len(current) + len(pending_sep) + len(piece) > max_chars):
+                chunks.append((current, _joiner(pending_sep)))
+                current = piece
+            else:
+                current = current + pending_sep + piece if current else piece
+            pending_sep = sep_after
+    if current:
+        chunks.append((current, ""))
+    return chunks
+
+def pack_batches(texts, max_items, max_chars):
+    """Group indices of `texts` into request batches of at most max_items items / max_chars characters"""
+    batches, batch, size = [], [], 0
+    for i, text in enumerate(texts):
+        if batch and (len(batch) >= max_items or size + len(text) > max_chars):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(i)
+        size += len(text)
+    if batch:
+        batches.append(batch)
+    return batches
+
+class TokenBucket:
+    """
+    Requests-per-second limiter: `rate` tokens are added per second up to `burst`.
+    acquire() blocks until a token is available. rate=None disables limiting.
+    """
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,133 @@
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class TranslationCache:
+    """
+    Persistent translation store keyed by sha256(backend, language pair, source text).
+    Entries are evicted least-recently-used once the table grows past `max_entries`.
+    Hits only note the entry's new last_used in memory; the notes are written with the next
+    put, every TOUCH_BATCH hits, and on close, so a lookup is never a write transaction.
+    """
+    EVICT_FRACTION = 0.1  # Evict this share of max_entries at a time so eviction is rare
+    TOUCH_BATCH = 256     # Pending last_used updates that force a write
+
+    def __init__(self, path, max_entries=None):
+        self.path = path
+        self.max_entries = Config.TRANSLATION_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS translation_cache (
+                key BLOB PRIMARY KEY,
+                backend TEXT,
+                source_lang TEXT,
+                target_lang TEXT,
+                translated BLOB,
+                created_at REAL,
+                last_used REAL
+            )
+        ''')
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_translation_cache_last_used ON translation_cache (last_used)")
+        self.conn.commit()
+        self._count = self.conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()[0]
+        self._touched = {}  # key -> last_used not yet written
+
+        # Metrics for this process
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evicted = 0
+
+    @staticmethod
+    def key(text, backend, source_lang, target_lang):
+        return hashlib.sha256(f"{backend}\0{source_lang}\0{target_lang}\0{text}".encode("utf-8")).digest()
+
+    def get(self, text, backend, source_lang, target_lang):
+        key = self.key(text, backend, source_lang, target_lang)
+        with self._lock:
+            row = self.conn.execute("SELECT translated FROM translation_cache WHERE key = ?", (key,)).fetchone()
+            if not row:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.TOUCH_BATCH:
+                self._write_touches()
+                self.conn.commit()
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, text, backend, source_lang, target_lang, translated):
+        key = self.key(text, backend, source_lang, target_lang)
+        now = time.time()
+        blob = zlib.compress(translated.encode("utf-8"))
+        with self._lock:
+            self._touched.pop(key, None)
+            self._write_touches()
+            inserted = self.conn.execute(
+                "INSERT OR IGNORE INTO translation_cache (key, backend, source_lang, target_lang, translated, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, backend, source_lang, target_lang, blob, now, now)
+            ).rowcount
+            if inserted:
+                self._count += 1
+            else:  # Known key: replace the translation, the entry count is unchanged
+                self.conn.execute("UPDATE translation_cache SET translated = ?, created_at = ?, last_used = ? WHERE key = ?",
+                                  (blob, now, now, key))
+            self.stores += 1
+            if self.max_entries and self._count > self.max_entries:
+                self._evict()
+            self.conn.commit()
+
+    def _write_touches(self):
+        """Write pending last_used updates; caller holds the lock and commits"""
+        if self._touched:
+            self.conn.executemany("UPDATE translation_cache SET last_used = ? WHERE key = ?",
+                                  [(used, key) for key, used in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self):
+        """Drop least-recently-used entries down to (1 - EVICT_FRACTION) * max_entries. Caller holds the lock."""
+        self._count = self.conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()[0]
+        excess = self._count - int(self.max_entries * (1 - self.EVICT_FRACTION))
+        if excess <= 0:
+            return
+        self.conn.execute(
+            "DELETE FROM translation_cache WHERE key IN (SELECT key FROM translation_cache ORDER BY last_used, rowid LIMIT ?)",
+            (excess,)
+        )
+        self._count -= excess
+        self.evicted += excess
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "stores": self.stores,
+            "evicted": self.evicted,
+            "entries": self._count,
+        }
+
+    def log_stats(self):
+        logger.info(
+            f"Translation cache: {self.hits}/{self.hits + self.misses} hits ({self.hit_rate:.0%}), "
+            f"{self.stores} stored, {self.evicted} evicted, {self._count} entries"
+        )
+
+    def close(self):
+        with self._lock:
+            self._write_touches()
+            self.conn.commit()
+            self.conn.close()
@@ -0,0 +1,30 @@
+import threading
+import time
+
+class FakeBackend:
+    """
+    Offline stand-in for a remote translation API (TRANSLATION_BACKEND=fake).
+    Sleeps like a network round trip and "translates" by transliterating Devanagari to
+    Latin letters, so output is deterministic and passes the Nepali-residue checks.
+    """
+    def __init__(self, latency=0.05, per_char=0.00001):
+        self.latency = latency    # seconds per request
+        self.per_char = per_char  # seconds per input character
+        self.requests = 0
+        self.characters = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _transliterate(text):
+        return "".join(
+            chr(ord("a") + (ord(c) - 0x0900) % 26) if "ऀ" <= c <= "ॿ" else c
+            for c in text
+        )
+
+    def translate_batch(self, texts):
+        chars = sum(len(t) for t in texts)
+        with self._lock:
+            self.requests += 1
+            self.characters += chars
+        time.sleep(self.latency + self.per_char * chars)
+        return [self._transliterate(t) for t in texts]
@@ -0,0 +1,110 @@
+import logging
+import threading
+import time
+from config import Config
+from translator.batching import sentence_chunks
+
+logger = logging.getLogger(__name__)
+
+class MarianEngine:
+    """
+    Local MarianMT translation (TRANSLATION_BACKEND=marian).
+    Texts are split into sentences, deduplicated and sorted by token length so each
+    padded batch holds similar-length inputs; generate() runs batch by batch under
+    torch.inference_mode(). The model can be int8 dynamically quantized or run through
+    an ONNX Runtime export (optimum) instead of eager PyTorch.
+    """
+    SENTENCE_CHARS = 400  # Longer sentences are word-wrapped so no input is truncated
+
+    def __init__(self, model_name=None, threads=None, batch_size=None, max_tokens=None,
+                 quantize=None, onnx=None):
+        import torch
+        from transformers import MarianMTModel, MarianTokenizer
+
+        self.torch = torch
+        self.model_name = model_name or Config.MARIAN_MODEL
+        self.batch_size = batch_size or Config.MARIAN_BATCH_SIZE
+        self.max_tokens = max_tokens or Config.MARIAN_MAX_TOKENS
+        threads = Config.MARIAN_THREADS if threads is None else threads
+        quantize = Config.MARIAN_QUANTIZE if quantize is None else quantize
+        onnx = Config.MARIAN_ONNX if onnx is None else onnx
+
+        if threads:
+            torch.set_num_threads(threads)
+        self.threads = torch.get_num_threads()
+
+        self.tokenizer = MarianTokenizer.from_pretrained(self.model_name)
+        self.runtime = "torch"
+        self.model = None
+        if onnx:
+            try:
+                from optimum.onnxruntime import ORTModelForSeq2SeqLM
+                self.model = ORTModelForSeq2SeqLM.from_pretrained(self.model_name, export=True)
+                self.runtime = "onnx"
+            except Exception as e:
+                logger.warning(f"ONNX export of {self.model_name} failed, using PyTorch: {e}")
+        if self.model is None:
+            self.model = MarianMTModel.from_pretrained(self.model_name)
+            self.model.eval()
+            if quantize:
+                self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+                self.runtime = "torch-int8"
+
+        # Throughput metrics for this process
+        self._lock = threading.Lock()
+        self.sentences = 0
+        self.batches = 0
+        self.seconds = 0.0
+        logger.info(f"MarianMT {self.model_name} loaded ({self.runtime}, {self.threads} threads, batch {self.batch_size})")
+
+    def translate(self, texts):
+        """Translate a list of texts; returns translations in the same order"""
+        layout = [sentence_chunks(text, self.SENTENCE_CHARS, merge=False) if text else [] for text in texts]
+        unique = list(dict.fromkeys(sentence for chunks in layout for sentence, _ in chunks))
+        translated = dict(zip(unique, self.translate_sentences(unique)))
+        return ["".join(translated[sentence] + joiner for sentence, joiner in chunks) for chunks in layout]
+
+    def translate_sentences(self, sentences):
+        """Translate sentences in length-sorted padded batches; returns results in input order"""
+        if not sentences:
+            return []
+        start = time.perf_counter()
+        input_ids = self.tokenizer(sentences, truncation=True, max_length=self.max_tokens)["input_ids"]
+        order = sorted(range(len(sentences)), key=lambda i: len(input_ids[i]))
+        results = [None] * len(sentences)
+        batches = 0
+        with self.torch.inference_mode():
+            for b in range(0, len(order), self.batch_size):
+                batch = order[b:b + self.batch_size]
+                inputs = self.tokenizer.pad({"input_ids": [input_ids[i] for i in batch]}, return_tensors="pt")
+                generated = self.model.generate(**inputs, max_length=self.max_tokens)
+                for i, text in zip(batch, self.tokenizer.batch_decode(generated, skip_special_tokens=True)):
+                    results[i] = text
+                batches += 1
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.sentences += len(sentences)
+            self.batches += batches
+            self.seconds += elapsed
+        logger.debug(f"MarianMT: {len(sentences)} sentences in {batches} batches, {len(sentences) / elapsed:.1f} sentences/s")
+        return results
+
+    @property
+    def sentences_per_sec(self):
+        return self.sentences / self.seconds if self.seconds else 0.0
+
+    def stats(self):
+        return {
+            "runtime": self.runtime,
+            "threads": self.threads,
+            "sentences": self.sentences,
+            "batches": self.batches,
+            "seconds": self.seconds,
+            "sentences_per_sec": self.sentences_per_sec,
+        }
+
+    def log_stats(self):
+        logger.info(
+            f"MarianMT ({self.runtime}, {self.threads} threads): {self.sentences} sentences in {self.batches} batches, "
+            f"{self.seconds:.1f} s, {self.sentences_per_sec:.1f} sentences/s"
+        )
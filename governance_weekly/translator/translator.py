@@ -1,9 +1,26 @@
 import logging
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
+from translator.batching import TokenBucket, pack_batches, sentence_chunks
+from translator.cache import TranslationCache
+from translator.fake import FakeBackend
+from utils.language import has_devanagari, language_spans, strip_devanagari
 
 logger = logging.getLogger(__name__)
 
+# One rate limiter per backend, shared by every Translator in the process
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+def _bucket_for(backend, rate, burst):
+    with _buckets_lock:
+        if backend not in _buckets:
+            _buckets[backend] = TokenBucket(rate, burst)
+        return _buckets[backend]
+
 class Translator:
     """
     Multi-backend translator with robust retry mechanism
@@ -15,11 +32,38 @@ class Translator:
     RETRY_DELAYS = [2, 4, 8]  # Exponential backoff: 2s, 4s, 8s
     REQUEST_TIMEOUT = 10  # seconds
     
-    def __init__(self):
+    # translate_many request shaping per backend:
+    #   chunk_chars  longest single segment (chunks end on sentence boundaries)
+    #   batch_items / batch_chars  segments and characters per request
+    #   rate / burst  requests per second (token bucket), None = unlimited
+    #   workers  requests in flight
+    # marian splits its batches into sentences itself and uses torch's own threads, so one worker
+    BACKEND_LIMITS = {
+        "google":      {"chunk_chars": 4000, "batch_items": 100, "batch_chars": 30000, "rate": 10.0, "burst": 10, "workers": 4},
+        "googletrans": {"chunk_chars": 4000, "batch_items": 1,   "batch_chars": 4000,  "rate": 2.0,  "burst": 2,  "workers": 2},
+        "gemini":      {"chunk_chars": 4000, "batch_items": 30,  "batch_chars": 12000, "rate": 1.0,  "burst": 2,  "workers": 4},
+        "marian":      {"chunk_chars": 4000, "batch_items": 64,  "batch_chars": 64000, "rate": None, "burst": 1,  "workers": 1},
+        "fake":        {"chunk_chars": 4000, "batch_items": 50,  "batch_chars": 20000, "rate": 20.0, "burst": 5,  "workers": 8},
+        "none":        {"chunk_chars": 4000, "batch_items": 100, "batch_chars": 100000, "rate": None, "burst": 1, "workers": 1},
+    }
+    
+    def __init__(self, cache_path=Config.TRANSLATION_CACHE_PATH):
         self.backend = Config.TRANSLATION_BACKEND
         self.client = None
         self._setup_backend()
         
+        # Results are cached on disk; opened on first use (cache_path=None disables)
+        self.cache_path = cache_path
+        self._cache = None
+        self._lock = threading.Lock()
+        
+        # translate_many volume: characters sent for translation vs. passed through as English
+        self.chars_translated = 0
+        self.chars_skipped = 0
+        
+        limits = self.limits
+        self._bucket = _bucket_for(self.backend, Config.TRANSLATION_RATE_PER_SEC or limits["rate"], limits["burst"])
+        
         # Validate at least one backend is working
         if self.backend == "none":
             logger.critical("=" * 80)
@@ -34,6 +78,10 @@ class Translator:
             logger.info(f"Translation backend active: {self.backend}")
 
     def _setup_backend(self):
+        if self.backend == "fake":
+            self.fake = FakeBackend()
+            return
+        
         if self.backend == "google":
             try:
                 from google.cloud import translate_v2 as translate
@@ -69,19 +117,38 @@ class Translator:
                 
         if self.backend == "marian":
             try:
-                from transformers import MarianMTModel, MarianTokenizer
-                model_name = "Helsinki-NLP/opus-mt-ne-en"
-                self.tokenizer = MarianTokenizer.from_pretrained(model_name)
-                self.model = MarianMTModel.from_pretrained(model_name)
+                from translator.marian import MarianEngine
+                self.marian = MarianEngine()
             except Exception as e:
                 logger.error(f"Failed to load MarianMT: {e}")
                 self.backend = "none"
 
+    @property
+    def cache(self):
+        if self._cache is None and self.cache_path:
+            with self._lock:
+                if self._cache is None:
+                    self._cache = TranslationCache(self.cache_path)
+        return self._cache
+
+    def close(self):
+        total = self.chars_translated + self.chars_skipped
+        if total:
+            logger.info(f"Language detection: {self.chars_skipped}/{total} chars ({self.chars_skipped / total:.0%}) "
+                        f"were English and not sent for translation")
+        if self.backend == "marian":
+            self.marian.log_stats()
+        if self._cache is not None:
+            self._cache.log_stats()
+            self._cache.close()
+            self._cache = None
+
+    @property
+    def limits(self):
+        return self.BACKEND_LIMITS.get(self.backend, self.BACKEND_LIMITS["none"])
+
     def _contains_nepali(self, text):
-        for char in text:
-            if '\u0900' <= char <= '\u097F':
-                return True
-        return False
+        return has_devanagari(text)
 
     def _translate_with_googletrans(self, text, source_lang, target_lang):
         """
@@ -123,6 +190,55 @@ class Translator:
         logger.error(f"All {self.MAX_RETRIES} googletrans attempts failed")
         return None
 
+    def _call_backend(self, text, source_lang, target_lang):
+        """One translation through the active backend; None if it produced nothing"""
+        translated_text = None
+        self._bucket.acquire()  # Cache hits never reach this
+        
+        if self.backend == "fake":
+            translated_text = self.fake.translate_batch([text])[0]
+        
+        elif self.backend == "google":
+            result = self.client.translate(text, target_language=target_lang)
+            translated_text = result["translatedText"]
+
+        elif self.backend == "googletrans":
+            translated_text = self._translate_with_googletrans(text, source_lang, target_lang)
+
+            # If googletrans completely failed, try gemini fallback
+            if translated_text is None:
+                logger.info("Trying Gemini fallback...")
+                try:
+                    import google.generativeai as genai
+                    api_key = Config.GEMINI_API_KEY if hasattr(Config, 'GEMINI_API_KEY') else None
+                    if api_key:
+                        genai.configure(api_key=api_key)
+                        model = genai.GenerativeModel('gemini-2.5-flash')
+                        prompt = f"Translate the following Nepali text to English. Only provide the translation, nothing else:\n\n{text}"
+                        response = model.generate_content(prompt)
+                        translated_text = response.text.strip()
+                        logger.info("Gemini fallback succeeded")
+                except Exception as e:
+                    logger.warning(f"Gemini fallback failed: {e}")
+
+        elif self.backend == "gemini":
+            for attempt in range(self.MAX_RETRIES):
+                try:
+                    if attempt > 0:
+                        time.sleep(self.RETRY_DELAYS[min(attempt, len(self.RETRY_DELAYS)-1)])
+
+                    prompt = f"Translate the following Nepali text to English. Only provide the translation, nothing else:\n\n{text}"
+                    response = self.gemini_model.generate_content(prompt)
+                    translated_text = response.text.strip()
+                    break
+                except Exception as e:
+                    logger.warning(f"Gemini attempt {attempt+1} failed: {e}")
+
+        elif self.backend == "marian":
+            translated_text = self.marian.translate([text])[0]
+        
+        return translated_text
+
     def translate(self, text, source_lang="ne", target_lang="en"):
         """
         Translate text with robust retry mechanism
@@ -131,68 +247,164 @@ class Translator:
         if not text:
             return ""
         
-        if source_lang == target_lang:
+        if source_lang == target_lang or (source_lang == "ne" and not has_devanagari(text)):
             return text
 
-        translated_text = None
-        
+        cache = self.cache
+        if cache:
+            cached = cache.get(text, self.backend, source_lang, target_lang)
+            if cached is not None:
+                return cached
+
         try:
-            if self.backend == "google":
-                result = self.client.translate(text, target_language=target_lang)
-                translated_text = result["translatedText"]
-            
-            elif self.backend == "googletrans":
-                translated_text = self._translate_with_googletrans(text, source_lang, target_lang)
-                
-                # If googletrans completely failed, try gemini fallback
-                if translated_text is None:
-                    logger.info("Trying Gemini fallback...")
-                    try:
-                        import google.generativeai as genai
-                        api_key = Config.GEMINI_API_KEY if hasattr(Config, 'GEMINI_API_KEY') else None
-                        if api_key:
-                            genai.configure(api_key=api_key)
-                            model = genai.GenerativeModel('gemini-2.5-flash')
-                            prompt = f"Translate the following Nepali text to English. Only provide the translation, nothing else:\n\n{text}"
-                            response = model.generate_content(prompt)
-                            translated_text = response.text.strip()
-                            logger.info("Gemini fallback succeeded")
-                    except Exception as e:
-                        logger.warning(f"Gemini fallback failed: {e}")
-            
-            elif self.backend == "gemini":
-                for attempt in range(self.MAX_RETRIES):
-                    try:
-                        if attempt > 0:
-                            time.sleep(self.RETRY_DELAYS[min(attempt, len(self.RETRY_DELAYS)-1)])
-                        
-                        prompt = f"Translate the following Nepali text to English. Only provide the translation, nothing else:\n\n{text}"
-                        response = self.gemini_model.generate_content(prompt)
-                        translated_text = response.text.strip()
-                        break
-                    except Exception as e:
-                        logger.warning(f"Gemini attempt {attempt+1} failed: {e}")
-            
-            elif self.backend == "marian":
-                inputs = self.tokenizer([text], return_tensors="pt", padding=True, truncation=True, max_length=512)
-                generated = self.model.generate(**inputs)
-                translated_text = self.tokenizer.decode(generated[0], skip_special_tokens=True)
-                
+            translated_text = self._call_backend(text, source_lang, target_lang)
         except Exception as e:
             logger.error(f"Translation error ({self.backend}): {e}")
             return text  # Return original on hard error
 
+        result, clean = self._postprocess(text, translated_text)
+        # Only clean translations are cached; failures and partial results are retried next time
+        if clean and cache:
+            cache.put(text, self.backend, source_lang, target_lang, result)
+        return result
+
+    def _postprocess(self, text, translated_text):
+        """Final value for one backend result: (text to return, whether it is a clean translation)"""
         # If no translation result, return original
         if translated_text is None:
             logger.warning("Translation returned None, using original text")
-            return text
+            return text, False
 
         # Post-processing: Clean up if still contains Nepali
         if self._contains_nepali(translated_text):
             logger.warning(f"Translation result still contains Nepali. Backend: {self.backend}")
-            cleaned_text = "".join([c for c in translated_text if not ('\u0900' <= c <= '\u097F')])
+            cleaned_text = strip_devanagari(translated_text)
             if len(cleaned_text.strip()) < len(translated_text) * 0.5:
-                return "[Translation Pending]"  # Changed from "Failed" to "Pending"
-            return cleaned_text
+                return "[Translation Pending]", False  # Changed from "Failed" to "Pending"
+            return cleaned_text, False
 
-        return translated_text
+        return translated_text, True
+
+    def _call_backend_batch(self, texts, source_lang, target_lang):
+        """
+        One request for a batch of segments where the backend supports it.
+        Returns a list aligned with `texts` (None where nothing came back).
+        """
+        if len(texts) == 1:
+            return [self._call_backend(texts[0], source_lang, target_lang)]
+        
+        if self.backend == "fake":
+            self._bucket.acquire()
+            return self.fake.translate_batch(texts)
+        
+        if self.backend == "google":
+            self._bucket.acquire()
+            results = self.client.translate(texts, target_language=target_lang)
+            return [r["translatedText"] for r in results]
+        
+        if self.backend == "gemini":
+            self._bucket.acquire()
+            segments = "\n\n".join(f"[[{i + 1}]] {t}" for i, t in enumerate(texts))
+            prompt = (
+                "Translate each numbered Nepali segment below to English. Keep every [[n]] marker "
+                "in front of its translation and output nothing else.\n\n" + segments
+            )
+            response = self.gemini_model.generate_content(prompt)
+            parts = re.split(r'\[\[(\d+)\]\]', response.text)
+            found = {int(parts[i]): parts[i + 1].strip() for i in range(1, len(parts) - 1, 2)}
+            if sorted(found) == list(range(1, len(texts) + 1)):
+                return [found[i + 1] for i in range(len(texts))]
+            logger.warning(f"Gemini batch returned {len(found)}/{len(texts)} segments, translating one by one")
+        
+        elif self.backend == "marian":
+            return self.marian.translate(texts)
+        
+        return [self._call_backend(t, source_lang, target_lang) for t in texts]
+
+    def translate_many(self, texts, source_lang="ne", target_lang="en"):
+        """
+        Translate a list of texts (titles, article bodies) and return results in the same order.
+        From Nepali, only Devanagari paragraphs are translated; English paragraphs pass
+        through unchanged. Long texts are split into sentence-aligned chunks; cached chunks
+        are reused; the rest are packed into per-backend request batches sent concurrently,
+        rate limited by the backend's token bucket.
+        """
+        if source_lang == target_lang:
+            return [text or "" for text in texts]
+        
+        limits = self.limits
+        # Chunk every text; identical chunks (repeated boilerplate, wire copy) are translated once
+        layout = []  # per text: [(chunk, joiner, translate)]
+        pending = {}  # chunk -> translation (None until done)
+        cache = self.cache
+        translated_chars = skipped_chars = 0
+        for text in texts:
+            chunks = self._segments(text, source_lang, limits["chunk_chars"])
+            layout.append(chunks)
+            for chunk, _, translate in chunks:
+                if not translate:
+                    skipped_chars += len(chunk)
+                    continue
+                translated_chars += len(chunk)
+                if chunk not in pending:
+                    cached = cache.get(chunk, self.backend, source_lang, target_lang) if cache else None
+                    pending[chunk] = cached
+        
+        todo = [chunk for chunk, translated in pending.items() if translated is None]
+        batches = [[todo[i] for i in batch] for batch in pack_batches(todo, limits["batch_items"], limits["batch_chars"])]
+        
+        def translate_one(chunk):
+            try:
+                return self._call_backend(chunk, source_lang, target_lang)
+            except Exception as e:
+                logger.error(f"Translation error ({self.backend}): {e}")
+                return None
+        
+        def run(batch):
+            try:
+                results = self._call_backend_batch(batch, source_lang, target_lang)
+            except Exception as e:
+                if len(batch) == 1:
+                    logger.error(f"Translation error ({self.backend}): {e}")
+                    results = [None]
+                else:
+                    # Per-segment calls carry the backend's own retries
+                    logger.warning(f"Batch of {len(batch)} failed ({self.backend}: {e}), translating one by one")
+                    results = [translate_one(chunk) for chunk in batch]
+            for chunk, translated in zip(batch, results):
+                result, clean = self._postprocess(chunk, translated)
+                if clean and cache:
+                    cache.put(chunk, self.backend, source_lang, target_lang, result)
+                pending[chunk] = result
+        
+        if batches:
+            workers = min(Config.TRANSLATION_WORKERS or limits["workers"], len(batches))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as pool:
+                list(pool.map(run, batches))
+        
+        with self._lock:
+            self.chars_translated += translated_chars
+            self.chars_skipped += skipped_chars
+        return ["".join((pending[chunk] if translate else chunk) + joiner for chunk, joiner, translate in chunks)
+                for chunks in layout]
+
+    @staticmethod
+    def _segments(text, source_lang, chunk_chars):
+        """
+        [(segment, joiner, translate)] for one text. Nepali text is split into runs of
+        Devanagari and English paragraphs first; only the Devanagari runs are chunked for
+        translation.
+        """
+        if not text:
+            return []
+        if source_lang != "ne":
+            return [(chunk, joiner, True) for chunk, joiner in sentence_chunks(text, chunk_chars)]
+        segments = []
+        for span, separator, nepali in language_spans(text):
+            if not nepali:
+                segments.append((span, separator, False))
+                continue
+            chunks = sentence_chunks(span, chunk_chars)
+            segments.extend((chunk, joiner, True) for chunk, joiner in chunks[:-1])
+            segments.append((chunks[-1][0], separator, True))
+        return segments
@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from config import Config
+from database.translation_queue import TranslationQueue
+from reporting.summarizer import Summarizer
+from utils.article_filter import add_report_features
+from utils.language import contains_nepali
+
+logger = logging.getLogger(__name__)
+
+def _untranslated(original, translated):
+    """True if a Nepali original came back with Nepali paragraphs left in it, or as a placeholder"""
+    if not contains_nepali(original):
+        return False
+    return translated is None or "[Translation Pending]" in translated or contains_nepali(translated)
+
+class TranslationWorkerPool:
+    """
+    Drains the translation queue: each worker thread claims a few pending articles,
+    translates their titles and bodies in one translate_many call, then summarizes and
+    classifies them and stores the row as pending_review (or excluded).
+    A failed article is retried with exponential backoff up to TRANSLATION_MAX_ATTEMPTS;
+    on the last attempt whatever came back is kept, as inline translation used to do.
+    """
+    def __init__(self, translator, classifier, workers=None, batch_size=None, max_attempts=None, db_path=None):
+        self.translator = translator
+        self.classifier = classifier
+        self.summarizer = Summarizer()
+        self.workers = workers or Config.TRANSLATION_QUEUE_WORKERS
+        self.batch_size = batch_size or Config.TRANSLATION_QUEUE_BATCH
+        self.max_attempts = max_attempts or Config.TRANSLATION_MAX_ATTEMPTS
+        self.db_path = db_path
+        self.poll_sec = Config.TRANSLATION_POLL_SEC
+        self._owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._threads = []
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.counts = {"translated": 0, "excluded": 0, "retried": 0, "failed": 0}
+
+    def start(self, done):
+        """
+        Start the workers. Each one exits when `done` is set and no pending article is left
+        but those other workers hold: articles in retry backoff are waited for, so a pool
+        started with `done` already set drains the queue, final attempts included, and stops.
+        """
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, args=(f"{self._owner}:{i}", done),
+                                      name=f"translate-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _join(self):
+        for thread in self._threads:
+            while thread.is_alive():
+                thread.join(timeout=1)  # Short joins keep Ctrl-C responsive
+        self._threads = []
+
+    def wait(self):
+        """Block until the workers exit; Ctrl-C stops them after the batches in hand (leases are released)"""
+        try:
+            self._join()
+        except KeyboardInterrupt:
+            logger.info("Stopping translation workers...")
+            self._stop.set()
+            self._join()
+
+    def run(self, done):
+        self.start(done)
+        self.wait()
+
+    def _count(self, key):
+        with self._lock:
+            self.counts[key] += 1
+
+    def _work(self, owner, done):
+        queue = TranslationQueue(self.db_path)
+        try:
+            while not self._stop.is_set():
+                rows = queue.claim(owner, self.batch_size)
+                if not rows:
+                    if done.is_set():
+                        # Nothing more is coming; wait for scheduled retries rather than leave them behind
+                        retry_at = queue.next_retry()
+                        if retry_at is None:
+                            return
+                        self._stop.wait(max(retry_at - time.time(), 0.05))
+                        continue
+                    self._stop.wait(self.poll_sec)
+                    continue
+                self._process(queue, owner, rows)
+        except Exception as e:
+            logger.error(f"Translation worker {owner} stopped: {e}")
+        finally:
+            released = queue.release(owner)
+            if released:
+                logger.info(f"Worker {owner} released {released} unfinished articles")
+            queue.close()
+
+    def _retry_or_fail(self, queue, owner, row, error):
+        attempts = row["translation_attempts"]
+        if attempts >= self.max_attempts:
+            logger.error(f"Giving up on {row['url']} after {attempts} attempts: {error}")
+            queue.fail(row["url"], owner, error)
+            self._count("failed")
+        else:
+            delay = Config.TRANSLATION_RETRY_BASE_SEC * 2 ** (attempts - 1)
+            logger.warning(f"Translation attempt {attempts} for {row['url']} failed ({error}), retrying in {delay:.0f}s")
+            queue.retry(row["url"], owner, error, delay)
+            self._count("retried")
+
+    def _process(self, queue, owner, rows):
+        texts = [text or "" for row in rows for text in (row["title_original"], row["full_text_original"])]
+        try:
+            translated = self.translator.translate_many(texts, source_lang='ne', target_lang='en')
+        except Exception as e:
+            for row in rows:
+                self._retry_or_fail(queue, owner, row, f"{type(e).__name__}: {e}")
+            return
+
+        for i, row in enumerate(rows):
+            title, body = translated[2 * i], translated[2 * i + 1]
+            title_failed = _untranslated(row["title_original"], title)
+            body_failed = _untranslated(row["full_text_original"], body)
+            final = row["translation_attempts"] >= self.max_attempts
+            if (title_failed or body_failed) and not final:
+                self._retry_or_fail(queue, owner, row, "translation still contains Nepali")
+                continue
+
+            try:
+                if title_failed:
+                    title = "[Translation Failed]"
+                if body_failed:
+                    logger.warning(f"Full text translation returned Nepali for {row['url']}")
+
+                summary = self.summarizer.summarize(body) if body else ""
+                classification = self.classifier.classify(f"{title}\n{body}")
+                status = "excluded" if classification.get('is_excluded') else "pending_review"
+                fields = {
+                    "title_translated": title,
+                    "full_text_translated": body,
+                    "summary": summary,
+                    "categories": json.dumps(classification['categories']),
+                    "relevance_score": classification['relevance_score'],
+                }
+                add_report_features([fields])
+                queue.complete(row["url"], owner, status, fields)
+                self._count("excluded" if status == "excluded" else "translated")
+            except Exception as e:
+                self._retry_or_fail(queue, owner, row, f"{type(e).__name__}: {e}")
+
+    def report(self):
+        queue = TranslationQueue(self.db_path)
+        try:
+            remaining = queue.counts()
+        finally:
+            queue.close()
+        logger.info(
+            f"Translation queue: {self.counts['translated']} translated, {self.counts['excluded']} excluded, "
+            f"{self.counts['retried']} retries scheduled, {self.counts['failed']} failed; "
+            f"left: {remaining['ready']} ready, {remaining['waiting']} awaiting retry, {remaining['leased']} leased"
+        )
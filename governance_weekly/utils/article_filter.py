@@ -2,27 +2,45 @@
 WEIGHTED SCORING filter for Nepal March 5, 2026 Election
 Pre-election phase: Captures political maneuvering + direct election news
 """
+import heapq
+import json
 import re
+import zlib
 from difflib import SequenceMatcher
-from typing import List, Dict, Set
+from typing import Iterable, List, Dict, Set
+from utils.dedup import DuplicateIndex
 
-# Import keyword tiers for validation
+# Import keyword tiers and the shared scoring engine for validation
 try:
     from classifier.keywords import (
         tier1_election_keywords, tier2_political_keywords, 
-        tier3_context_keywords, exclude_keywords
+        tier3_context_keywords, exclude_keywords, report_exclude_keywords
     )
+    from classifier.classifier import get_classifier
 except ImportError:
     tier1_election_keywords = []
     tier2_political_keywords = []
     tier3_context_keywords = []
     exclude_keywords = []
+    report_exclude_keywords = []
+    get_classifier = None
 
 # Scoring weights
 TIER1_WEIGHT = 5  # Direct election terms
 TIER2_WEIGHT = 3  # High-intent political context
 TIER3_WEIGHT = 1  # General context
 PASS_THRESHOLD = 5
+REPORT_CATEGORIES = ("Election", "Governance")
+
+# Report features stored per article (see report_features) are recomputed when this changes.
+# It covers the weights and keyword lists; bump FEATURES_REVISION when the formulas change.
+FEATURES_REVISION = 1
+FEATURES_VERSION = zlib.crc32(repr((
+    FEATURES_REVISION, TIER1_WEIGHT, TIER2_WEIGHT, TIER3_WEIGHT, tier1_election_keywords,
+    tier2_political_keywords, tier3_context_keywords, report_exclude_keywords,
+)).encode("utf-8"))
+FEATURE_COLUMNS = ("weighted_score", "report_excluded", "impact_score",
+                   "title_fingerprint", "summary_fingerprint", "features_version")
 
 def normalize_text(text: str) -> str:
     """Normalize text for comparison"""
@@ -42,34 +60,68 @@ def calculate_similarity(text1: str, text2: str) -> float:
     
     return SequenceMatcher(None, norm1, norm2).ratio()
 
+def _ratio(norm1: str, norm2: str) -> float:
+    """calculate_similarity on already normalized texts"""
+    if not norm1 or not norm2:
+        return 0.0
+    return SequenceMatcher(None, norm1, norm2).ratio()
+
+def fingerprints(article: Dict):
+    """Normalized title and summary, the stored fingerprints when present"""
+    if article.get('title_fingerprint') is not None:
+        return article['title_fingerprint'], article.get('summary_fingerprint') or ""
+    title = article.get('title_translated') or article.get('title_original') or ''
+    return normalize_text(title), normalize_text(article.get('summary') or '')
+
 def is_duplicate(article: Dict, seen_articles: List[Dict], title_threshold: float = 0.90, summary_threshold: float = 0.80) -> bool:
     """Check if article is duplicate based on title and summary similarity"""
-    current_title = article.get('title_translated') or article.get('title_original', '')
-    current_summary = article.get('summary', '')
+    current_title, current_summary = fingerprints(article)
     
     for seen in seen_articles:
-        seen_title = seen.get('title_translated') or seen.get('title_original', '')
-        seen_summary = seen.get('summary', '')
+        seen_title, seen_summary = fingerprints(seen)
         
-        title_sim = calculate_similarity(current_title, seen_title)
+        title_sim = _ratio(current_title, seen_title)
         
         if title_sim >= title_threshold:
             return True
         
         if title_sim >= 0.6:
-            summary_sim = calculate_similarity(current_summary, seen_summary)
+            summary_sim = _ratio(current_summary, seen_summary)
             if summary_sim >= summary_threshold:
                 return True
         
         if title_sim >= 0.7:
-            current_combined = f"{current_title} {current_summary}"
-            seen_combined = f"{seen_title} {seen_summary}"
-            combined_sim = calculate_similarity(current_combined, seen_combined)
+            # normalize_text(f"{title} {summary}") is the two normalized parts joined
+            current_combined = " ".join(filter(None, (current_title, current_summary)))
+            seen_combined = " ".join(filter(None, (seen_title, seen_summary)))
+            combined_sim = _ratio(current_combined, seen_combined)
             if combined_sim >= 0.85:
                 return True
     
     return False
 
+def _combined_text(article: Dict) -> str:
+    """Title and summary, the text the report filter scores"""
+    title = (article.get('title_translated') or article.get('title_original') or '').lower()
+    summary = (article.get('summary') or '').lower()
+    return f"{title} {summary}"
+
+def score_articles(articles: List[Dict]):
+    """
+    One keyword-matcher pass over each article's title + summary.
+    Returns the classifier's BatchResult (tier counts, weighted scores, matched keyword ids),
+    or None when the classifier package is unavailable.
+    """
+    if get_classifier is None:
+        return None
+    return get_classifier().classify_batch([_combined_text(a) for a in articles])
+
+def exclusion_flags(scores, count: int):
+    """Per article: does title + summary contain a report exclusion keyword"""
+    if scores is None:
+        return [False] * count
+    return scores.contains_any(get_classifier().keyword_mask(report_exclude_keywords))
+
 def calculate_weighted_score(article: Dict) -> float:
     """
     Calculate weighted score based on keyword tiers
@@ -77,64 +129,36 @@ def calculate_weighted_score(article: Dict) -> float:
     Tier 2 (Political Context): 3 points each
     Tier 3 (General Context): 1 point each
     """
-    title = (article.get('title_translated') or article.get('title_original', '')).lower()
-    summary = (article.get('summary', '')).lower()
-    combined = f"{title} {summary}"
-    
-    tier1_count = sum(1 for k in tier1_election_keywords if k.lower() in combined)
-    tier2_count = sum(1 for k in tier2_political_keywords if k.lower() in combined)
-    tier3_count = sum(1 for k in tier3_context_keywords if k.lower() in combined)
-    
-    weighted_score = (
-        tier1_count * TIER1_WEIGHT +
-        tier2_count * TIER2_WEIGHT +
-        tier3_count * TIER3_WEIGHT
-    )
-    
-    return weighted_score
+    scores = score_articles([article])
+    if scores is None:
+        return 0
+    return int(scores.weighted_scores[0])
 
 def has_exclusion_keyword(article: Dict) -> bool:
     """Check if article contains strong exclusion keywords"""
-    title = (article.get('title_translated') or article.get('title_original', '')).lower()
-    summary = (article.get('summary', '')).lower()
-    combined = f"{title} {summary}"
-    
-    strong_excludes = [
-        "nepse", "stock market", "share market", "trading volume",
-        "beauty pageant", "mrs world", "miss world", "mrs nepal",
-        "tourist", "tourism", "pilgrimage", "pilgrim", "lumbini",
-        "trump", "biden", "venezuela", "foreign policy",
-        "poem", "poetry", "poet", "literature", "book launch",
-        "cricket", "football", "sports", "entertainment",
-        "hacking", "cyber attack", "data theft",
-        "weather", "cold wave", "temperature"
-    ]
-    
-    for keyword in strong_excludes:
-        if keyword in combined:
-            return True
-    return False
+    return bool(exclusion_flags(score_articles([article]), 1)[0])
 
-def calculate_impact_score(article: Dict) -> float:
-    """Calculate impact score using weighted scoring"""
+def calculate_impact_score(article: Dict, weighted: float = None) -> float:
+    """Calculate impact score using weighted scoring (pass `weighted` if already computed)"""
     score = 0.0
     
     # Base: weighted score from keyword tiers
-    weighted = calculate_weighted_score(article)
+    if weighted is None:
+        weighted = calculate_weighted_score(article)
     score += weighted
     
     # Add classifier's relevance score
-    score += article.get('relevance_score', 0)
+    score += article.get('relevance_score') or 0
     
     # Category bonuses
-    categories = article.get('categories', [])
+    categories = article.get('categories') or []
     if "Election" in categories:
         score += 10
     if "Governance" in categories:
         score += 5
     
     # Content depth bonus
-    summary_length = len(article.get('summary', ''))
+    summary_length = len(article.get('summary') or '')
     if summary_length > 300:
         score += 5
     elif summary_length > 150:
@@ -142,6 +166,89 @@ def calculate_impact_score(article: Dict) -> float:
     
     return score
 
+def _categories(article: Dict) -> List[str]:
+    """Categories as a list, also when still the JSON stored in the database"""
+    categories = article.get('categories') or []
+    if isinstance(categories, str):
+        try:
+            categories = json.loads(categories)
+        except ValueError:
+            categories = []
+    return categories
+
+def report_features(articles: List[Dict], fingerprint: bool = True) -> List[Dict]:
+    """
+    Everything filter_top_articles derives from one article, stored with the article
+    (FEATURE_COLUMNS) so a report only reads and ranks it:
+      weighted_score       keyword tier score of title + summary
+      report_excluded      1 if outside the report categories or has an exclusion keyword
+      impact_score         calculate_impact_score
+      title_fingerprint    normalized title and summary, for the duplicate check
+      summary_fingerprint
+      features_version     FEATURES_VERSION they were computed with
+    fingerprint=False leaves out the fingerprints; is_duplicate then normalizes the texts of
+    the articles it actually compares.
+    """
+    if not articles:
+        return []
+    scores = score_articles(articles)
+    excluded = exclusion_flags(scores, len(articles))
+    features = []
+    for i, article in enumerate(articles):
+        categories = _categories(article)
+        weighted = int(scores.weighted_scores[i]) if scores is not None else 0
+        features.append({
+            'weighted_score': weighted,
+            'report_excluded': int(bool(excluded[i]) or not any(c in categories for c in REPORT_CATEGORIES)),
+            'impact_score': calculate_impact_score({**article, 'categories': categories}, weighted=weighted),
+            'features_version': FEATURES_VERSION,
+        })
+        if fingerprint:
+            title, summary = fingerprints({**article, 'title_fingerprint': None})
+            features[-1].update(title_fingerprint=title, summary_fingerprint=summary)
+    return features
+
+def add_report_features(articles: List[Dict], fingerprint: bool = True) -> List[Dict]:
+    """report_features merged into the article dicts (in place); returns them"""
+    for article, features in zip(articles, report_features(articles, fingerprint)):
+        article.update(features)
+    return articles
+
+def select_top_articles(candidates: Iterable[Dict], max_articles: int = 40, min_impact_score: float = 10.0) -> List[Dict]:
+    """
+    Deduplicate candidates given in descending impact_score order, keeping at most
+    max_articles. Stops reading as soon as the report is full, so candidates can be a
+    database cursor. A DuplicateIndex does the is_duplicate checks: against every kept
+    article while the report is small or the title short, so up to its exact_scan size the
+    outcome is is_duplicate's; beyond that only LSH candidates are compared, which can miss
+    a near-duplicate.
+    """
+    unique_articles = []
+    index = DuplicateIndex()
+    
+    for article in candidates:
+        if article['impact_score'] < min_impact_score:
+            break
+        
+        if index.add_if_new(*fingerprints(article)):
+            unique_articles.append(article)
+            
+            if len(unique_articles) >= max_articles:
+                break
+    
+    return unique_articles
+
+def by_impact(articles: List[Dict]) -> Iterable[Dict]:
+    """
+    Articles in descending impact_score order (ties in input order, as a stable sort gives),
+    produced lazily from a heap: O(n) to build, O(log n) per article taken, so selecting the
+    top K of n costs O(n + k log n) for the k read before K unique articles are found.
+    """
+    heap = [(-article['impact_score'], i) for i, article in enumerate(articles)]
+    heapq.heapify(heap)
+    while heap:
+        yield articles[heapq.heappop(heap)[1]]
+
 def filter_top_articles(articles: List[Dict], max_articles: int = 40, min_impact_score: float = 10.0) -> List[Dict]:
     """
     WEIGHTED SCORING filter
@@ -162,44 +269,20 @@ def filter_top_articles(articles: List[Dict], max_articles: int = 40, min_impact
         if "Election" in categories or "Governance" in categories:
             election_articles.append(article)
     
-    # STEP 2: Validate with weighted scoring
-    validated_articles = []
-    for article in election_articles:
-        # Must NOT have exclusion keywords
-        if has_exclusion_keyword(article):
-            continue
-        
-        # Calculate weighted score
-        weighted = calculate_weighted_score(article)
-        
-        # Must pass threshold (5 points)
-        if weighted >= PASS_THRESHOLD:
-            article['weighted_score'] = weighted
-            validated_articles.append(article)
-    
-    # STEP 3: Calculate impact scores
-    for article in validated_articles:
-        article['impact_score'] = calculate_impact_score(article)
-    
-    # STEP 4: Sort by impact score
-    articles_sorted = sorted(validated_articles, key=lambda x: x['impact_score'], reverse=True)
-    
-    # STEP 5: Deduplicate
-    unique_articles = []
-    seen_articles = []
-    
-    for article in articles_sorted:
-        if article['impact_score'] < min_impact_score:
-            continue
-        
-        if not is_duplicate(article, seen_articles):
-            unique_articles.append(article)
-            seen_articles.append(article)
-            
-            if len(unique_articles) >= max_articles:
-                break
+    # STEP 2-3: Weighted scoring (one matcher pass), exclusion and impact scores, computed once:
+    # articles already carrying current features (report_features) keep them. Fingerprints
+    # are left to the dedup step, which only normalizes the articles it reads.
+    add_report_features([a for a in election_articles if a.get('features_version') != FEATURES_VERSION],
+                        fingerprint=False)
+    validated_articles = [
+        article for article in election_articles
+        # Must NOT have exclusion keywords, must pass threshold (5 points) and the impact floor
+        if not article['report_excluded'] and article['weighted_score'] >= PASS_THRESHOLD
+        and article['impact_score'] >= min_impact_score
+    ]
     
-    return unique_articles
+    # STEP 4-5: Highest impact first, deduplicated, until max_articles are kept
+    return select_top_articles(by_impact(validated_articles), max_articles, min_impact_score)
 
 def get_category_distribution(articles: List[Dict]) -> Dict[str, int]:
     """Get count of articles per category"""
@@ -0,0 +1,149 @@
+"""
+In-memory near-duplicate index for report articles, used by article_filter.select_top_articles.
+
+article_filter.is_duplicate flags an article when, against some accepted article, the title
+similarity is >= 0.9, or >= 0.6 with summaries >= 0.8 similar, or >= 0.7 with title + summary
+>= 0.85 similar. Each of those needs a close title or a close title + summary, so MinHash LSH
+over the two picks the accepted articles worth checking. Only those get the same
+SequenceMatcher tests, cheap upper bounds first, against matchers built once per article.
+
+LSH is approximate: a pair the thresholds flag can miss every bucket, most often for short
+titles, where one edited character changes a large share of the few 4-shingles. So short
+titles, and any lookup while no more than EXACT_SCAN_MAX articles are accepted (a report
+keeps MAX_ARTICLES_IN_REPORT, 40 by default), are checked against every accepted article,
+which gives exactly is_duplicate's outcome. Only past that size can a duplicate slip through.
+"""
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Optional
+from utils.minhash import MinHasher, shingles
+
+TITLE_THRESHOLD = 0.90
+SUMMARY_THRESHOLD = 0.80
+COMBINED_THRESHOLD = 0.85
+SUMMARY_TITLE_MIN = 0.6   # Title similarity needed before summaries are compared
+COMBINED_TITLE_MIN = 0.7  # ... and before title + summary is
+EXACT_SCAN_MAX = 64       # Accepted articles compared one by one, without the LSH buckets
+SHORT_TITLE = 48          # Characters; shorter titles have too few shingles for the bands
+
+def _matcher(text: str) -> Optional[SequenceMatcher]:
+    """Matcher with `text` as seq2 (the side SequenceMatcher indexes), or None for empty text"""
+    return SequenceMatcher(None, "", text) if text else None
+
+def _at_least(matcher: Optional[SequenceMatcher], text: str, threshold: float) -> bool:
+    """SequenceMatcher(None, text, seq2).ratio() >= threshold, empty texts never similar"""
+    if matcher is None or not text:
+        return False
+    matcher.set_seq1(text)
+    return (matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold)
+
+class _Entry:
+    __slots__ = ("title", "summary", "combined", "texts")
+
+    def __init__(self, title: str, summary: str, combined: str):
+        self.title = _matcher(title)
+        self.summary = _matcher(summary)
+        self.combined = _matcher(combined)
+        self.texts = (title, combined)  # For LSH keys, computed only once the buckets are in use
+
+class DuplicateIndex:
+    """
+    Accepted articles, by their normalized title and summary (article_filter.fingerprints).
+    Pairs the thresholds above flag share 45% or more of their 4-shingles in practice; with
+    three-row bands they land in a common bucket 95% of the time at 45% and 99.9% at 60%,
+    while unrelated headlines on the same topics (~10% overlap) rarely do.
+    No MinHash signature is computed while the index is within exact_scan entries (always,
+    for a report); the buckets are filled for every entry the first time it grows past that.
+    benchmarks.bench_report_dedup checks the outcome against the pairwise scan.
+    """
+    def __init__(self, num_perm: int = 96, bands: int = 32, exact_scan: int = EXACT_SCAN_MAX):
+        self.hasher = MinHasher(num_perm=num_perm, bands=bands)
+        self.exact_scan = exact_scan
+        self.entries = []
+        self.title_buckets = defaultdict(list)
+        self.combined_buckets = defaultdict(list)
+        self.bucketed = False  # Buckets hold every entry
+        self.checks = 0  # Exact comparisons made, for benchmarks
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _keys(self, text: str) -> list:
+        signature = self.hasher.signature(shingles(text, self.hasher.k))
+        return [] if signature is None else self.hasher.band_keys(signature)
+
+    def _use_buckets(self) -> bool:
+        return len(self.entries) > self.exact_scan
+
+    def _bucket(self, i: int, title_keys: list, combined_keys: list):
+        for key in title_keys:
+            self.title_buckets[key].append(i)
+        for key in combined_keys:
+            self.combined_buckets[key].append(i)
+
+    def _fill_buckets(self):
+        """Bucket every entry; from now on each new entry is bucketed as it is added"""
+        for i, entry in enumerate(self.entries):
+            title, combined = entry.texts
+            if title:
+                self._bucket(i, self._keys(title), self._keys(combined))
+        self.bucketed = True
+
+    def find(self, title: str, summary: str, title_keys=None, combined_keys=None) -> Optional[int]:
+        """Position of the first accepted article this one duplicates, or None"""
+        if not title:
+            return None  # No title similarity, so no rule can match
+        combined = " ".join(filter(None, (title, summary)))
+        if not self._use_buckets() or len(title) < SHORT_TITLE:
+            candidates = range(len(self.entries))
+        else:
+            if not self.bucketed:
+                self._fill_buckets()
+            if title_keys is None:
+                title_keys, combined_keys = self._keys(title), self._keys(combined)
+            candidates = {i for key in title_keys for i in self.title_buckets.get(key, ())}
+            candidates.update(i for key in combined_keys for i in self.combined_buckets.get(key, ()))
+            candidates = sorted(candidates)
+        for i in candidates:  # Insertion order, as is_duplicate scans
+            self.checks += 1
+            if self._matches(self.entries[i], title, summary, combined):
+                return i
+        return None
+
+    def _matches(self, entry: _Entry, title: str, summary: str, combined: str) -> bool:
+        matcher = entry.title
+        if matcher is None:
+            return False
+        matcher.set_seq1(title)
+        if matcher.real_quick_ratio() < SUMMARY_TITLE_MIN or matcher.quick_ratio() < SUMMARY_TITLE_MIN:
+            return False
+        title_sim = matcher.ratio()
+        if title_sim >= TITLE_THRESHOLD:
+            return True
+        if title_sim >= SUMMARY_TITLE_MIN and _at_least(entry.summary, summary, SUMMARY_THRESHOLD):
+            return True
+        return title_sim >= COMBINED_TITLE_MIN and _at_least(entry.combined, combined, COMBINED_THRESHOLD)
+
+    def add(self, title: str, summary: str, title_keys=None, combined_keys=None):
+        combined = " ".join(filter(None, (title, summary)))
+        i = len(self.entries)
+        self.entries.append(_Entry(title, summary, combined))
+        if self.bucketed:
+            if title and title_keys is None:
+                title_keys, combined_keys = self._keys(title), self._keys(combined)
+            self._bucket(i, title_keys or [], combined_keys or [])
+        elif self._use_buckets():
+            self._fill_buckets()
+
+    def add_if_new(self, title: str, summary: str) -> bool:
+        """Accept the article unless it duplicates one already accepted; True if accepted"""
+        title_keys = combined_keys = None
+        if title and self._use_buckets():  # Keys serve both the lookup and the insert
+            combined = " ".join(filter(None, (title, summary)))
+            title_keys, combined_keys = self._keys(title), self._keys(combined)
+        if self.find(title, summary, title_keys, combined_keys) is not None:
+            return False
+        self.add(title, summary, title_keys, combined_keys)
+        return True
@@ -0,0 +1,73 @@
+"""
+Script-ratio language detection for Nepali (Devanagari) vs English (Latin) text.
+Scrapers label whole sites as 'ne'; these checks decide per article and per paragraph
+whether there is anything to translate.
+"""
+import re
+import string
+
+# Share of letters that must be Devanagari for a span to count as Nepali. Low enough that
+# Nepali text with English names or acronyms is translated, high enough that an English
+# paragraph quoting a Nepali name is left alone.
+NEPALI_MIN_RATIO = 0.2
+
+_DEVANAGARI_RE = re.compile('[ऀ-ॿ]')
+# Paragraph breaks: any run of whitespace containing a newline
+_PARAGRAPH_SEP_RE = re.compile(r'(\s*\n\s*)')
+_ASCII_LETTERS = string.ascii_letters.encode()
+
+def has_devanagari(text: str) -> bool:
+    """Any Devanagari character at all (regex search, stops at the first one)"""
+    return bool(text) and _DEVANAGARI_RE.search(text) is not None
+
+def strip_devanagari(text: str) -> str:
+    return _DEVANAGARI_RE.sub('', text)
+
+def devanagari_ratio(text: str) -> float:
+    """Devanagari characters / (Devanagari + ASCII letters); 0.0 when there are no letters"""
+    if not has_devanagari(text):
+        return 0.0
+    # Counted on the UTF-8 bytes so the work happens in C: every Devanagari character
+    # (U+0900-U+097F) encodes as E0 A4 xx or E0 A5 xx, and E0 only ever starts a character
+    data = text.encode('utf-8')
+    devanagari = data.count(b'\xe0\xa4') + data.count(b'\xe0\xa5')
+    latin = len(data) - len(data.translate(None, _ASCII_LETTERS))
+    return devanagari / (devanagari + latin)
+
+def is_nepali(text: str) -> bool:
+    return devanagari_ratio(text) >= NEPALI_MIN_RATIO
+
+def contains_nepali(text: str) -> bool:
+    """True if any paragraph of `text` is Nepali (mixed articles count)"""
+    if not has_devanagari(text):
+        return False
+    # Line by line, stopping at the first Nepali one
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end < 0:
+            end = len(text)
+        if is_nepali(text[start:end]):
+            return True
+        start = end + 1
+    return False
+
+def language_spans(text: str):
+    """
+    Split `text` at paragraph breaks and label each paragraph; consecutive paragraphs of
+    the same language are merged. Returns [(span, separator, nepali)], where separator is
+    the original whitespace after the span ("" for the last one), so
+    "".join(span + separator) == text.strip().
+    """
+    parts = _PARAGRAPH_SEP_RE.split((text or "").strip())
+    spans = []
+    for i in range(0, len(parts), 2):
+        paragraph = parts[i]
+        separator = parts[i + 1] if i + 1 < len(parts) else ""
+        nepali = is_nepali(paragraph)
+        if spans and spans[-1][2] == nepali:
+            span, previous_sep, _ = spans[-1]
+            spans[-1] = (span + previous_sep + paragraph, separator, nepali)
+        else:
+            spans.append((paragraph, separator, nepali))
+    return spans
@@ -0,0 +1,79 @@
+"""
+MinHash signatures and LSH band keys over character shingles.
+Used to pick near-duplicate candidates before running the exact (slow) similarity checks.
+"""
+import zlib
+import numpy as np
+
+PRIME = (1 << 31) - 1  # Mersenne prime for the permutation hashes
+BAND_MULTIPLIER = np.uint64(1000003)
+
+def normalize_for_shingles(text: str) -> str:
+    """Lowercase and collapse whitespace"""
+    return " ".join((text or "").lower().split())
+
+def shingles(text: str, k: int = 4) -> set:
+    """Character k-shingles of already-normalized text"""
+    if not text:
+        return set()
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+class MinHasher:
+    """
+    Fixed family of `num_perm` hash permutations split into `bands` LSH bands.
+    Seeds are deterministic so signatures stay valid across runs (persistent indexes depend on it).
+    """
+    def __init__(self, num_perm: int = 96, bands: int = 24, k: int = 4, seed: int = 7):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.k = k
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, PRIME, size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, PRIME, size=num_perm).astype(np.uint64)
+        self._band_offsets = (np.arange(bands, dtype=np.int64) << 32)
+
+    def signatures(self, shingle_sets: list):
+        """
+        MinHash signatures for many shingle sets at once, shape (len(shingle_sets), num_perm).
+        Empty sets are not allowed; filter them out first.
+        """
+        lengths = [len(s) for s in shingle_sets]
+        if not lengths:
+            return np.empty((0, self.num_perm), dtype=np.uint64)
+        hashes = np.fromiter(
+            (zlib.crc32(sh.encode("utf-8")) for s in shingle_sets for sh in s),
+            dtype=np.uint64, count=sum(lengths)
+        ) % PRIME
+        # a < 2^31 and hashes < 2^31, so the products fit in uint64
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % PRIME
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        return np.minimum.reduceat(permuted, starts, axis=1).T
+
+    def signature(self, shingle_set: set):
+        """MinHash signature of one shingle set, or None if the set is empty"""
+        if not shingle_set:
+            return None
+        return self.signatures([shingle_set])[0]
+
+    def text_signature(self, text: str):
+        return self.signature(shingles(normalize_for_shingles(text), self.k))
+
+    def band_keys_many(self, signatures):
+        """
+        Integer bucket keys, shape (n, bands). The band number lives in the high bits,
+        a hash of that band's rows in the low 32 bits.
+        """
+        bands = signatures.reshape(len(signatures), self.bands, self.rows)
+        h = np.zeros((len(signatures), self.bands), dtype=np.uint64)
+        for j in range(self.rows):
+            h = h * BAND_MULTIPLIER + bands[:, :, j]  # uint64 arithmetic wraps, which is fine for hashing
+        low = ((h >> np.uint64(32)) ^ h) & np.uint64(0xFFFFFFFF)
+        return low.astype(np.int64) | self._band_offsets
+
+    def band_keys(self, signature) -> list:
+        return self.band_keys_many(signature[None, :])[0].tolist()
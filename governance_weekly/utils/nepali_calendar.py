@@ -0,0 +1,71 @@
+"""
+Bikram Sambat (BS) <-> Gregorian (AD) date conversion.
+
+BS month lengths vary from year to year and follow the published calendar, so they come from
+a table rather than a formula. Day offsets are precomputed at import: bs_to_ad is two tuple
+lookups and an addition, ad_to_bs one index into a per-day table. The table covers the years
+news articles are dated in; add a row as each new year's calendar is published.
+"""
+from datetime import date, timedelta
+
+# Days in Baisakh ... Chaitra for each BS year
+BS_MONTH_DAYS = {
+    2070: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2071: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2072: (31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2073: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2074: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2075: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2076: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2077: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2078: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2079: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2080: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2081: (31, 31, 32, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2082: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2083: (31, 31, 32, 31, 31, 30, 30, 30, 29, 30, 30, 30),
+    2084: (31, 31, 32, 31, 31, 30, 30, 30, 29, 30, 30, 30),
+    2085: (31, 32, 31, 32, 30, 31, 30, 30, 29, 30, 30, 30),
+}
+EPOCH_BS = min(BS_MONTH_DAYS)
+EPOCH_AD = date(2013, 4, 14)  # 2070 Baisakh 1
+
+def _month_offsets():
+    """{year: 12 day offsets of each month's first day from EPOCH_AD}"""
+    offsets, day = {}, 0
+    for year in sorted(BS_MONTH_DAYS):
+        starts = []
+        for length in BS_MONTH_DAYS[year]:
+            starts.append(day)
+            day += length
+        offsets[year] = tuple(starts)
+    return offsets, day
+
+MONTH_OFFSETS, _TOTAL_DAYS = _month_offsets()
+FIRST_AD = EPOCH_AD
+LAST_AD = EPOCH_AD + timedelta(days=_TOTAL_DAYS - 1)
+
+# (year, month, day) in BS for each day from FIRST_AD to LAST_AD
+_BS_DAYS = tuple(
+    (year, month, day)
+    for year in sorted(BS_MONTH_DAYS)
+    for month, length in enumerate(BS_MONTH_DAYS[year], start=1)
+    for day in range(1, length + 1)
+)
+
+def bs_to_ad(year, month, day):
+    """Gregorian date of a BS date. Raises ValueError for invalid or out-of-table dates."""
+    if year not in MONTH_OFFSETS:
+        raise ValueError(f"BS year {year} outside the calendar table ({EPOCH_BS}-{max(BS_MONTH_DAYS)})")
+    if not 1 <= month <= 12 or not 1 <= day <= BS_MONTH_DAYS[year][month - 1]:
+        raise ValueError(f"Invalid BS date {year}-{month}-{day}")
+    return EPOCH_AD + timedelta(days=MONTH_OFFSETS[year][month - 1] + day - 1)
+
+def ad_to_bs(ad_date):
+    """(year, month, day) in BS of a Gregorian date (or datetime). Raises ValueError outside the table."""
+    if not isinstance(ad_date, date):
+        raise TypeError(f"Expected a date, got {type(ad_date).__name__}")
+    offset = ad_date.toordinal() - EPOCH_AD.toordinal()
+    if not 0 <= offset < len(_BS_DAYS):
+        raise ValueError(f"{ad_date} outside the calendar table ({FIRST_AD} to {LAST_AD})")
+    return _BS_DAYS[offset]
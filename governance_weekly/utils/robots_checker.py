@@ -28,5 +28,16 @@ class RobotsChecker:
         
         return cls._parsers[base_url].can_fetch(user_agent, url)
 
+    @classmethod
+    def site_maps(cls, url, user_agent):
+        """Sitemap URLs the site's robots.txt lists"""
+        cls.is_allowed(url, user_agent)  # Reads robots.txt once per host
+        parsed = urlparse(url)
+        rp = cls._parsers.get(f"{parsed.scheme}::{parsed.netloc}")
+        return (rp.site_maps() or []) if rp else []
+
 def is_allowed(url, user_agent):
     return RobotsChecker.is_allowed(url, user_agent)
+
+def site_maps(url, user_agent):
+    return RobotsChecker.site_maps(url, user_agent)
@@ -1,37 +1,194 @@
+"""
+Pool of headless Chrome drivers for the sources whose pages need JavaScript rendering.
+
+Up to SELENIUM_POOL_SIZE browsers are started on demand and reused; fetch threads wait in
+line for an idle one (the request queue). Images, stylesheets, fonts and media are blocked
+and pages are read once the DOM is ready, since only the article markup is needed. A browser
+that errors is quit and replaced. close_driver() quits them all; collect() calls it on the
+way out and it is also registered with atexit so no Chrome process outlives the run.
+"""
+import atexit
+import logging
+import queue
+import threading
 from config import Config
 
-_driver_instance = None
+logger = logging.getLogger(__name__)
+
+BLOCKED_RESOURCES = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp", "*.avif",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+]
+WAIT_POLL_SEC = 1.0  # Waiting fetches re-check that the pool is still open this often
+
+def selenium_available():
+    try:
+        import selenium  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def new_chrome_driver():
+    """A headless Chrome that skips everything but the document and its scripts"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    if Config.SELENIUM_HEADLESS:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument(f"user-agent={Config.USER_AGENT}")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
+    options.page_load_strategy = "eager"  # Return at DOMContentLoaded, not after every subresource
+
+    # You might need to specify the path to chromedriver if it's not in PATH
+    # service = Service("/path/to/chromedriver")
+    # driver = webdriver.Chrome(service=service, options=options)
+    driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(Config.SELENIUM_PAGE_TIMEOUT)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCES})
+    except Exception as e:
+        logger.warning(f"Could not block page resources in Chrome: {e}")
+    return driver
+
+class BrowserPool:
+    def __init__(self, size=None, factory=new_chrome_driver):
+        self.size = max(1, Config.SELENIUM_POOL_SIZE if size is None else size)
+        self.factory = factory
+        self._idle = queue.Queue()
+        self._drivers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._waiting = 0  # Fetches blocked until a browser is handed back
+        self.pages = 0
+        self.restarts = 0
+
+    def _acquire(self):
+        while True:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    start_new = len(self._drivers) < self.size
+                    if start_new:
+                        slot = object()
+                        self._drivers.add(slot)  # Hold the slot while Chrome starts
+                    else:
+                        self._waiting += 1
+                if start_new:
+                    driver = self._start(slot)
+                else:
+                    try:
+                        driver = self._wait()  # For another fetch to hand its browser back
+                    finally:
+                        with self._lock:
+                            self._waiting -= 1
+            if driver is not None:  # None: a browser was dropped, its slot is free, or the pool closed
+                if not self._closed:
+                    return driver
+                self._quit(driver)
+
+    def _wait(self):
+        """Next browser handed back, or None once the pool is closed"""
+        while True:
+            try:
+                return self._idle.get(timeout=WAIT_POLL_SEC)
+            except queue.Empty:
+                if self._closed:  # Safety net; close() also wakes every waiter
+                    return None
 
-def get_driver():
-    """
-    Returns a singleton instance of the Selenium WebDriver.
-    """
-    global _driver_instance
-    if _driver_instance is None:
+    def _start(self, slot):
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-        except ImportError:
-            print("WARNING: Selenium not installed. Dynamic scraping disabled.", flush=True)
-            return None
-
-        options = Options()
-        if Config.SELENIUM_HEADLESS:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument(f"user-agent={Config.USER_AGENT}")
-        
-        # You might need to specify the path to chromedriver if it's not in PATH
-        # service = Service("/path/to/chromedriver")
-        # _driver_instance = webdriver.Chrome(service=service, options=options)
-        
-        _driver_instance = webdriver.Chrome(options=options)
-        
-    return _driver_instance
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._drivers.discard(slot)
+            self._idle.put(None)  # Let a waiting fetch try the free slot
+            raise
+        with self._lock:
+            self._drivers.discard(slot)
+            self._drivers.add(driver)
+        return driver
+
+    def _release(self, driver, broken=False):
+        if broken or self._closed:
+            with self._lock:
+                self._drivers.discard(driver)
+            self._quit(driver)
+            if broken:
+                with self._lock:
+                    self.restarts += 1
+                self._idle.put(None)  # Wake a waiting fetch to start a replacement
+            return
+        self._idle.put(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Browser quit failed: {e}")
+
+    def get_page(self, url):
+        """Rendered HTML of `url`, from the next idle browser"""
+        driver = self._acquire()
+        try:
+            driver.get(url)
+            html = driver.page_source
+        except Exception:
+            self._release(driver, broken=True)
+            raise
+        self._release(driver)
+        with self._lock:
+            self.pages += 1
+        return html
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            drivers = [d for d in self._drivers if hasattr(d, "quit")]  # Not the slots of starting browsers
+            self._drivers.clear()
+            waiting = self._waiting
+        for driver in drivers:
+            self._quit(driver)
+        for _ in range(waiting + self.size):
+            self._idle.put(None)  # Fetches still waiting for a browser wake up and give up
+        if drivers:
+            logger.info(f"Closed {len(drivers)} browsers ({self.pages} pages rendered, {self.restarts} restarts)")
+
+_pool_instance = None
+_pool_lock = threading.Lock()
+_warned = False
+
+def get_browser_pool():
+    """Returns the process-wide BrowserPool, or None when Selenium is not installed"""
+    global _pool_instance, _warned
+    with _pool_lock:
+        if _pool_instance is None:
+            if not selenium_available():
+                if not _warned:
+                    logger.warning("Selenium not installed. Pages that need JavaScript are fetched as plain HTML.")
+                    _warned = True
+                return None
+            _pool_instance = BrowserPool()
+        return _pool_instance
 
 def close_driver():
-    global _driver_instance
-    if _driver_instance:
-        _driver_instance.quit()
-        _driver_instance = None
+    """Quit every pooled browser"""
+    global _pool_instance
+    with _pool_lock:
+        if _pool_instance:
+            _pool_instance.close()
+            _pool_instance = None
+
+atexit.register(close_driver)
@@ -0,0 +1,130 @@
+"""
+Persistent near-duplicate index for article titles.
+MinHash LSH over character 4-shingles picks a handful of candidate titles;
+only those get the exact SequenceMatcher check that collect() has always used.
+"""
+import sqlite3
+import logging
+from difflib import SequenceMatcher
+from itertools import islice
+from typing import Optional, Iterable
+from config import Config
+from utils.minhash import MinHasher, shingles, normalize_for_shingles
+
+logger = logging.getLogger(__name__)
+
+# Same cut-off as the original title check in main.collect
+TITLE_SIMILARITY_THRESHOLD = 0.85
+# Titles hashed per MinHasher.signatures call: its working set is ~100 KB per title, so ~50 MB
+ADD_BATCH = 500
+
+class TitleIndex:
+    def __init__(self, path: str = Config.TITLE_INDEX_PATH, num_perm: int = 96, bands: int = 24):
+        self.hasher = MinHasher(num_perm=num_perm, bands=bands)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS titles (id INTEGER PRIMARY KEY, title TEXT NOT NULL)")
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS title_buckets (
+                bucket INTEGER NOT NULL,
+                title_id INTEGER NOT NULL,
+                PRIMARY KEY (bucket, title_id)
+            ) WITHOUT ROWID
+        ''')
+        self.conn.commit()
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM titles").fetchone()[0]
+
+    def add(self, title: str):
+        self.add_many([title])
+
+    def add_many(self, titles: Iterable[str]):
+        """
+        Index titles (stored lowercased, as they are compared). Titles are hashed ADD_BATCH at
+        a time: MinHasher.signatures holds num_perm values per shingle of the whole batch.
+        """
+        titles = iter(titles)
+        while True:
+            batch = list(islice(titles, ADD_BATCH))
+            if not batch:
+                return
+            self._add_batch(batch)
+
+    def _add_batch(self, titles: list):
+        lowered, shingle_sets = [], []
+        for title in titles:
+            if not title or not title.strip():
+                continue
+            sh = shingles(normalize_for_shingles(title), self.hasher.k)
+            if sh:
+                lowered.append(title.lower())
+                shingle_sets.append(sh)
+        if not lowered:
+            return
+        keys = self.hasher.band_keys_many(self.hasher.signatures(shingle_sets)).tolist()
+        cur = self.conn.cursor()
+        first_id = cur.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM titles").fetchone()[0]
+        ids = range(first_id, first_id + len(lowered))
+        cur.executemany("INSERT INTO titles (id, title) VALUES (?, ?)", zip(ids, lowered))
+        cur.executemany(
+            "INSERT OR IGNORE INTO title_buckets (bucket, title_id) VALUES (?, ?)",
+            ((key, title_id) for title_id, title_keys in zip(ids, keys) for key in title_keys)
+        )
+
+    def candidates(self, title: str) -> list:
+        """Stored titles sharing at least one LSH bucket with `title`"""
+        signature = self.hasher.text_signature(title)
+        if signature is None:
+            return []
+        keys = self.hasher.band_keys(signature)
+        placeholders = ",".join("?" * len(keys))
+        rows = self.conn.execute(f'''
+            SELECT t.title FROM titles t
+            WHERE t.id IN (SELECT title_id FROM title_buckets WHERE bucket IN ({placeholders}))
+        ''', keys).fetchall()
+        return [row[0] for row in rows]
+
+    def find_similar(self, title: str, threshold: float = TITLE_SIMILARITY_THRESHOLD) -> Optional[str]:
+        """
+        Return a stored title at least `threshold` similar to `title`, or None.
+        Uses the same SequenceMatcher(None, new.lower(), existing.lower()).ratio() test as before;
+        real_quick_ratio/quick_ratio are upper bounds, so checking them first never changes the answer.
+        """
+        query = title.lower()
+        matcher = SequenceMatcher(None, query, "")
+        for existing in self.candidates(query):
+            matcher.set_seq2(existing)
+            if (matcher.real_quick_ratio() >= threshold
+                    and matcher.quick_ratio() >= threshold
+                    and matcher.ratio() >= threshold):
+                return existing
+        return None
+
+    def sync(self, db):
+        """
+        Rebuild from the articles table if the index has drifted from it
+        (first run, or rows deleted by a fresh-start script).
+        """
+        db.cursor.execute("SELECT COUNT(*) FROM articles WHERE TRIM(COALESCE(title_original, '')) != ''")
+        expected = db.cursor.fetchone()[0]
+        if expected == self.count():
+            return
+        logger.info(f"Rebuilding title index from {expected} stored articles")
+        self.conn.execute("DELETE FROM title_buckets")
+        self.conn.execute("DELETE FROM titles")
+        db.cursor.execute("SELECT title_original FROM articles")
+        while True:
+            rows = db.cursor.fetchmany(ADD_BATCH)
+            if not rows:
+                break
+            self.add_many(row[0] for row in rows)
+            self.conn.commit()
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        self.conn.close()